@@ -0,0 +1,85 @@
+"""
+Benchmark de tiempo de importación
+=======================================================================
+
+Mide cuánto tarda en importarse cada módulo en un proceso nuevo (como los procesos cortos
+que lanza el planificador de campañas) y verifica qué dependencias pesadas se cargaron.
+
+Uso:
+    python benchmarks/bench_importacion.py [--repeticiones 5] [--salida importacion.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulo -> dependencias pesadas que NO deberían cargarse al importarlo
+MODULOS = {
+    "simulador": ["scipy", "matplotlib"],
+    "campania": ["scipy", "matplotlib"],
+    "registro_politicas": ["scipy", "matplotlib", "numpy"],
+    "franco": ["scipy", "matplotlib"],
+    "produccion_promedio_dias_anteriores_intervalo": ["scipy", "matplotlib"],
+    "main": ["scipy", "matplotlib"],
+    "generar_intervalos_de_confianza": ["scipy", "matplotlib"],
+}
+
+_CODIGO = """
+import sys, time, json
+inicio = time.perf_counter()
+import {modulo}
+fin = time.perf_counter()
+print(json.dumps({{"segundos": fin - inicio, "cargados": sorted({{m.split('.')[0] for m in sys.modules}})}}))
+"""
+
+def medir_importacion(modulo, repeticiones=5):
+    """
+    Importa `modulo` en `repeticiones` procesos nuevos.
+
+    Retorna:
+    dict: Tiempos mínimo y mediano (segundos) y dependencias pesadas cargadas.
+    """
+    tiempos = []
+    cargados = set()
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", _CODIGO.format(modulo=modulo)],
+            cwd=RAIZ, capture_output=True, text=True, check=True
+        )
+        datos = json.loads(salida.stdout.strip().splitlines()[-1])
+        tiempos.append(datos["segundos"])
+        cargados = set(datos["cargados"])
+    return {
+        "modulo": modulo,
+        "segundos_min": min(tiempos),
+        "segundos_mediana": statistics.median(tiempos),
+        "pesados_cargados": sorted(cargados & set(MODULOS.get(modulo, []))),
+    }
+
+def ejecutar(repeticiones=5):
+    return [medir_importacion(modulo, repeticiones) for modulo in MODULOS]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el tiempo de importación de los módulos principales.")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--salida", default=None, help="Archivo JSON con los resultados.")
+    args = parser.parse_args(argv)
+
+    resultados = ejecutar(args.repeticiones)
+    for resultado in resultados:
+        aviso = f" | ¡carga {', '.join(resultado['pesados_cargados'])}!" if resultado["pesados_cargados"] else ""
+        print(f"{resultado['modulo']:<35} min = {resultado['segundos_min'] * 1000:8.1f} ms | "
+              f"mediana = {resultado['segundos_mediana'] * 1000:8.1f} ms{aviso}")
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump(resultados, f, indent=2)
+    # Código de salida distinto de cero si algún módulo carga una dependencia pesada
+    return 1 if any(resultado["pesados_cargados"] for resultado in resultados) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
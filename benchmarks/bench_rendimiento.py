@@ -0,0 +1,270 @@
+"""
+Benchmark de rendimiento
+=======================================================================
+
+Mide el throughput (números/s, réplicas/s) del generador, de las pruebas estadísticas,
+de la generación de demanda y de cada política, tanto en su versión escalar (un cronograma
+por vez) como en la vectorizada (matriz de demanda), para varios tamaños (R, D, P):
+R réplicas, D días y P combinaciones de parámetros.
+
+Los resultados se guardan en JSON y se comparan contra una línea base guardada
+(benchmarks/linea_base.json) para detectar regresiones.
+
+Uso:
+    python benchmarks/bench_rendimiento.py                       # corre y compara con la línea base
+    python benchmarks/bench_rendimiento.py --rapido              # tamaños chicos
+    python benchmarks/bench_rendimiento.py --filtro politica     # solo los casos que contienen 'politica'
+    python benchmarks/bench_rendimiento.py --guardar-linea-base  # actualiza la línea base
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import numpy as np
+
+import simulador
+from nros_aleatorios.generador_congruencial_mixto import generador_nros_aleatorios
+from nros_aleatorios.generador_congruencial_np import generador_nros_aleatorios_np, generador_nros_cuantizados
+from nros_aleatorios.motores import MOTORES, generar_cuantizados
+from pruebas_estadisticas.prueba_de_medias import prueba_de_medias
+from pruebas_estadisticas.prueba_de_varianza import prueba_de_varianza
+from pruebas_estadisticas.prueba_de_uniformidad_chi_cuadrada import prueba_chi_cuadrada
+from pruebas_estadisticas.prueba_de_independencia_poker import prueba_poker
+from pruebas_estadisticas.pruebas_fusionadas import pruebas_fusionadas, PRUEBAS_EXTENDIDAS
+from registro_politicas import POLITICAS, combinaciones_parametros
+import campania
+import politica_optima
+from benchmarks.bench_importacion import MODULOS as MODULOS_IMPORTACION, medir_importacion
+
+ARCHIVO_LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+
+# Parámetros del generador usados en todo el proyecto
+A, C, M = 16807, 0, 2**31 - 1
+
+# Tamaños (R, D, P) para las políticas
+TAMANOS = {
+    "rapido": {"escalar": [(50, 30, 5)], "vectorizado": [(200, 30, 5), (200, 90, 20)]},
+    "normal": {"escalar": [(200, 30, 5), (100, 90, 5)], "vectorizado": [(1000, 30, 5), (1000, 30, 50), (1000, 365, 20)]},
+}
+
+# Versiones escalares: politica -> función(combinacion, cronograma) que devuelve el resultado neto
+def _politicas_escalares():
+    franco = importlib.import_module("franco")
+    ctev4 = importlib.import_module("produccion_ctev4")
+    demanda_anterior = importlib.import_module("produccion_demanda_anterior_mas_cte")
+    demanda_maxima = importlib.import_module("produccion_demanda_máxima")
+    promedio_intervalo = importlib.import_module("produccion_promedio_dias_anteriores_intervalo")
+    return {
+        "franco": lambda c, cr: franco.simular_politica_produccion(c["produccion_semana"], c["produccion_finde"], cr),
+        "ctev4": lambda c, cr: ctev4.simular_politica_produccion(c["produccion_semana"], c["produccion_finde"], cr),
+        "demanda_anterior": lambda c, cr: demanda_anterior.simular_criterio_demanda_anterior(c["p_cte"], cr),
+        "demanda_maxima": lambda c, cr: demanda_maxima.simular_produccion_maxima(cr, c["N"], c["produccion_inicial"]),
+        "promedio_intervalo": lambda c, cr: promedio_intervalo.simular_politica_produccion(c["dias_anteriores"], cr),
+    }
+
+def cronograma_desde_fila(demandas, es_finde):
+    """Convierte una fila de la matriz de demanda al formato de genera_demanda_diaria."""
+    return [
+        {"dia": i + 1, "tipo_dia": "Fin de Semana" if finde else "Entre Semana", "demanda": int(demanda)}
+        for i, (demanda, finde) in enumerate(zip(demandas, es_finde))
+    ]
+
+def medir(funcion, unidades, repeticiones=3, tiempo_minimo=0.2):
+    """
+    Ejecuta `funcion` varias veces y devuelve el mejor tiempo y el throughput (unidades/s).
+    Repite hasta `repeticiones` veces o hasta juntar `tiempo_minimo` segundos.
+    """
+    tiempos = []
+    total = 0.0
+    while len(tiempos) < repeticiones or total < tiempo_minimo:
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+        total += tiempos[-1]
+        if total > 10 * tiempo_minimo:
+            break
+    mejor = min(tiempos)
+    return {"segundos": mejor, "throughput": unidades / mejor if mejor > 0 else float("inf"), "repeticiones": len(tiempos)}
+
+def _casos_generacion(escala):
+    tamanos = [1_000, 10_000] if escala == "rapido" else [1_000, 100_000]
+    casos = []
+    for n in tamanos:
+        casos.append((f"generador/escalar/n={n}", n, "numeros/s",
+                      lambda n=n: generador_nros_aleatorios(12345, A, C, M, n)))
+        casos.append((f"generador/vectorizado/n={n}", n, "numeros/s",
+                      lambda n=n: generador_nros_aleatorios_np(12345, A, C, M, n)))
+        casos.append((f"generador/cuantizado/n={n}", n, "numeros/s",
+                      lambda n=n: generador_nros_cuantizados(12345, A, C, M, n)))
+        for motor in MOTORES:
+            casos.append((f"motor/{motor}/n={n}", n, "numeros/s",
+                          lambda n=n, motor=motor: generar_cuantizados(motor, 12345, n)))
+    for n in tamanos:
+        numeros = generador_nros_aleatorios(12345, A, C, M, n)
+        casos.append((f"prueba_de_medias/n={n}", n, "numeros/s", lambda x=numeros: prueba_de_medias(x, verbose=False)))
+        casos.append((f"prueba_de_varianza/n={n}", n, "numeros/s", lambda x=numeros: prueba_de_varianza(x, verbose=False)))
+        casos.append((f"prueba_chi_cuadrada/n={n}", n, "numeros/s", lambda x=numeros: prueba_chi_cuadrada(x, verbose=False)))
+        casos.append((f"prueba_poker/n={n}", n, "numeros/s", lambda x=numeros: prueba_poker(x, verbose=False)))
+        cuantizados = generador_nros_cuantizados(12345, A, C, M, n)
+        casos.append((f"pruebas_fusionadas/n={n}", n, "numeros/s", lambda x=numeros: pruebas_fusionadas(x)))
+        casos.append((f"pruebas_fusionadas/cuantizado/n={n}", n, "numeros/s", lambda x=cuantizados: pruebas_fusionadas(x)))
+        casos.append((f"prueba_poker/cuantizado/n={n}", n, "numeros/s", lambda x=cuantizados: prueba_poker(x, verbose=False)))
+        casos.append((f"pruebas_extendidas/n={n}", n, "numeros/s",
+                      lambda x=numeros: pruebas_fusionadas(x, pruebas=PRUEBAS_EXTENDIDAS)))
+        casos.append((f"pruebas_extendidas/cuantizado/n={n}", n, "numeros/s",
+                      lambda x=cuantizados: pruebas_fusionadas(x, pruebas=PRUEBAS_EXTENDIDAS)))
+    cantidad = 30
+    streams = 50 if escala == "rapido" else 200
+    rng = random.Random(1)
+    casos.append((f"generar_numeros_aprobados/n={cantidad}", streams, "streams/s",
+                  lambda: [simulador.generar_numeros_aprobados(cantidad, rng=rng) for _ in range(streams)]))
+    casos.append((f"generar_numeros_aprobados/pcg64/n={cantidad}", streams, "streams/s",
+                  lambda: [simulador.generar_numeros_aprobados(cantidad, rng=rng, motor="pcg64") for _ in range(streams)]))
+    casos.append((f"genera_demanda_diaria/escalar/D={cantidad}", streams, "replicas/s",
+                  lambda: [simulador.genera_demanda_diaria(cantidad) for _ in range(streams)]))
+    replicas = 200 if escala == "rapido" else 1000
+    casos.append((f"genera_demanda_diaria/vectorizado/R={replicas},D={cantidad}", replicas, "replicas/s",
+                  lambda: simulador.generar_matriz_demanda(replicas, cantidad, rng=rng)))
+    casos.append((f"genera_demanda_diaria/reutilizar/R={replicas},D={cantidad}", replicas, "replicas/s",
+                  lambda: simulador.generar_matriz_demanda(replicas, cantidad, rng=rng, modo="reutilizar")))
+    return casos
+
+def _casos_politicas(escala):
+    campania.cargar_politicas()
+    escalares = _politicas_escalares()
+    casos = []
+    rng = random.Random(2)
+    for R, D, P in TAMANOS[escala]["escalar"]:
+        demandas, es_finde = simulador.generar_matriz_demanda(R, D, rng=rng)
+        cronogramas = [cronograma_desde_fila(fila, es_finde) for fila in demandas]
+        for nombre, funcion in escalares.items():
+            combinaciones = combinaciones_parametros(POLITICAS[nombre]["parametros"])[:P]
+            def correr(funcion=funcion, combinaciones=combinaciones, cronogramas=cronogramas):
+                for cronograma in cronogramas:
+                    for combi in combinaciones:
+                        funcion(combi, cronograma)
+            casos.append((f"politica/{nombre}/escalar/R={R},D={D},P={len(combinaciones)}",
+                          R * len(combinaciones), "replicas*combinaciones/s", correr))
+    for R, D, P in TAMANOS[escala]["vectorizado"]:
+        demandas, es_finde = simulador.generar_matriz_demanda(R, D, rng=rng)
+        for nombre, datos in POLITICAS.items():
+            combinaciones = combinaciones_parametros(datos["parametros"])[:P]
+            # Si la grilla tiene menos de P combinaciones, este tamaño puede repetir uno ya medido
+            if any(caso[0] == f"politica/{nombre}/vectorizado/R={R},D={D},P={len(combinaciones)}" for caso in casos):
+                continue
+            casos.append((f"politica/{nombre}/vectorizado/R={R},D={D},P={len(combinaciones)}",
+                          R * len(combinaciones), "replicas*combinaciones/s",
+                          lambda f=datos["simular"], d=demandas, e=es_finde, c=combinaciones: f(d, e, c)))
+    # Política óptima exacta: no usa réplicas, se mide en resoluciones por segundo
+    for D in ([30] if escala == "rapido" else [30, 365]):
+        casos.append((f"politica_optima/horizonte_finito/D={D}", 1, "resoluciones/s",
+                      lambda D=D: politica_optima.resolver_horizonte_finito(D)))
+    casos.append(("politica_optima/estacionaria", 1, "resoluciones/s", politica_optima.resolver_estacionaria))
+    return casos
+
+def ejecutar(escala="normal", filtro=None):
+    """
+    Ejecuta todos los casos cuyo nombre contiene `filtro`.
+
+    Retorna:
+    dict: nombre del caso -> {"segundos", "throughput", "unidad", "repeticiones"}
+    """
+    resultados = {}
+    for modulo in MODULOS_IMPORTACION:
+        nombre = f"importacion/{modulo}"
+        if filtro and filtro not in nombre:
+            continue
+        # Cada medición lanza procesos nuevos; se usa el mejor tiempo
+        segundos = medir_importacion(modulo, 1 if escala == "rapido" else 3)["segundos_min"]
+        resultados[nombre] = {"segundos": segundos, "throughput": 1 / segundos, "unidad": "importaciones/s", "repeticiones": 1}
+        print(f"{nombre:<70} {segundos * 1000:>14,.1f} ms", flush=True)
+    for casos in (_casos_generacion, _casos_politicas):
+        for nombre, unidades, unidad, funcion in casos(escala):
+            if filtro and filtro not in nombre:
+                continue
+            # Algunas funciones escalares imprimen progreso
+            with contextlib.redirect_stdout(io.StringIO()):
+                medicion = medir(funcion, unidades)
+            medicion["unidad"] = unidad
+            resultados[nombre] = medicion
+            print(f"{nombre:<70} {medicion['throughput']:>14,.1f} {unidad}", flush=True)
+    return resultados
+
+def comparar_con_linea_base(resultados, linea_base, tolerancia=0.3):
+    """
+    Compara el throughput de cada caso contra la línea base.
+
+    Retorna:
+    list: Casos con regresión (throughput menor que (1 - tolerancia) veces el de la línea base).
+    """
+    regresiones = []
+    print(f"\n{'COMPARACIÓN CON LA LÍNEA BASE':-^100}")
+    for nombre, medicion in resultados.items():
+        base = linea_base.get(nombre)
+        if base is None:
+            print(f"{nombre:<70} (sin línea base)")
+            continue
+        relacion = medicion["throughput"] / base["throughput"]
+        marca = ""
+        if relacion < 1 - tolerancia:
+            marca = "  <-- REGRESIÓN"
+            regresiones.append(nombre)
+        print(f"{nombre:<70} x{relacion:6.2f}{marca}")
+    return regresiones
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de rendimiento del generador, las pruebas y las políticas.")
+    parser.add_argument("--rapido", action="store_true", help="Usa tamaños chicos.")
+    parser.add_argument("--filtro", default=None, help="Solo ejecuta los casos cuyo nombre contiene este texto.")
+    parser.add_argument("--salida", default=None, help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument("--linea-base", default=ARCHIVO_LINEA_BASE, help="Archivo JSON con la línea base.")
+    parser.add_argument("--guardar-linea-base", action="store_true", help="Guarda los resultados como nueva línea base.")
+    parser.add_argument("--tolerancia", type=float, default=0.3, help="Caída relativa de throughput tolerada (por defecto 0.3).")
+    args = parser.parse_args(argv)
+
+    escala = "rapido" if args.rapido else "normal"
+    resultados = ejecutar(escala, args.filtro)
+    informe = {
+        "escala": escala,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "maquina": platform.machine(),
+        "resultados": resultados,
+    }
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump(informe, f, indent=2)
+
+    if args.guardar_linea_base:
+        linea_base = {}
+        if os.path.exists(args.linea_base):
+            with open(args.linea_base) as f:
+                linea_base = json.load(f)
+        linea_base.setdefault("resultados", {}).update(resultados)
+        linea_base.update({clave: valor for clave, valor in informe.items() if clave != "resultados"})
+        with open(args.linea_base, "w") as f:
+            json.dump(linea_base, f, indent=2)
+        print(f"\nLínea base guardada en {args.linea_base}")
+        return 0
+
+    if not os.path.exists(args.linea_base):
+        print("\nNo hay línea base para comparar. Use --guardar-linea-base para crearla.")
+        return 0
+    with open(args.linea_base) as f:
+        linea_base = json.load(f)["resultados"]
+    regresiones = comparar_con_linea_base(resultados, linea_base, args.tolerancia)
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
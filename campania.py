@@ -0,0 +1,321 @@
+"""
+Campañas de simulación de políticas de producción
+=======================================================================
+
+Punto de entrada único para las políticas de producción. Genera una sola matriz de
+demanda (réplicas x días) y evalúa sobre ella todas las políticas elegidas, en paralelo
+por bloques de réplicas.
+
+Ejemplos:
+    python campania.py                                  # todas las políticas registradas
+    python campania.py franco demanda_anterior --replicas 20000 --days 30 --seed 123
+    python campania.py demanda_maxima --grid demanda_maxima.N=2:8:1 --workers 4
+    python campania.py franco --motor pcg64 --replicas 100000
+    python campania.py --guardar-conteos conteos.npz        # para valorizar escenarios con escenarios_costos.py
+    python campania.py --historial ventas.npy               # demanda remuestreada de ventas reales (demanda_historica.py)
+"""
+
+import argparse
+import cProfile
+import csv
+import importlib
+import multiprocessing
+import random
+import sys
+import time
+
+import numpy as np
+
+from simulador import generar_matriz_demanda, intervalos_de_confianza, resultado_neto, MODOS_VALIDACION, CONTEOS, PRECIOS
+from nros_aleatorios.motores import MOTORES, MOTOR_POR_DEFECTO, validar_motor
+from registro_politicas import POLITICAS, combinaciones_parametros
+from escenarios_costos import guardar_conteos
+from demanda_historica import generar_matriz_demanda_historica, cargar_historial, LONGITUD_BLOQUE
+import instrumentacion
+from instrumentacion import cronometro, contar
+
+# Módulos que registran políticas al importarse
+MODULOS_POLITICAS = [
+    "franco",
+    "produccion_ctev4",
+    "produccion_ctev5",
+    "produccion_demanda_anterior_mas_cte",
+    "produccion_demanda_máxima",
+    "produccion_promedio_dias_anteriores_intervalo",
+    "produccion_pronostico",
+]
+
+# Réplicas por bloque de trabajo: acota la memoria de cada proceso
+TAMANO_BLOQUE = 1000
+
+def cargar_politicas():
+    """Importa los módulos de políticas para que se registren."""
+    for modulo in MODULOS_POLITICAS:
+        importlib.import_module(modulo)
+    return POLITICAS
+
+def precios_politica(nombre):
+    """Precios con los que se valoriza una política: los propios del registro o simulador.PRECIOS."""
+    return POLITICAS[nombre]["precios"] or PRECIOS
+
+def interpretar_valores(texto):
+    """
+    Convierte 'a,b,c' en [a, b, c] (admite decimales) e 'inicio:fin:paso' en range(inicio, fin, paso).
+    """
+    if ":" in texto:
+        return list(range(*(int(parte) for parte in texto.split(":"))))
+    return [float(valor) if "." in valor else int(valor) for valor in texto.split(",")]
+
+def interpretar_grillas(especificaciones):
+    """
+    Interpreta las opciones --grid con el formato 'politica.parametro=valores'.
+
+    Retorna:
+    dict: politica -> {parametro: lista de valores}
+    """
+    grillas = {}
+    for especificacion in especificaciones or []:
+        try:
+            clave, valores = especificacion.split("=", 1)
+            politica, parametro = clave.split(".", 1)
+            grillas.setdefault(politica, {})[parametro] = interpretar_valores(valores)
+        except ValueError:
+            raise ValueError(f"Grilla inválida '{especificacion}'. Formato esperado: politica.parametro=1,2,3 o inicio:fin:paso")
+    return grillas
+
+def combinaciones_de_politicas(politicas, grillas=None):
+    """
+    Combinaciones a evaluar de cada política: su espacio registrado con los valores de `grillas` reemplazados.
+
+    Retorna:
+    dict: politica -> list[dict]
+    """
+    grillas = grillas or {}
+    combinaciones_por_politica = {}
+    for nombre in politicas:
+        espacio = dict(POLITICAS[nombre]["parametros"])
+        for parametro, valores in grillas.get(nombre, {}).items():
+            if parametro not in espacio:
+                raise ValueError(f"La política '{nombre}' no tiene el parámetro '{parametro}'")
+            espacio[parametro] = valores
+        combinaciones_por_politica[nombre] = combinaciones_parametros(espacio)
+    return combinaciones_por_politica
+
+def _simular_bloque(argumentos):
+    """
+    Trabajo de un proceso: genera la demanda de un bloque de réplicas y evalúa todas las políticas.
+    Devuelve los conteos de unidades (vendidas, desperdiciadas, perdidas) de cada política; el resultado
+    neto se calcula al final, con los precios de cada política.
+    """
+    cant_replicas, cant_dias, semilla, combinaciones_por_politica, instrumentar, opciones_demanda = argumentos
+    cargar_politicas()
+    # Cada bloque devuelve solo sus métricas, así se pueden sumar las de todos los procesos
+    instrumentacion.reiniciar()
+    instrumentacion.activar(instrumentar)
+    rng = random.Random(semilla)
+    if "historial" in opciones_demanda:
+        demandas, es_finde = generar_matriz_demanda_historica(cant_replicas, cant_dias, rng=rng, **opciones_demanda)
+    else:
+        demandas, es_finde = generar_matriz_demanda(cant_replicas, cant_dias, rng=rng, **opciones_demanda)
+    resultados = {}
+    for nombre, combinaciones in combinaciones_por_politica.items():
+        with cronometro(f"politica/{nombre}"):
+            resultados[nombre] = POLITICAS[nombre]["simular"](demandas, es_finde, combinaciones)
+        contar(f"politica/{nombre}/replicas", cant_replicas)
+        contar(f"politica/{nombre}/replicas_x_combinaciones", cant_replicas * len(combinaciones))
+    return resultados, instrumentacion.exportar()
+
+def ejecutar_campania(politicas, cant_replicas, cant_dias, workers=None, semilla=None, grillas=None, instrumentar=False,
+                      validacion="por_replica", ajuste_alpha=None, motor=MOTOR_POR_DEFECTO, historial=None,
+                      longitud_bloque=LONGITUD_BLOQUE):
+    """
+    Evalúa las políticas sobre la misma matriz de demanda.
+
+    Parámetros:
+    politicas (list): Nombres de las políticas registradas a evaluar.
+    cant_replicas (int): Cantidad de réplicas.
+    cant_dias (int): Días por réplica.
+    workers (int): Procesos a usar. Por defecto, todos los núcleos.
+    semilla (int): Semilla para que la campaña sea reproducible. None usa una al azar.
+    grillas (dict): politica -> {parametro: valores} que reemplazan al espacio registrado.
+    instrumentar (bool): Si es True, recolecta tiempos y contadores por etapa en todos los procesos.
+    validacion (str): "por_replica" prueba un conjunto por réplica; "reutilizar" prueba un stream por bloque.
+    ajuste_alpha (str): None o "sidak" para repartir alpha entre las cuatro pruebas.
+    motor (str): Generador del stream uniforme (ver nros_aleatorios/motores.py).
+    historial (str): Historial .npy de demanda_historica.py. Si se pasa, la demanda se remuestrea de las
+                     ventas reales con bootstrap por bloques y validacion, ajuste_alpha y motor no se usan.
+    longitud_bloque (int): Días de cada bloque del bootstrap (solo con historial).
+
+    Retorna:
+    tuple: (resultados, metricas)
+        resultados (dict): politica -> {"combinaciones": list[dict], "conteos": tuple de np.ndarray (R, P),
+                                        "precios": dict, "beneficios": np.ndarray (R, P)}
+            conteos son las unidades vendidas, desperdiciadas y perdidas (ver simulador.CONTEOS) y
+            beneficios el resultado neto con los precios de la política.
+        metricas (dict): tiempos y contadores sumados de todos los bloques (vacíos si instrumentar es False).
+    """
+    cargar_politicas()
+    validar_motor(motor)
+    combinaciones_por_politica = combinaciones_de_politicas(politicas, grillas)
+
+    if semilla is None:
+        semilla = random.randrange(2**32)
+    # Cada bloque tiene su propia semilla derivada: el resultado no depende de la cantidad de procesos
+    if historial is not None:
+        opciones_demanda = {"historial": historial, "longitud_bloque": longitud_bloque}
+    else:
+        opciones_demanda = {"modo": validacion, "ajuste_alpha": ajuste_alpha, "motor": motor}
+    trabajos = []
+    for indice, inicio in enumerate(range(0, cant_replicas, TAMANO_BLOQUE)):
+        replicas_bloque = min(TAMANO_BLOQUE, cant_replicas - inicio)
+        trabajos.append((replicas_bloque, cant_dias, f"{semilla}:{indice}", combinaciones_por_politica, instrumentar, opciones_demanda))
+
+    workers = workers or multiprocessing.cpu_count()
+    if workers == 1 or len(trabajos) == 1:
+        resultados_bloques = [_simular_bloque(trabajo) for trabajo in trabajos]
+    else:
+        with multiprocessing.Pool(processes=min(workers, len(trabajos))) as pool:
+            resultados_bloques = pool.map(_simular_bloque, trabajos)
+
+    resultados = {}
+    for nombre, combinaciones in combinaciones_por_politica.items():
+        conteos = tuple(np.concatenate([bloque[nombre][i] for bloque, _ in resultados_bloques], axis=0)
+                        for i in range(len(CONTEOS)))
+        precios = precios_politica(nombre)
+        resultados[nombre] = {
+            "combinaciones": combinaciones,
+            "conteos": conteos,
+            "precios": precios,
+            "beneficios": resultado_neto(*conteos, **precios)
+        }
+    metricas = instrumentacion.fusionar([metricas_bloque for _, metricas_bloque in resultados_bloques])
+    return resultados, metricas
+
+def mostrar_resultados(resultados, alpha=0.05, top=5):
+    """Muestra las mejores combinaciones de cada política con su intervalo de confianza."""
+    for nombre, datos in resultados.items():
+        intervalos = intervalos_de_confianza(datos["beneficios"], alpha)
+        orden = np.argsort(-intervalos["beneficio_prom"])
+        print(f"\n--- {nombre}: Top {top} de {len(datos['combinaciones'])} combinaciones ---\n")
+        for i, j in enumerate(orden[:top], start=1):
+            parametros = ", ".join(f"{clave} = {valor}" for clave, valor in datos["combinaciones"][j].items())
+            longitud = intervalos["upper"][j] - intervalos["lower"][j]
+            print(f"{i}. {parametros} | Beneficio Prom: {intervalos['beneficio_prom'][j]:>9.2f} | "
+                  f"IC {(1 - alpha) * 100:.0f}% = [{intervalos['lower'][j]:.2f}, {intervalos['upper'][j]:.2f}] (longitud = {longitud:.2f})")
+
+def guardar_resultados_csv(resultados, nombre_archivo, alpha=0.05):
+    """Guarda una fila por política y combinación con su intervalo de confianza."""
+    with open(nombre_archivo, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['politica', 'parametros', 'beneficio_prom', 'stddev', 'delta', 'lower', 'upper'])
+        for nombre, datos in resultados.items():
+            intervalos = intervalos_de_confianza(datos["beneficios"], alpha)
+            for j, combi in enumerate(datos["combinaciones"]):
+                parametros = ";".join(f"{clave}={valor}" for clave, valor in combi.items())
+                writer.writerow([nombre, parametros] + [intervalos[columna][j] for columna in
+                                 ('beneficio_prom', 'stddev', 'delta', 'lower', 'upper')])
+
+def crear_parser():
+    politicas = cargar_politicas()
+    parser = argparse.ArgumentParser(
+        description="Evalúa políticas de producción sobre una misma matriz de demanda.",
+        epilog="Políticas disponibles: " + "; ".join(f"{nombre} ({datos['descripcion']})" for nombre, datos in politicas.items())
+    )
+    parser.add_argument("politicas", nargs="*", metavar="politica",
+                        help="Políticas a evaluar (por defecto, todas).")
+    parser.add_argument("--replicas", type=int, default=10000, help="Cantidad de réplicas (por defecto 10000).")
+    parser.add_argument("--days", type=int, default=30, help="Días por réplica (por defecto 30).")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos a usar (por defecto, todos los núcleos).")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de la campaña.")
+    parser.add_argument("--grid", action="append", metavar="POLITICA.PARAMETRO=VALORES",
+                        help="Reemplaza los valores de un parámetro, por ejemplo ctev5.p=6:78:6 o franco.produccion_finde=54,60.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia de los intervalos.")
+    parser.add_argument("--salida", default=None, help="Archivo CSV donde guardar todos los resultados.")
+    parser.add_argument("--validacion", choices=MODOS_VALIDACION, default="por_replica",
+                        help="por_replica: prueba un conjunto de números por réplica; reutilizar: prueba un stream "
+                             "por bloque de réplicas y lo corta en ventanas (por defecto por_replica).")
+    parser.add_argument("--ajuste-alpha", choices=["sidak"], default=None,
+                        help="Reparte alpha entre las cuatro pruebas para que la tasa de rechazo total sea alpha.")
+    parser.add_argument("--motor", choices=list(MOTORES), default=MOTOR_POR_DEFECTO,
+                        help="Generador de los números aleatorios: " + "; ".join(
+                            f"{nombre} ({datos['descripcion']})" for nombre, datos in MOTORES.items())
+                        + f" (por defecto {MOTOR_POR_DEFECTO}).")
+    parser.add_argument("--historial", default=None, metavar="ARCHIVO.npy",
+                        help="Remuestrea la demanda de un historial de ventas reales (ver demanda_historica.py) "
+                             "en lugar de generarla con números aleatorios.")
+    parser.add_argument("--longitud-bloque", type=int, default=LONGITUD_BLOQUE,
+                        help=f"Días de cada bloque del bootstrap del historial (por defecto {LONGITUD_BLOQUE}).")
+    parser.add_argument("--guardar-conteos", default=None, metavar="ARCHIVO.npz",
+                        help="Guarda las unidades vendidas, desperdiciadas y perdidas de cada réplica y combinación, "
+                             "para valorizar otros escenarios de costos con escenarios_costos.py sin volver a simular.")
+    parser.add_argument("--metricas", default=None, metavar="ARCHIVO.json",
+                        help="Recolecta tiempos y contadores por etapa y los guarda en este archivo JSON.")
+    parser.add_argument("--profile", default=None, metavar="ARCHIVO.prof",
+                        help="Ejecuta la campaña bajo cProfile y guarda las estadísticas (usar con --workers 1 para perfilar todo).")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        grillas = interpretar_grillas(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+    desconocidas = [nombre for nombre in list(args.politicas) + list(grillas) if nombre not in POLITICAS]
+    if desconocidas:
+        parser.error(f"Políticas desconocidas: {', '.join(desconocidas)}. Disponibles: {', '.join(POLITICAS)}")
+    if args.longitud_bloque < 1:
+        parser.error(f"--longitud-bloque debe ser positiva, no {args.longitud_bloque}")
+    if args.historial:
+        # Se abre una vez acá para informar un historial faltante o dañado antes de repartir los bloques
+        try:
+            cargar_historial(args.historial)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"No se pudo abrir el historial {args.historial}: {e}")
+    politicas = args.politicas or list(POLITICAS)
+
+    inicio_total = time.time()
+    print(f"Simulando {args.replicas} réplicas de {args.days} días para: {', '.join(politicas)}")
+    if args.historial:
+        print(f"Demanda remuestreada de {args.historial} (bloques de {args.longitud_bloque} días)")
+    elif args.motor != MOTOR_POR_DEFECTO:
+        print(f"Motor de números aleatorios: {args.motor}")
+    perfil = None
+    if args.profile:
+        if args.workers != 1:
+            print("Aviso: cProfile solo mide el proceso principal; use --workers 1 para perfilar la simulación completa.")
+        perfil = cProfile.Profile()
+        perfil.enable()
+    try:
+        resultados, metricas = ejecutar_campania(politicas, args.replicas, args.days, args.workers, args.seed, grillas,
+                                                 instrumentar=args.metricas is not None,
+                                                 validacion=args.validacion, ajuste_alpha=args.ajuste_alpha,
+                                                 motor=args.motor, historial=args.historial,
+                                                 longitud_bloque=args.longitud_bloque)
+    except ValueError as e:
+        # Parámetros de la grilla que la política no acepta (por ejemplo demanda_maxima.N=0)
+        parser.error(str(e))
+    if perfil is not None:
+        perfil.disable()
+        perfil.dump_stats(args.profile)
+        print(f"Perfil guardado en {args.profile} (ver con: python -m pstats {args.profile})")
+    mostrar_resultados(resultados, args.alpha)
+    if args.salida:
+        guardar_resultados_csv(resultados, args.salida, args.alpha)
+        print(f"\nResultados guardados en {args.salida}")
+    if args.guardar_conteos:
+        guardar_conteos(resultados, args.guardar_conteos)
+        print(f"Conteos de unidades guardados en {args.guardar_conteos}")
+    duracion = time.time() - inicio_total
+    if args.metricas:
+        instrumentacion.guardar_json(metricas, args.metricas, politicas=politicas, replicas=args.replicas,
+                                     dias=args.days, motor=args.motor, segundos_totales=duracion)
+        print(f"Métricas guardadas en {args.metricas}")
+    print(f"\nCampaña terminada en {duracion / 60:.2f} minutos.")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nProceso interrumpido por el usuario.")
+        sys.exit(0)
@@ -0,0 +1,271 @@
+"""
+Corrida larga en estado estacionario
+=======================================================================
+
+campania.py estima el beneficio de 30 días con miles de réplicas independientes, y cada una paga su
+propio transitorio (la producción inicial, los historiales vacíos). Para preguntas de largo plazo este
+módulo simula una sola corrida de muchos días consecutivos (10^6 o más) y estima el beneficio diario
+en estado estacionario:
+
+  1. La demanda se genera por bloques de días consecutivos, cada uno con su propio conjunto de
+     números aprobados (como una réplica de campania.py), y los bloques se encadenan.
+  2. Cada política se evalúa sobre toda la corrida con los conteos por semana (tamano_lote = 7 en
+     recurrencia_sobrantes): nunca se guarda la serie día por día. Las combinaciones se evalúan por
+     grupos para acotar la memoria.
+  3. El transitorio se descarta con MSER-5: se elige cuántas semanas iniciales descartar minimizando
+     el error estándar estimado de la media de lo que queda (en medias de 5 semanas).
+  4. El intervalo de confianza sale del método de medias por lotes no superpuestos: lo que queda se
+     parte en lotes consecutivos de igual tamaño, cuyas medias son casi independientes.
+
+Con --carriles K la corrida se parte en K corridas independientes más cortas que avanzan a la vez
+(como los carriles de nros_aleatorios/motores.py): el bucle de días es K veces más corto. El transitorio
+se elige sobre el promedio de los carriles y los lotes de todos los carriles forman el intervalo.
+Con K = 1 (por defecto) es una única corrida.
+
+Ejemplos:
+    python corrida_larga.py demanda_maxima --days 1000000
+    python corrida_larga.py --days 2000000 --carriles 20 --seed 1 --salida estacionario.csv
+"""
+
+import argparse
+import csv
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from simulador import generar_matriz_demanda, mascara_fin_de_semana, resultado_neto, MODOS_VALIDACION
+from nros_aleatorios.motores import MOTORES, MOTOR_POR_DEFECTO, validar_motor
+from registro_politicas import POLITICAS
+from campania import cargar_politicas, combinaciones_de_politicas, interpretar_grillas, precios_politica
+from pruebas_estadisticas.valores_criticos import t_ppf
+
+DIAS_SEMANA = 7
+
+# Días de cada bloque de demanda con su propio conjunto de números aprobados (semanas completas)
+DIAS_BLOQUE = 7000
+
+# Memoria aproximada que puede usar cada grupo de combinaciones al evaluar una política
+MEMORIA_POR_GRUPO = 512 * 2**20
+
+# Tamaño de las medias de MSER-5
+TAMANO_MSER = 5
+
+def generar_demanda_larga(cant_dias, carriles=1, rng=None, dias_bloque=DIAS_BLOQUE, **opciones_demanda):
+    """
+    Demanda de una corrida larga: (carriles, D) con D = cant_dias / carriles redondeado a semanas completas.
+
+    Cada carril encadena bloques de dias_bloque días; cada bloque es una fila de generar_matriz_demanda
+    (su propio conjunto de números aprobados). Como los bloques son semanas completas y empiezan el mismo
+    día de la semana, el calendario de la corrida es continuo.
+
+    Args:
+        cant_dias (int): Días totales de la corrida (entre todos los carriles).
+        carriles (int): Corridas independientes que avanzan a la vez.
+        rng (random.Random): Generador para las semillas.
+        dias_bloque (int): Días de cada bloque de números aprobados (múltiplo de 7).
+        **opciones_demanda: modo, ajuste_alpha y motor (ver generar_matriz_demanda).
+
+    Returns:
+        tuple: (demandas (np.ndarray int64 (carriles, D)), es_finde (np.ndarray bool (D,)))
+    """
+    if dias_bloque % DIAS_SEMANA:
+        raise ValueError(f"dias_bloque debe ser múltiplo de {DIAS_SEMANA}, no {dias_bloque}")
+    dias_carril = -(-cant_dias // (carriles * DIAS_SEMANA)) * DIAS_SEMANA
+    bloques = -(-dias_carril // dias_bloque)
+    demandas, _ = generar_matriz_demanda(carriles * bloques, dias_bloque, rng=rng, **opciones_demanda)
+    demandas = demandas.reshape(carriles, bloques * dias_bloque)[:, :dias_carril]
+    return demandas, mascara_fin_de_semana(dias_carril)
+
+def beneficios_semanales(nombre, demandas, es_finde, combinaciones, memoria=MEMORIA_POR_GRUPO):
+    """
+    Resultado neto de cada semana de la corrida para cada combinación de una política: (carriles, P, semanas).
+    Las combinaciones se evalúan por grupos de modo que cada grupo use alrededor de `memoria` bytes.
+    """
+    # Producción, su copia día por día y los temporarios de cada política: unos 4 arrays como la demanda
+    por_combinacion = demandas.size * demandas.itemsize * 4
+    tamano_grupo = max(1, memoria // por_combinacion)
+    simular = POLITICAS[nombre]["simular"]
+    grupos = []
+    for inicio in range(0, len(combinaciones), tamano_grupo):
+        conteos = simular(demandas, es_finde, combinaciones[inicio:inicio + tamano_grupo], tamano_lote=DIAS_SEMANA)
+        grupos.append(resultado_neto(*conteos, **precios_politica(nombre)))
+    return np.concatenate(grupos, axis=1)
+
+def mser_5(serie):
+    """
+    Truncamiento del transitorio con MSER-5 para cada columna de `serie` (n, P).
+
+    Con Z las medias de 5 observaciones consecutivas (k medias), para cada d se calcula
+    MSER(d) = sum_{j >= d} (Z_j - media(Z[d:]))^2 / (k - d)^2, proporcional al error estándar estimado
+    de la media si se descartan las primeras d medias, y se elige el d que lo minimiza con d <= k / 2.
+
+    Returns:
+        np.ndarray: Observaciones a descartar al principio de cada columna (P,), múltiplos de 5.
+    """
+    k = serie.shape[0] // TAMANO_MSER
+    if k < 2:
+        return np.zeros(serie.shape[1:], dtype=np.int64)
+    z = serie[:k * TAMANO_MSER].reshape((k, TAMANO_MSER) + serie.shape[1:]).mean(axis=1)
+    # Sumas desde cada d hasta el final
+    suma = np.cumsum(z[::-1], axis=0)[::-1]
+    suma_cuadrados = np.cumsum(z[::-1] ** 2, axis=0)[::-1]
+    restantes = (k - np.arange(k)).reshape((k,) + (1,) * (z.ndim - 1))
+    mser = (suma_cuadrados - suma ** 2 / restantes) / restantes ** 2
+    return mser[:k // 2 + 1].argmin(axis=0) * TAMANO_MSER
+
+def medias_por_lotes(semanales, descartadas, cant_lotes=30, alpha=0.05):
+    """
+    Intervalo de confianza del beneficio diario por medias de lotes no superpuestos.
+
+    Args:
+        semanales (np.ndarray): Resultado neto por semana (carriles, P, semanas).
+        descartadas (np.ndarray): Semanas del transitorio a descartar de cada combinación (P,).
+        cant_lotes (int): Lotes por carril.
+        alpha (float): Nivel de significancia.
+
+    Returns:
+        dict: Arrays (P,) con 'beneficio_prom', 'stddev', 'delta', 'lower' y 'upper' (por día),
+              'dias_descartados', 'dias_por_lote' y 'autocorrelacion' (lag 1 entre lotes consecutivos,
+              debería ser cercana a 0 si los lotes son lo bastante largos).
+    """
+    carriles, cant_combinaciones, cant_semanas = semanales.shape
+    columnas = ("beneficio_prom", "stddev", "delta", "lower", "upper", "dias_descartados", "dias_por_lote",
+                "autocorrelacion")
+    resultado = {columna: np.zeros(cant_combinaciones) for columna in columnas}
+    t_critical = t_ppf(1 - alpha / 2, carriles * cant_lotes - 1)
+    for j in range(cant_combinaciones):
+        semanas_por_lote = (cant_semanas - descartadas[j]) // cant_lotes
+        if semanas_por_lote == 0:
+            raise ValueError(f"La corrida es muy corta para {cant_lotes} lotes: quedan "
+                             f"{cant_semanas - descartadas[j]} semanas después del transitorio")
+        utiles = semanales[:, j, descartadas[j]:descartadas[j] + semanas_por_lote * cant_lotes]
+        # Medias de cada lote, en beneficio por día
+        lotes = utiles.reshape(carriles, cant_lotes, semanas_por_lote).mean(axis=-1) / DIAS_SEMANA
+        beneficio_prom = lotes.mean()
+        stddev = lotes.std(ddof=1)
+        delta = t_critical * stddev / math.sqrt(lotes.size)
+        centrados = lotes - beneficio_prom
+        varianza = np.sum(centrados ** 2)
+        resultado["beneficio_prom"][j] = beneficio_prom
+        resultado["stddev"][j] = stddev
+        resultado["delta"][j] = delta
+        resultado["lower"][j] = beneficio_prom - delta
+        resultado["upper"][j] = beneficio_prom + delta
+        resultado["dias_descartados"][j] = descartadas[j] * DIAS_SEMANA
+        resultado["dias_por_lote"][j] = semanas_por_lote * DIAS_SEMANA
+        resultado["autocorrelacion"][j] = np.sum(centrados[:, 1:] * centrados[:, :-1]) / varianza if varianza else 0.0
+    return resultado
+
+def ejecutar_corrida_larga(politicas, cant_dias, carriles=1, semilla=None, grillas=None, cant_lotes=30, alpha=0.05,
+                           validacion="por_replica", ajuste_alpha=None, motor=MOTOR_POR_DEFECTO):
+    """
+    Evalúa las políticas en estado estacionario sobre la misma corrida larga.
+
+    Parámetros:
+    politicas (list): Nombres de las políticas registradas a evaluar.
+    cant_dias (int): Días totales de la corrida.
+    carriles (int): Corridas independientes en las que se parte (1 = una sola corrida).
+    semilla (int): Semilla de la corrida. None usa una al azar.
+    grillas (dict): politica -> {parametro: valores} que reemplazan al espacio registrado.
+    cant_lotes (int): Lotes por carril para el intervalo de medias por lotes.
+    alpha (float): Nivel de significancia.
+    validacion, ajuste_alpha, motor: Opciones de la demanda (ver generar_matriz_demanda).
+
+    Retorna:
+    dict: politica -> {"combinaciones": list[dict], más las columnas de medias_por_lotes}
+    """
+    cargar_politicas()
+    validar_motor(motor)
+    combinaciones_por_politica = combinaciones_de_politicas(politicas, grillas)
+    if semilla is None:
+        semilla = random.randrange(2**32)
+    demandas, es_finde = generar_demanda_larga(cant_dias, carriles, random.Random(semilla), modo=validacion,
+                                               ajuste_alpha=ajuste_alpha, motor=motor)
+    resultados = {}
+    for nombre, combinaciones in combinaciones_por_politica.items():
+        semanales = beneficios_semanales(nombre, demandas, es_finde, combinaciones)
+        # El transitorio se elige sobre el promedio de los carriles
+        descartadas = mser_5(semanales.mean(axis=0).T)
+        resultados[nombre] = {"combinaciones": combinaciones,
+                              **medias_por_lotes(semanales, descartadas, cant_lotes, alpha)}
+    return resultados
+
+def mostrar_resultados(resultados, alpha=0.05, top=5):
+    """Muestra las mejores combinaciones de cada política con su intervalo de confianza del beneficio diario."""
+    for nombre, datos in resultados.items():
+        orden = np.argsort(-datos["beneficio_prom"])
+        print(f"\n--- {nombre}: Top {top} de {len(datos['combinaciones'])} combinaciones ---\n")
+        for i, j in enumerate(orden[:top], start=1):
+            parametros = ", ".join(f"{clave} = {valor}" for clave, valor in datos["combinaciones"][j].items())
+            print(f"{i}. {parametros} | Beneficio diario: {datos['beneficio_prom'][j]:>8.2f} | "
+                  f"IC {(1 - alpha) * 100:.0f}% = [{datos['lower'][j]:.2f}, {datos['upper'][j]:.2f}] | "
+                  f"transitorio {datos['dias_descartados'][j]:.0f} días | autocorrelación {datos['autocorrelacion'][j]:+.2f}")
+
+def guardar_resultados_csv(resultados, nombre_archivo):
+    """Guarda una fila por política y combinación con su intervalo y los datos del truncamiento."""
+    columnas = ('beneficio_prom', 'stddev', 'delta', 'lower', 'upper', 'dias_descartados', 'dias_por_lote',
+                'autocorrelacion')
+    with open(nombre_archivo, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['politica', 'parametros'] + list(columnas))
+        for nombre, datos in resultados.items():
+            for j, combi in enumerate(datos["combinaciones"]):
+                parametros = ";".join(f"{clave}={valor}" for clave, valor in combi.items())
+                writer.writerow([nombre, parametros] + [datos[columna][j] for columna in columnas])
+
+def crear_parser():
+    politicas = cargar_politicas()
+    parser = argparse.ArgumentParser(
+        description="Estima el beneficio diario en estado estacionario con una corrida larga y medias por lotes.",
+        epilog="Políticas disponibles: " + "; ".join(f"{nombre} ({datos['descripcion']})" for nombre, datos in politicas.items())
+    )
+    parser.add_argument("politicas", nargs="*", metavar="politica",
+                        help="Políticas a evaluar (por defecto, todas).")
+    parser.add_argument("--days", type=int, default=1_000_000, help="Días de la corrida (por defecto 1000000).")
+    parser.add_argument("--carriles", type=int, default=1,
+                        help="Corridas independientes en las que se parte la corrida (por defecto 1).")
+    parser.add_argument("--lotes", type=int, default=30, help="Lotes por carril (por defecto 30).")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de la corrida.")
+    parser.add_argument("--grid", action="append", metavar="POLITICA.PARAMETRO=VALORES",
+                        help="Reemplaza los valores de un parámetro, como en campania.py.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia de los intervalos.")
+    parser.add_argument("--salida", default=None, help="Archivo CSV donde guardar todos los resultados.")
+    parser.add_argument("--validacion", choices=MODOS_VALIDACION, default="por_replica",
+                        help="Validación de los números de cada bloque de demanda (ver campania.py).")
+    parser.add_argument("--ajuste-alpha", choices=["sidak"], default=None,
+                        help="Reparte alpha entre las cuatro pruebas para que la tasa de rechazo total sea alpha.")
+    parser.add_argument("--motor", choices=list(MOTORES), default=MOTOR_POR_DEFECTO,
+                        help=f"Generador de los números aleatorios (por defecto {MOTOR_POR_DEFECTO}).")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        grillas = interpretar_grillas(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+    desconocidas = [nombre for nombre in list(args.politicas) + list(grillas) if nombre not in POLITICAS]
+    if desconocidas:
+        parser.error(f"Políticas desconocidas: {', '.join(desconocidas)}. Disponibles: {', '.join(POLITICAS)}")
+    politicas = args.politicas or list(POLITICAS)
+
+    inicio = time.time()
+    print(f"Corrida larga de {args.days} días ({args.carriles} carril(es)) para: {', '.join(politicas)}")
+    resultados = ejecutar_corrida_larga(politicas, args.days, args.carriles, args.seed, grillas, args.lotes,
+                                        args.alpha, args.validacion, args.ajuste_alpha, args.motor)
+    mostrar_resultados(resultados, args.alpha)
+    if args.salida:
+        guardar_resultados_csv(resultados, args.salida)
+        print(f"\nResultados guardados en {args.salida}")
+    print(f"\nCorrida terminada en {(time.time() - inicio) / 60:.2f} minutos.")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nProceso interrumpido por el usuario.")
+        sys.exit(0)
@@ -0,0 +1,230 @@
+"""
+Demanda histórica con bootstrap por bloques
+=======================================================================
+
+La demanda de simulador.py sale de una uniforme (floor(r * 77) + 4 de lunes a jueves, floor(r * 90) + 18
+de viernes a domingo). Este módulo arma la matriz de demanda (réplicas x días) a partir de ventas reales:
+
+  1. convertir_historial lee una sola vez el CSV de ventas diarias (columnas fecha y demanda, en cualquier
+     orden de filas), lo ordena por fecha, lo separa por tipo de día (L-J y V-S-D, como
+     simulador.mascara_fin_de_semana) y lo guarda como un .npy con las ventas de entresemana seguidas de
+     las de fin de semana, más un .json con la cantidad de días de cada tipo.
+  2. cargar_historial abre el .npy como memmap: las ventas se leen del disco a medida que se usan.
+  3. generar_matriz_demanda_historica llena los días de cada tipo de la matriz con un bootstrap por bloques
+     circular sobre la serie de ese tipo: bloques de `longitud_bloque` días consecutivos (del mismo tipo)
+     que empiezan en posiciones al azar, así se conserva la autocorrelación de corto plazo de las ventas.
+     Devuelve (demandas, es_finde) como generar_matriz_demanda, así que las políticas no cambian.
+
+Los días faltantes del historial se saltean: los días de un bloque son consecutivos en la serie, no
+necesariamente en el calendario.
+
+Ejemplos:
+    python demanda_historica.py convertir ventas.csv ventas.npy
+    python demanda_historica.py resumen ventas.npy
+    python campania.py --historial ventas.npy --longitud-bloque 8 --replicas 20000 --seed 1
+"""
+
+import argparse
+import csv
+import json
+import os
+
+import numpy as np
+
+from simulador import mascara_fin_de_semana, FECHA_INICIO
+from instrumentacion import cronometro
+
+# Filas del CSV que se convierten por vez
+FILAS_POR_BLOQUE = 10**6
+
+# Días consecutivos (del mismo tipo) de cada bloque del bootstrap
+LONGITUD_BLOQUE = 8
+
+def _dia_de_la_semana(fechas):
+    """Día de la semana de un array datetime64[D] (lunes = 0), como date.weekday()."""
+    # El 1970-01-01 fue jueves
+    return (fechas.astype(np.int64) + 3) % 7
+
+def ruta_metadatos(archivo):
+    """Archivo .json con los metadatos de un historial .npy."""
+    return os.path.splitext(archivo)[0] + ".json"
+
+def convertir_historial(archivo_csv, destino, columna_fecha="fecha", columna_demanda="demanda"):
+    """
+    Convierte el CSV de ventas diarias en el .npy (y su .json) que usa cargar_historial.
+
+    Args:
+        archivo_csv (str): CSV con una fila por día; las fechas en formato AAAA-MM-DD.
+        destino (str): Archivo .npy a generar.
+        columna_fecha (str): Nombre de la columna con la fecha.
+        columna_demanda (str): Nombre de la columna con las unidades vendidas (enteros no negativos).
+
+    Returns:
+        dict: Los metadatos guardados en el .json.
+    """
+    fechas = []
+    demandas = []
+    with open(archivo_csv, newline='') as archivo:
+        lector = csv.DictReader(archivo)
+        faltantes = [columna for columna in (columna_fecha, columna_demanda) if columna not in (lector.fieldnames or [])]
+        if faltantes:
+            raise ValueError(f"Al historial le faltan las columnas: {', '.join(faltantes)}")
+        bloque_fechas, bloque_demandas = [], []
+        for fila in lector:
+            bloque_fechas.append(fila[columna_fecha])
+            bloque_demandas.append(fila[columna_demanda])
+            if len(bloque_fechas) == FILAS_POR_BLOQUE:
+                fechas.append(np.array(bloque_fechas, dtype="datetime64[D]"))
+                demandas.append(np.array(bloque_demandas, dtype=np.int64))
+                bloque_fechas, bloque_demandas = [], []
+        if bloque_fechas:
+            fechas.append(np.array(bloque_fechas, dtype="datetime64[D]"))
+            demandas.append(np.array(bloque_demandas, dtype=np.int64))
+    if not fechas:
+        raise ValueError(f"El historial {archivo_csv} está vacío")
+    fechas = np.concatenate(fechas)
+    demandas = np.concatenate(demandas)
+    if np.any(demandas < 0):
+        raise ValueError("El historial tiene demandas negativas")
+
+    orden = np.argsort(fechas, kind="stable")
+    fechas = fechas[orden]
+    demandas = demandas[orden]
+    repetidas = fechas[1:][fechas[1:] == fechas[:-1]]
+    if len(repetidas):
+        raise ValueError(f"El historial tiene fechas repetidas, por ejemplo {repetidas[0]}")
+    es_finde = _dia_de_la_semana(fechas) >= 4
+
+    ventas = np.lib.format.open_memmap(destino, mode="w+", dtype=np.int64, shape=demandas.shape)
+    dias_semana = int(np.count_nonzero(~es_finde))
+    ventas[:dias_semana] = demandas[~es_finde]
+    ventas[dias_semana:] = demandas[es_finde]
+    ventas.flush()
+    del ventas
+
+    dias_calendario = int((fechas[-1] - fechas[0]).astype(np.int64)) + 1
+    metadatos = {
+        "fuente": os.path.basename(archivo_csv),
+        "fecha_inicio": str(fechas[0]),
+        "fecha_fin": str(fechas[-1]),
+        "dias_semana": dias_semana,
+        "dias_finde": len(fechas) - dias_semana,
+        "dias_faltantes": dias_calendario - len(fechas)
+    }
+    with open(ruta_metadatos(destino), "w") as archivo:
+        json.dump(metadatos, archivo, indent=2)
+    return metadatos
+
+def cargar_historial(archivo):
+    """
+    Abre un historial de convertir_historial sin cargarlo en memoria.
+
+    Returns:
+        dict: "semana" y "finde" (np.memmap int64 con las ventas de cada tipo de día, en orden de fecha)
+              y "metadatos" (dict del .json).
+    """
+    with open(ruta_metadatos(archivo)) as f:
+        metadatos = json.load(f)
+    ventas = np.load(archivo, mmap_mode="r")
+    dias_semana = metadatos["dias_semana"]
+    return {"semana": ventas[:dias_semana], "finde": ventas[dias_semana:], "metadatos": metadatos}
+
+def bootstrap_por_bloques(serie, cant_replicas, cant_dias, generador, longitud_bloque=LONGITUD_BLOQUE):
+    """
+    Bootstrap por bloques circular: (R, cant_dias) valores de `serie` tomados en bloques de
+    `longitud_bloque` posiciones consecutivas (volviendo al principio al pasar el final) que empiezan
+    en posiciones uniformes.
+
+    Args:
+        serie (np.ndarray): Serie a remuestrear (puede ser un memmap).
+        cant_replicas (int): Filas.
+        cant_dias (int): Valores por fila.
+        generador (np.random.Generator): Generador de las posiciones de inicio.
+        longitud_bloque (int): Largo de cada bloque.
+
+    Returns:
+        np.ndarray: int64 (R, cant_dias).
+    """
+    if longitud_bloque < 1:
+        raise ValueError(f"longitud_bloque debe ser positiva, no {longitud_bloque}")
+    largo = len(serie)
+    cant_bloques = -(-cant_dias // longitud_bloque)
+    inicios = generador.integers(0, largo, size=(cant_replicas, cant_bloques, 1))
+    posiciones = (inicios + np.arange(longitud_bloque)) % largo
+    posiciones = posiciones.reshape(cant_replicas, cant_bloques * longitud_bloque)[:, :cant_dias]
+    return np.asarray(serie[posiciones.ravel()], dtype=np.int64).reshape(cant_replicas, cant_dias)
+
+def generar_matriz_demanda_historica(cant_replicas, dias_a_simular, historial, rng=None,
+                                     longitud_bloque=LONGITUD_BLOQUE, fecha_inicio=FECHA_INICIO):
+    """
+    Genera la demanda de `cant_replicas` réplicas de `dias_a_simular` días remuestreando el historial:
+    los días de entresemana salen de las ventas de entresemana y los de fin de semana, de las de fin de semana.
+
+    Args:
+        cant_replicas (int): Cantidad de réplicas (filas).
+        dias_a_simular (int): Cantidad de días por réplica (columnas).
+        historial (str | dict): Archivo .npy de convertir_historial o el dict de cargar_historial.
+        rng (random.Random): Generador para la semilla del bootstrap. Por defecto, una semilla al azar.
+        longitud_bloque (int): Días consecutivos de cada bloque.
+        fecha_inicio (date): Primer día simulado.
+
+    Returns:
+        tuple: (demandas (np.ndarray int64 (R, D)), es_finde (np.ndarray bool (D,))), como generar_matriz_demanda.
+    """
+    if isinstance(historial, str):
+        historial = cargar_historial(historial)
+    es_finde = mascara_fin_de_semana(dias_a_simular, fecha_inicio)
+    generador = np.random.default_rng(rng.getrandbits(64) if rng is not None else None)
+    demandas = np.empty((cant_replicas, dias_a_simular), dtype=np.int64)
+    with cronometro("demanda/bootstrap"):
+        for tipo, columnas in (("semana", ~es_finde), ("finde", es_finde)):
+            cant_dias = int(np.count_nonzero(columnas))
+            if cant_dias == 0:
+                continue
+            if len(historial[tipo]) == 0:
+                raise ValueError(f"El historial no tiene días de {'fin de semana' if tipo == 'finde' else 'entresemana'}")
+            demandas[:, columnas] = bootstrap_por_bloques(historial[tipo], cant_replicas, cant_dias, generador,
+                                                          longitud_bloque)
+    return demandas, es_finde
+
+def mostrar_resumen(historial):
+    """Muestra el período, los días de cada tipo y la media y el desvío de las ventas de cada tipo."""
+    metadatos = historial["metadatos"]
+    print(f"Historial de {metadatos['fuente']}: {metadatos['fecha_inicio']} a {metadatos['fecha_fin']} "
+          f"({metadatos['dias_faltantes']} días faltantes)")
+    for tipo, nombre in (("semana", "L-J"), ("finde", "V-S-D")):
+        serie = historial[tipo]
+        if len(serie) == 0:
+            print(f"  {nombre}: sin días")
+            continue
+        desvio = np.std(serie, ddof=1) if len(serie) > 1 else 0.0
+        print(f"  {nombre}: {len(serie)} días | media {np.mean(serie):.2f} | desvío {desvio:.2f} | "
+              f"mínimo {np.min(serie)} | máximo {np.max(serie)}")
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Convierte y resume historiales de ventas diarias para simular con demanda real.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+    convertir = subparsers.add_parser("convertir", help="Convierte un CSV de ventas diarias en un .npy para memmap.")
+    convertir.add_argument("csv", help="CSV con una fila por día.")
+    convertir.add_argument("destino", help="Archivo .npy a generar (los metadatos van en el .json del mismo nombre).")
+    convertir.add_argument("--columna-fecha", default="fecha", help="Columna con la fecha AAAA-MM-DD (por defecto fecha).")
+    convertir.add_argument("--columna-demanda", default="demanda", help="Columna con las unidades (por defecto demanda).")
+    resumen = subparsers.add_parser("resumen", help="Muestra los días y las ventas de cada tipo de un historial.")
+    resumen.add_argument("historial", help="Archivo .npy generado con convertir.")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.comando == "convertir":
+            convertir_historial(args.csv, args.destino, args.columna_fecha, args.columna_demanda)
+            print(f"Historial guardado en {args.destino} y {ruta_metadatos(args.destino)}")
+            mostrar_resumen(cargar_historial(args.destino))
+        else:
+            mostrar_resumen(cargar_historial(args.historial))
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Escenarios de precios y costos a partir de los conteos de unidades
+=======================================================================
+
+El resultado neto es lineal en las unidades vendidas, desperdiciadas y perdidas:
+
+    resultado = beneficio * vendidas - costo_sb * desperdiciadas - costo_vp * perdidas = w · conteos
+
+con w = (beneficio, -costo_sb, -costo_vp). Por eso, con la media (3,) y la matriz de covarianzas (3, 3)
+de los conteos de cada combinación alcanza para obtener la media (w · media) y la varianza (w^T Σ w)
+del resultado neto de cualquier escenario, y con ellas su intervalo de confianza, sin volver a simular.
+campania.py guarda los conteos de cada réplica con --guardar-conteos.
+
+En cada escenario todas las políticas se valorizan con los mismos precios, aunque alguna tenga
+precios propios en el registro (ver registrar_politica).
+
+Ejemplos:
+    python campania.py --replicas 20000 --seed 1 --guardar-conteos conteos.npz
+    python escenarios_costos.py conteos.npz --costo-vp 3:11:1 --costo-sb 3,5,7 --salida escenarios.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+
+import numpy as np
+
+from simulador import PRECIOS
+from registro_politicas import combinaciones_parametros
+from pruebas_estadisticas.valores_criticos import t_ppf
+
+def guardar_conteos(resultados, nombre_archivo):
+    """
+    Guarda en un archivo .npz los conteos (como un array (3, R, P)), las combinaciones y los precios de
+    cada política de una campaña (el diccionario de resultados de campania.ejecutar_campania).
+    """
+    arrays = {}
+    for nombre, datos in resultados.items():
+        arrays[f"{nombre}/conteos"] = np.stack(datos["conteos"])
+        arrays[f"{nombre}/combinaciones"] = np.array(json.dumps(datos["combinaciones"]))
+        arrays[f"{nombre}/precios"] = np.array(json.dumps(datos["precios"]))
+    with open(nombre_archivo, "wb") as archivo:
+        np.savez(archivo, **arrays)
+
+def cargar_conteos(nombre_archivo):
+    """
+    Lee un archivo de guardar_conteos.
+
+    Returns:
+        dict: politica -> {"combinaciones": list[dict], "conteos": np.ndarray (3, R, P), "precios": dict}
+    """
+    resultados = {}
+    with np.load(nombre_archivo) as datos:
+        for clave in datos.files:
+            nombre, campo = clave.rsplit("/", 1)
+            valor = datos[clave]
+            resultados.setdefault(nombre, {})[campo] = valor if campo == "conteos" else json.loads(valor.item())
+    return resultados
+
+def estadisticas_suficientes(conteos):
+    """
+    Estadísticas de los conteos que alcanzan para valorizar cualquier escenario.
+    `conteos` es la tupla (vendidas, desperdiciadas, perdidas) de arrays (R, P) o un array (3, R, P).
+
+    Returns:
+        dict: "replicas", "medias" (3, P) y "covarianzas" (P, 3, 3) con ddof = 1.
+    """
+    conteos = np.asarray(conteos)
+    cant_replicas = conteos.shape[1]
+    medias = conteos.mean(axis=1)
+    centrados = conteos - medias[:, None, :]
+    covarianzas = np.einsum("irp,jrp->pij", centrados, centrados) / (cant_replicas - 1)
+    return {"replicas": cant_replicas, "medias": medias, "covarianzas": covarianzas}
+
+def pesos_escenarios(escenarios):
+    """Vectores w = (beneficio, -costo_sb, -costo_vp) de cada escenario, (E, 3)."""
+    return np.array([[escenario["beneficio"], -escenario["costo_sb"], -escenario["costo_vp"]]
+                     for escenario in escenarios], dtype=np.float64)
+
+def valorizar_escenarios(estadisticas, escenarios, alpha=0.05):
+    """
+    Intervalo de confianza t del resultado neto medio de cada escenario y combinación.
+
+    Args:
+        estadisticas (dict): Salida de estadisticas_suficientes.
+        escenarios (list[dict]): Precios de cada escenario (claves de simulador.PRECIOS).
+        alpha (float): Nivel de significancia.
+
+    Returns:
+        dict: Arrays (E, P) con 'beneficio_prom', 'stddev', 'delta', 'lower' y 'upper',
+              las mismas claves que simulador.intervalos_de_confianza.
+    """
+    cant_replicas = estadisticas["replicas"]
+    pesos = pesos_escenarios(escenarios)
+    beneficio_prom = pesos @ estadisticas["medias"]
+    varianza = np.einsum("ei,pij,ej->ep", pesos, estadisticas["covarianzas"], pesos)
+    # w^T Σ w puede dar apenas negativo por redondeo cuando el resultado es constante
+    stddev = np.sqrt(np.maximum(varianza, 0))
+    t_critical = t_ppf(1 - alpha / 2, cant_replicas - 1)
+    delta = t_critical * (stddev / math.sqrt(cant_replicas))
+    return {
+        "beneficio_prom": beneficio_prom,
+        "stddev": stddev,
+        "delta": delta,
+        "lower": beneficio_prom - delta,
+        "upper": beneficio_prom + delta
+    }
+
+def evaluar_escenarios(resultados, escenarios, alpha=0.05):
+    """
+    Valoriza todos los escenarios para todas las políticas de una campaña.
+
+    Args:
+        resultados (dict): politica -> {"combinaciones", "conteos", ...} (ejecutar_campania o cargar_conteos).
+        escenarios (list[dict]): Precios de cada escenario.
+        alpha (float): Nivel de significancia.
+
+    Returns:
+        dict: politica -> intervalos (E, P) de valorizar_escenarios.
+    """
+    return {nombre: valorizar_escenarios(estadisticas_suficientes(datos["conteos"]), escenarios, alpha)
+            for nombre, datos in resultados.items()}
+
+def grilla_escenarios(beneficio=None, costo_sb=None, costo_vp=None):
+    """
+    Producto cartesiano de los valores de cada precio; los que no se pasan quedan con el de simulador.PRECIOS.
+    """
+    espacio = {"beneficio": beneficio, "costo_sb": costo_sb, "costo_vp": costo_vp}
+    return combinaciones_parametros({clave: valores or [PRECIOS[clave]] for clave, valores in espacio.items()})
+
+def mejores_por_escenario(resultados, escenarios, intervalos):
+    """
+    Mejor política y combinación (mayor beneficio promedio) de cada escenario.
+
+    Returns:
+        list[dict]: Una fila por escenario con los precios, la política, los parámetros y su intervalo.
+    """
+    filas = []
+    for e, escenario in enumerate(escenarios):
+        mejor = None
+        for nombre, datos in resultados.items():
+            j = int(np.argmax(intervalos[nombre]["beneficio_prom"][e]))
+            if mejor is None or intervalos[nombre]["beneficio_prom"][e, j] > mejor["beneficio_prom"]:
+                mejor = {"politica": nombre, "parametros": datos["combinaciones"][j],
+                         **{columna: intervalos[nombre][columna][e, j] for columna in intervalos[nombre]}}
+        filas.append({**escenario, **mejor})
+    return filas
+
+def guardar_escenarios_csv(resultados, escenarios, intervalos, nombre_archivo):
+    """Guarda una fila por escenario, política y combinación con su intervalo de confianza."""
+    with open(nombre_archivo, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['beneficio', 'costo_sb', 'costo_vp', 'politica', 'parametros',
+                         'beneficio_prom', 'stddev', 'delta', 'lower', 'upper'])
+        for e, escenario in enumerate(escenarios):
+            for nombre, datos in resultados.items():
+                for j, combi in enumerate(datos["combinaciones"]):
+                    parametros = ";".join(f"{clave}={valor}" for clave, valor in combi.items())
+                    writer.writerow([escenario["beneficio"], escenario["costo_sb"], escenario["costo_vp"], nombre, parametros]
+                                    + [intervalos[nombre][columna][e, j] for columna in
+                                       ('beneficio_prom', 'stddev', 'delta', 'lower', 'upper')])
+
+def interpretar_precios(texto):
+    """
+    Convierte 'a,b,c' en [a, b, c] (admite decimales) e 'inicio:fin:paso' en range(inicio, fin, paso).
+    """
+    if ":" in texto:
+        return list(range(*(int(parte) for parte in texto.split(":"))))
+    return [float(valor) if "." in valor else int(valor) for valor in texto.split(",")]
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Valoriza escenarios de precios y costos con los conteos de unidades de una campaña, sin volver a simular.")
+    parser.add_argument("conteos", help="Archivo .npz generado con campania.py --guardar-conteos.")
+    for precio, opcion in (("beneficio", "--beneficio"), ("costo_sb", "--costo-sb"), ("costo_vp", "--costo-vp")):
+        parser.add_argument(opcion, dest=precio, type=interpretar_precios, default=None, metavar="VALORES",
+                            help=f"Valores de {precio}: a,b,c o inicio:fin:paso (por defecto {PRECIOS[precio]}).")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia de los intervalos.")
+    parser.add_argument("--salida", default=None, help="Archivo CSV donde guardar todos los escenarios.")
+    return parser
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    resultados = cargar_conteos(args.conteos)
+    escenarios = grilla_escenarios(args.beneficio, args.costo_sb, args.costo_vp)
+    intervalos = evaluar_escenarios(resultados, escenarios, args.alpha)
+    cant_replicas = len(next(iter(resultados.values()))["conteos"][0])
+    cant_combinaciones = sum(len(datos["combinaciones"]) for datos in resultados.values())
+    print(f"{len(escenarios)} escenarios x {cant_combinaciones} combinaciones ({cant_replicas} réplicas)\n")
+    print(f"{'Beneficio':>9} {'Costo SB':>9} {'Costo VP':>9} | Mejor política")
+    for fila in mejores_por_escenario(resultados, escenarios, intervalos):
+        parametros = ", ".join(f"{clave} = {valor}" for clave, valor in fila["parametros"].items())
+        print(f"{fila['beneficio']:>9} {fila['costo_sb']:>9} {fila['costo_vp']:>9} | {fila['politica']} ({parametros}) "
+              f"Beneficio Prom: {fila['beneficio_prom']:.2f} IC {(1 - args.alpha) * 100:.0f}% = "
+              f"[{fila['lower']:.2f}, {fila['upper']:.2f}]")
+    if args.salida:
+        guardar_escenarios_csv(resultados, escenarios, intervalos, args.salida)
+        print(f"\nEscenarios guardados en {args.salida}")
+
+if __name__ == "__main__":
+    main()
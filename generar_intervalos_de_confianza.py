@@ -1,9 +1,10 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from simulador import genera_demanda_diaria
 from produccion_demanda_máxima import simular_produccion_maxima
 
 def ejecutar_analisis(resultados_netos):
+    # matplotlib se importa solo cuando se pide el gráfico
+    import matplotlib.pyplot as plt
     
     # Calcular intervalo de confianza simple
     minimo = min(resultados_netos)
@@ -0,0 +1,116 @@
+# Archivo: instrumentacion.py
+# Descripción: Temporizadores y contadores por etapa para saber dónde se va el tiempo de una campaña.
+# Están desactivados por defecto: mientras no se llame a activar(), cada punto de medición
+# cuesta solo una comprobación de un booleano.
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+ACTIVA = False
+
+# etapa -> [segundos acumulados, llamadas]
+_tiempos = {}
+# nombre -> cantidad
+_contadores = {}
+
+_SIN_MEDICION = nullcontext()
+
+def activar(activa=True):
+    """Activa (o desactiva) la recolección de métricas en este proceso."""
+    global ACTIVA
+    ACTIVA = activa
+
+def reiniciar():
+    """Borra las métricas acumuladas en este proceso."""
+    _tiempos.clear()
+    _contadores.clear()
+
+def sumar_tiempo(etapa, segundos, llamadas=1):
+    if not ACTIVA:
+        return
+    acumulado = _tiempos.setdefault(etapa, [0.0, 0])
+    acumulado[0] += segundos
+    acumulado[1] += llamadas
+
+def contar(nombre, cantidad=1):
+    if not ACTIVA:
+        return
+    _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+@contextmanager
+def _medir(etapa):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        sumar_tiempo(etapa, time.perf_counter() - inicio)
+
+def cronometro(etapa):
+    """
+    Context manager que acumula el tiempo del bloque en `etapa`.
+
+    Ejemplo:
+        with cronometro("pruebas/poker"):
+            prueba_poker(numeros, verbose=False)
+    """
+    if not ACTIVA:
+        return _SIN_MEDICION
+    return _medir(etapa)
+
+def exportar():
+    """
+    Devuelve las métricas de este proceso en un dict serializable (para mandarlas desde un worker).
+    """
+    return {
+        "tiempos": {etapa: {"segundos": segundos, "llamadas": llamadas} for etapa, (segundos, llamadas) in _tiempos.items()},
+        "contadores": dict(_contadores),
+    }
+
+def fusionar(lista_metricas):
+    """
+    Suma las métricas exportadas por varios procesos.
+    """
+    resultado = {"tiempos": {}, "contadores": {}}
+    for metricas in lista_metricas:
+        for etapa, datos in metricas["tiempos"].items():
+            acumulado = resultado["tiempos"].setdefault(etapa, {"segundos": 0.0, "llamadas": 0})
+            acumulado["segundos"] += datos["segundos"]
+            acumulado["llamadas"] += datos["llamadas"]
+        for nombre, cantidad in metricas["contadores"].items():
+            resultado["contadores"][nombre] = resultado["contadores"].get(nombre, 0) + cantidad
+    return resultado
+
+def derivar(metricas):
+    """
+    Calcula indicadores a partir de las métricas fusionadas: intentos por conjunto aprobado,
+    tasa de rechazo de cada prueba y réplicas/s de cada política.
+    """
+    contadores = metricas["contadores"]
+    tiempos = metricas["tiempos"]
+    derivadas = {}
+    intentos = contadores.get("aprobados/intentos", 0)
+    aprobados = contadores.get("aprobados/conjuntos", 0)
+    if aprobados:
+        derivadas["intentos_por_conjunto_aprobado"] = intentos / aprobados
+    if intentos:
+        derivadas["tasa_rechazo_por_prueba"] = {
+            nombre.split("/", 1)[1]: cantidad / intentos
+            for nombre, cantidad in contadores.items() if nombre.startswith("rechazos/")
+        }
+    derivadas["replicas_por_segundo"] = {}
+    for nombre, cantidad in contadores.items():
+        if nombre.startswith("politica/") and nombre.endswith("/replicas"):
+            politica = nombre[len("politica/"):-len("/replicas")]
+            segundos = tiempos.get(f"politica/{politica}", {}).get("segundos", 0)
+            if segundos:
+                derivadas["replicas_por_segundo"][politica] = cantidad / segundos
+    return derivadas
+
+def guardar_json(metricas, nombre_archivo, **extra):
+    """Guarda las métricas, sus indicadores derivados y datos extra en un archivo JSON."""
+    informe = dict(extra)
+    informe.update(metricas)
+    informe["derivadas"] = derivar(metricas)
+    with open(nombre_archivo, "w") as f:
+        json.dump(informe, f, indent=2)
@@ -10,41 +10,272 @@ Pruebas implementadas:
 2. Prueba de Varianza - Verifica que la varianza sea aproximadamente 1/12
 3. Prueba de Uniformidad (Chi-Cuadrada) - Verifica distribución uniforme
 4. Prueba de Independencia (Poker) - Verifica independencia entre dígitos
+
+Pruebas extendidas (se eligen con --pruebas):
+5. Prueba de Corridas Arriba y Abajo - Verifica independencia entre subidas y bajadas
+6. Prueba de Huecos - Verifica independencia entre apariciones de un intervalo
+7. Prueba Serial - Verifica uniformidad de los pares de números consecutivos
+8. Prueba de Kolmogorov-Smirnov - Verifica distribución uniforme
 """
 
+import argparse
+import glob
+import json
+import multiprocessing
+import os
 import sys
+import time
 import numpy as np
 from datetime import datetime
 
 # Importar las pruebas
 try:
-    from pruebas_estadisticas.prueba_de_medias import prueba_de_medias
-    from pruebas_estadisticas.prueba_de_varianza import prueba_de_varianza
-    from pruebas_estadisticas.prueba_de_uniformidad_chi_cuadrada import prueba_chi_cuadrada
-    from pruebas_estadisticas.prueba_de_independencia_poker import prueba_poker
+    from pruebas_estadisticas.prueba_de_varianza import nuevo_estado_varianza, actualizar_varianza
+    from pruebas_estadisticas.pruebas_fusionadas import (estadisticos_suficientes, combinar_estados, detalle_pruebas,
+                                                         validar_pruebas, FINALIZAR, PRUEBAS, TODAS_LAS_PRUEBAS)
+    from nros_aleatorios.generador_congruencial_mixto import EXTENSION_BINARIA, leer_nros_aleatorios_binario
+    from nros_aleatorios.generador_congruencial_np import flotantes_desde_cuantizados, es_cuantizado
 except ImportError:
     print("\nError al importar los módulos de pruebas estadísticas.")
     print("Verificando estructura de directorios y archivos...")
     print("Asegúrese de que la carpeta existe y contiene los archivos de pruebas.")
 
+# Números por bloque al leer archivos grandes (8 MB en float64)
+TAMANO_BLOQUE_LECTURA = 1_000_000
+
+# Extensiones de los archivos binarios de float64 sin encabezado
+EXTENSIONES_CRUDAS = (".f64", ".bin", ".raw")
+
+# Extensiones que se toman al pasar una carpeta en el modo por lotes
+EXTENSIONES_NUMEROS = (".csv", ".txt", ".lcg", ".npy") + EXTENSIONES_CRUDAS
+
+def formato_archivo(archivo):
+    """
+    Determina el formato del archivo de números por su extensión.
+
+    Retorna:
+    str: "lcg" (formato binario del generador), "npy" (array de NumPy), "crudo" (float64 sin encabezado)
+         o "texto" (un número por línea).
+    """
+    extension = os.path.splitext(archivo)[1].lower()
+    if extension == EXTENSION_BINARIA:
+        return "lcg"
+    if extension == ".npy":
+        return "npy"
+    if extension in EXTENSIONES_CRUDAS:
+        return "crudo"
+    return "texto"
+
+def abrir_numeros_binarios(archivo):
+    """
+    Abre un archivo binario como np.memmap de solo lectura: los datos se leen del disco a medida que se usan.
+    Los archivos del generador (.lcg) con números cuantizados se devuelven como uint16 (ver generador_congruencial_np).
+    """
+    formato = formato_archivo(archivo)
+    if formato == "lcg":
+        return leer_nros_aleatorios_binario(archivo)[1]
+    if formato == "npy":
+        return np.load(archivo, mmap_mode="r")
+    return np.memmap(archivo, dtype=np.float64, mode="r")
+
+def leer_bloques(archivo, tamano_bloque=TAMANO_BLOQUE_LECTURA):
+    """
+    Recorre el archivo de números en bloques de a lo sumo `tamano_bloque` números (np.ndarray float64),
+    sin cargarlo entero en memoria.
+    """
+    if formato_archivo(archivo) != "texto":
+        numeros = abrir_numeros_binarios(archivo)
+        for inicio in range(0, len(numeros), tamano_bloque):
+            bloque = numeros[inicio:inicio + tamano_bloque]
+            yield flotantes_desde_cuantizados(bloque) if es_cuantizado(bloque) else np.asarray(bloque, dtype=np.float64)
+        return
+    with open(archivo, 'r') as f:
+        bloque = []
+        for line in f:
+            if line.strip():
+                bloque.append(float(line))
+                if len(bloque) == tamano_bloque:
+                    yield np.array(bloque, dtype=np.float64)
+                    bloque = []
+        if bloque:
+            yield np.array(bloque, dtype=np.float64)
+
 def cargar_numeros_aleatorios(archivo):
     """
-    Carga los números aleatorios desde un archivo CSV.
+    Carga los números aleatorios desde un archivo.
+
+    Los archivos de texto (un número por línea, como el CSV del generador) se leen por bloques
+    a un array float64; los binarios (.lcg del generador, .npy o float64 crudo: .f64, .bin, .raw) se abren con np.memmap.
     
     Parámetros:
-    archivo (str): Ruta al archivo CSV con los números aleatorios.
+    archivo (str): Ruta al archivo con los números aleatorios.
     
     Retorna:
-    list: Lista de números aleatorios.
+    np.ndarray: Números aleatorios (uint16 cuantizados para los .lcg que los guardan así).
     """
     try:
-        with open(archivo, 'r') as f:
-            numeros = [float(line.strip()) for line in f if line.strip()]
-        return numeros
+        if formato_archivo(archivo) != "texto":
+            return abrir_numeros_binarios(archivo)
+        bloques = list(leer_bloques(archivo))
+        return np.concatenate(bloques) if bloques else np.empty(0)
     except Exception as e:
         print(f"Error al cargar el archivo: {str(e)}")
         sys.exit(1)
 
+def nuevo_rango():
+    """Mínimo, máximo y valores fuera de [0, 1] vistos hasta ahora."""
+    return {"minimo": np.inf, "maximo": -np.inf, "invalidos": 0, "ejemplos_invalidos": []}
+
+def actualizar_rango(rango, bloque):
+    """Agrega un bloque (floats o cuantizados uint16) al rango."""
+    if len(bloque) == 0:
+        return rango
+    if es_cuantizado(bloque):
+        # Los cuantizados siempre están en [0, 1]
+        rango["minimo"] = min(rango["minimo"], int(bloque.min()) / 10000.0)
+        rango["maximo"] = max(rango["maximo"], int(bloque.max()) / 10000.0)
+        return rango
+    bloque = np.asarray(bloque, dtype=np.float64)
+    rango["minimo"] = min(rango["minimo"], float(bloque.min()))
+    rango["maximo"] = max(rango["maximo"], float(bloque.max()))
+    fuera_de_rango = (bloque < 0) | (bloque > 1)
+    cantidad_invalidos = int(np.count_nonzero(fuera_de_rango))
+    if cantidad_invalidos:
+        faltan = 5 - len(rango["ejemplos_invalidos"])
+        rango["ejemplos_invalidos"].extend(bloque[fuera_de_rango][:faltan].tolist())
+        rango["invalidos"] += cantidad_invalidos
+    return rango
+
+def combinar_rangos(rango, otro):
+    """Combina los rangos de dos partes distintas del archivo."""
+    return {
+        "minimo": min(rango["minimo"], otro["minimo"]),
+        "maximo": max(rango["maximo"], otro["maximo"]),
+        "invalidos": rango["invalidos"] + otro["invalidos"],
+        "ejemplos_invalidos": (rango["ejemplos_invalidos"] + otro["ejemplos_invalidos"])[:5]
+    }
+
+def nuevo_acumulador():
+    """
+    Acumulador de estadísticas básicas en una sola pasada (ver acumular_bloque).
+    La cantidad, la media y la suma de cuadrados centrados se llevan en un estado de la prueba de varianza.
+    """
+    return dict(nuevo_rango(), momentos=nuevo_estado_varianza())
+
+def acumular_bloque(acumulador, bloque):
+    """
+    Agrega un bloque al acumulador. La media y la suma de cuadrados centrados se combinan
+    con la fórmula de Chan et al., que es estable aunque se sumen muchos bloques.
+    """
+    bloque = np.asarray(bloque, dtype=np.float64)
+    if len(bloque) == 0:
+        return acumulador
+    actualizar_varianza(acumulador["momentos"], bloque)
+    actualizar_rango(acumulador, bloque)
+    return acumulador
+
+def resumir_acumulador(acumulador):
+    """
+    Estadísticas básicas del acumulador: cantidad, mínimo, máximo, media, varianza y desviación estándar
+    (poblacionales, como np.var y np.std) y valores fuera de [0, 1].
+    """
+    n = acumulador["momentos"]["n"]
+    varianza = acumulador["momentos"]["m2"] / n if n else float("nan")
+    return {
+        "n": n,
+        "minimo": acumulador["minimo"],
+        "maximo": acumulador["maximo"],
+        "media": acumulador["momentos"]["media"],
+        "varianza": varianza,
+        "desviacion_estandar": float(np.sqrt(varianza)),
+        "invalidos": acumulador["invalidos"],
+        "ejemplos_invalidos": acumulador["ejemplos_invalidos"]
+    }
+
+def calcular_estadisticas_basicas(bloques):
+    """
+    Calcula las estadísticas básicas (ver resumir_acumulador) recorriendo los bloques una sola vez.
+
+    Parámetros:
+    bloques (iterable): Bloques de números (por ejemplo leer_bloques(archivo)), o una sola lista/array.
+    """
+    if isinstance(bloques, (list, np.ndarray)):
+        bloques = [bloques]
+    acumulador = nuevo_acumulador()
+    for bloque in bloques:
+        acumular_bloque(acumulador, bloque)
+    return resumir_acumulador(acumulador)
+
+# --- Pruebas por bloques ---
+# Las estadísticas básicas y las cuatro pruebas se calculan en una sola lectura del archivo:
+# cada bloque pasa una vez por el núcleo fusionado (ver pruebas_fusionadas.py), que calcula los
+# estados de las cuatro pruebas. Los archivos binarios se reparten por rangos entre varios procesos
+# y sus estados se combinan al final.
+
+def estados_de_bloque(bloque, pruebas=None):
+    """
+    Estados de las pruebas y rango de valores de un bloque (floats o cuantizados uint16).
+    Los de las cuatro pruebas básicas se calculan siempre; los de las extendidas, si están en `pruebas`.
+    """
+    estados = estadisticos_suficientes(bloque, num_intervalos=10, tamano_grupo=5, pruebas=pruebas or PRUEBAS)
+    estados["rango"] = actualizar_rango(nuevo_rango(), bloque)
+    return estados
+
+def combinar_estados_pruebas(estados, otros):
+    """Combina los estados calculados sobre dos partes distintas del archivo (None es un estado vacío)."""
+    if estados is None:
+        return otros
+    combinados = combinar_estados(estados, otros)
+    combinados["rango"] = combinar_rangos(estados["rango"], otros["rango"])
+    return combinados
+
+def resumir_estados(estados):
+    """Estadísticas básicas (ver resumir_acumulador) a partir de los estados de las pruebas."""
+    return resumir_acumulador(dict(estados["rango"], momentos=estados["varianza"]))
+
+def _procesar_rango(argumentos):
+    """
+    Trabajo de un proceso: recorre por bloques los números [inicio, fin) de un archivo binario.
+    """
+    archivo, inicio, fin, tamano_bloque, pruebas = argumentos
+    numeros = abrir_numeros_binarios(archivo)
+    estados = None
+    for desde in range(inicio, fin, tamano_bloque):
+        bloque = numeros[desde:min(desde + tamano_bloque, fin)]
+        estados = combinar_estados_pruebas(estados, estados_de_bloque(bloque, pruebas))
+    return estados
+
+def calcular_estados_pruebas(archivo, workers=None, tamano_bloque=TAMANO_BLOQUE_LECTURA, pruebas=None):
+    """
+    Recorre el archivo una sola vez y devuelve los estados de las estadísticas básicas y de las pruebas.
+    Los archivos de texto se leen en un solo proceso; los binarios se reparten entre `workers` procesos
+    (por defecto, todos los núcleos). Los estados de los rangos se combinan en el orden del archivo,
+    como piden las pruebas de corridas, huecos y serial.
+    """
+    if formato_archivo(archivo) == "texto":
+        estados = None
+        for bloque in leer_bloques(archivo, tamano_bloque):
+            estados = combinar_estados_pruebas(estados, estados_de_bloque(bloque, pruebas))
+        return estados if estados is not None else estados_de_bloque(np.empty(0), pruebas)
+
+    cantidad = len(abrir_numeros_binarios(archivo))
+    if cantidad == 0:
+        return estados_de_bloque(np.empty(0), pruebas)
+    workers = workers or multiprocessing.cpu_count()
+    # Varios rangos por proceso para repartir mejor la carga
+    cantidad_rangos = max(1, min(4 * workers, -(-cantidad // tamano_bloque)))
+    limites = np.linspace(0, cantidad, cantidad_rangos + 1).astype(np.int64)
+    trabajos = [(archivo, int(inicio), int(fin), tamano_bloque, pruebas) for inicio, fin in zip(limites[:-1], limites[1:])]
+    if workers == 1 or len(trabajos) == 1:
+        parciales = [_procesar_rango(trabajo) for trabajo in trabajos]
+    else:
+        with multiprocessing.Pool(processes=min(workers, len(trabajos))) as pool:
+            parciales = pool.map(_procesar_rango, trabajos)
+    estados = parciales[0]
+    for parcial in parciales[1:]:
+        estados = combinar_estados_pruebas(estados, parcial)
+    return estados
+
 def mostrar_encabezado():
     """Muestra un encabezado estilizado para el informe de pruebas."""
     print("\n" + "="*80)
@@ -58,76 +289,68 @@ def mostrar_estadisticas_basicas(numeros):
     Muestra estadísticas básicas de los números cargados.
     
     Parámetros:
-    numeros (list): Lista de números aleatorios.
+    numeros (list | dict): Lista de números aleatorios, o estadísticas ya calculadas con calcular_estadisticas_basicas.
     """
-    n = len(numeros)
+    estadisticas = numeros if isinstance(numeros, dict) else calcular_estadisticas_basicas(numeros)
+    n = estadisticas["n"]
     if n == 0:
         print("No se encontraron números en el archivo.")
         return
 
     print(f"\n{'ESTADÍSTICAS BÁSICAS':-^80}")
     print(f"Cantidad de números analizados: {n}")
-    print(f"Rango de valores: [{min(numeros):.6f}, {max(numeros):.6f}]")
-    print(f"Media: {np.mean(numeros):.6f}")
-    print(f"Desviación estándar: {np.std(numeros):.6f}")
-    print(f"Varianza: {np.var(numeros):.6f}")
+    print(f"Rango de valores: [{estadisticas['minimo']:.6f}, {estadisticas['maximo']:.6f}]")
+    print(f"Media: {estadisticas['media']:.6f}")
+    print(f"Desviación estándar: {estadisticas['desviacion_estandar']:.6f}")
+    print(f"Varianza: {estadisticas['varianza']:.6f}")
     
     # Verificar si hay valores fuera del rango [0,1]
-    valores_invalidos = [x for x in numeros if x < 0 or x > 1]
-    if valores_invalidos:
-        print(f"\n¡ADVERTENCIA! Se encontraron los siguientes {len(valores_invalidos)} valores fuera del rango [0,1].")
-        print(valores_invalidos[:5])
+    if estadisticas["invalidos"]:
+        print(f"\n¡ADVERTENCIA! Se encontraron los siguientes {estadisticas['invalidos']} valores fuera del rango [0,1].")
+        print(estadisticas["ejemplos_invalidos"])
+
+# Nombre de cada prueba en la salida detallada
+DESCRIPCIONES = {
+    "medias": "Prueba de Medias",
+    "varianza": "Prueba de Varianza",
+    "uniformidad": "Prueba de Uniformidad (Chi-Cuadrada)",
+    "independencia": "Prueba de Independencia (Poker)",
+    "corridas": "Prueba de Corridas (Arriba y Abajo)",
+    "huecos": "Prueba de Huecos",
+    "serial": "Prueba Serial (Pares)",
+    "kolmogorov_smirnov": "Prueba de Kolmogorov-Smirnov"
+}
 
-def ejecutar_pruebas(numeros, alpha=0.05):
+def ejecutar_pruebas(numeros, alpha=0.05, estados=None, pruebas=None):
     """
     Ejecuta todas las pruebas estadísticas y recopila resultados.
     
     Parámetros:
-    numeros (list): Lista de números aleatorios.
+    numeros (list): Lista de números aleatorios (o array uint16 de números cuantizados).
     alpha (float): Nivel de significancia para las pruebas.
+    estados (dict): Estados ya acumulados por bloques (ver calcular_estados_pruebas). Si se pasan,
+      `numeros` no se usa y cada prueba solo toma su decisión final.
+      Si no, se calculan de `numeros` con una sola pasada (ver pruebas_fusionadas.py).
+    pruebas (tuple): Pruebas a ejecutar (ver TODAS_LAS_PRUEBAS). Por defecto, las cuatro básicas.
     
     Retorna:
     dict: Diccionario con los resultados de cada prueba.
     """
+    pruebas = pruebas or PRUEBAS
     resultados = {}
+    # Los estadísticos de todas las pruebas salen de una sola pasada por los datos
+    if not estados:
+        estados = estadisticos_suficientes(numeros, num_intervalos=10, tamano_grupo=5, pruebas=pruebas)
     
     print(f"\n{'EJECUCIÓN DE PRUEBAS ESTADÍSTICAS':-^80}")
     
-    # 1. Prueba de Medias
-    print("\n[1/4] Ejecutando Prueba de Medias...")
-    try:
-        resultado_medias = prueba_de_medias(numeros, alpha)
-        resultados["medias"] = resultado_medias
-    except Exception as e:
-        print(f"Error al ejecutar la prueba de medias: {str(e)}")
-        resultados["medias"] = None
-    
-    # 2. Prueba de Varianza
-    print("\n[2/4] Ejecutando Prueba de Varianza...")
-    try:
-        resultado_varianza = prueba_de_varianza(numeros, alpha)
-        resultados["varianza"] = resultado_varianza
-    except Exception as e:
-        print(f"Error al ejecutar la prueba de varianza: {str(e)}")
-        resultados["varianza"] = None
-    
-    # 3. Prueba de Uniformidad (Chi-Cuadrada)
-    print("\n[3/4] Ejecutando Prueba de Uniformidad (Chi-Cuadrada)...")
-    try:
-        resultado_uniformidad = prueba_chi_cuadrada(numeros, 10, alpha)
-        resultados["uniformidad"] = resultado_uniformidad
-    except Exception as e:
-        print(f"Error al ejecutar la prueba de uniformidad: {str(e)}")
-        resultados["uniformidad"] = None
-    
-    # 4. Prueba de Independencia (Poker)
-    print("\n[4/4] Ejecutando Prueba de Independencia (Poker)...")
-    try:
-        resultado_poker = prueba_poker(numeros, 5, alpha)
-        resultados["independencia"] = resultado_poker
-    except Exception as e:
-        print(f"Error al ejecutar la prueba de independencia: {str(e)}")
-        resultados["independencia"] = None
+    for i, prueba in enumerate(pruebas, start=1):
+        print(f"\n[{i}/{len(pruebas)}] Ejecutando {DESCRIPCIONES[prueba]}...")
+        try:
+            resultados[prueba] = FINALIZAR[prueba](estados[prueba], alpha)
+        except Exception as e:
+            print(f"Error al ejecutar la prueba de {prueba}: {str(e)}")
+            resultados[prueba] = None
     
     return resultados
 
@@ -159,7 +382,11 @@ def mostrar_conclusiones(resultados):
         "medias": "Prueba de Medias",
         "varianza": "Prueba de Varianza",
         "uniformidad": "Prueba Chi-Cuadrada",
-        "independencia": "Prueba de Poker"
+        "independencia": "Prueba de Poker",
+        "corridas": "Prueba de Corridas",
+        "huecos": "Prueba de Huecos",
+        "serial": "Prueba Serial",
+        "kolmogorov_smirnov": "Prueba K-S"
     }
     
     for prueba, resultado in resultados.items():
@@ -183,25 +410,157 @@ def mostrar_conclusiones(resultados):
         print("  ✗ NO SATISFACTORIO - La secuencia no pasa múltiples pruebas estadísticas.")
         print("    Se recomienda revisar y ajustar los parámetros del generador.")
 
-def main():
-    """Función principal del script."""
-    # Definir archivo de entrada
-    archivo_entrada = "numeros_aleatorios_metodo_mixto.csv"
-    
+# --- Modo por lotes ---
+# Con varios archivos (o una carpeta o un patrón glob) cada archivo se analiza en un proceso del pool,
+# sin la salida detallada de cada prueba, y los resultados se guardan en un informe JSON.
+
+REPORTE_POR_DEFECTO = "reporte_pruebas.json"
+
+def expandir_archivos(rutas):
+    """
+    Lista de archivos a analizar a partir de archivos, carpetas (se toman los archivos con
+    EXTENSIONES_NUMEROS) y patrones glob. Conserva el orden y no repite archivos.
+    """
+    archivos = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            encontrados = sorted(os.path.join(ruta, nombre) for nombre in os.listdir(ruta)
+                                 if os.path.splitext(nombre)[1].lower() in EXTENSIONES_NUMEROS)
+        elif glob.has_magic(ruta):
+            encontrados = sorted(glob.glob(ruta))
+        else:
+            encontrados = [ruta]
+        for archivo in encontrados:
+            if archivo not in archivos:
+                archivos.append(archivo)
+    return archivos
+
+def _valor_json(valor):
+    """inf y nan no son JSON válido: se informan como null."""
+    if isinstance(valor, float) and not np.isfinite(valor):
+        return None
+    return valor
+
+def informe_de_estados(archivo, estados, alpha=0.05, pruebas=None):
+    """
+    Resultado de un archivo para el informe JSON: formato, aprobado, estadísticas básicas y detalle
+    de cada prueba (decisión, estadístico y p-valor).
+    """
+    pruebas = detalle_pruebas(estados, alpha, pruebas or PRUEBAS)
+    return {
+        "archivo": archivo,
+        "formato": formato_archivo(archivo),
+        "aprobado": all(detalle["aprobada"] for detalle in pruebas.values()),
+        "estadisticas": {clave: _valor_json(valor) for clave, valor in resumir_estados(estados).items()},
+        "pruebas": {prueba: {clave: _valor_json(valor) for clave, valor in detalle.items()}
+                    for prueba, detalle in pruebas.items()}
+    }
+
+def analizar_archivo(argumentos):
+    """
+    Trabajo de un proceso del modo por lotes: analiza un archivo sin mostrar nada.
+
+    Parámetros:
+    argumentos (tuple): (archivo, alpha, pruebas)
+
+    Retorna:
+    dict: Ver informe_de_estados, más los tiempos en segundos. Si el archivo no se pudo analizar,
+          aprobado es None y se informa el error.
+    """
+    archivo, alpha, pruebas = argumentos
+    inicio = time.perf_counter()
+    try:
+        # Dentro del pool cada archivo se recorre en un solo proceso
+        estados = calcular_estados_pruebas(archivo, workers=1, pruebas=pruebas)
+        lectura = time.perf_counter()
+        informe = informe_de_estados(archivo, estados, alpha, pruebas)
+    except Exception as e:
+        return {"archivo": archivo, "formato": formato_archivo(archivo), "aprobado": None, "error": str(e),
+                "tiempos": {"total": time.perf_counter() - inicio}}
+    fin = time.perf_counter()
+    informe["tiempos"] = {"lectura": lectura - inicio, "pruebas": fin - lectura, "total": fin - inicio}
+    return informe
+
+def ejecutar_lote(archivos, alpha=0.05, workers=None, reporte=REPORTE_POR_DEFECTO, pruebas=None):
+    """
+    Analiza varios archivos en paralelo (un archivo por tarea del pool) y guarda el informe consolidado.
+
+    Parámetros:
+    archivos (list): Archivos a analizar (ver expandir_archivos).
+    alpha (float): Nivel de significancia de las pruebas.
+    workers (int): Procesos del pool. Por defecto, todos los núcleos.
+    reporte (str): Archivo JSON donde se guarda el informe (None para no guardarlo).
+    pruebas (tuple): Pruebas a ejecutar (ver TODAS_LAS_PRUEBAS). Por defecto, las cuatro básicas.
+
+    Retorna:
+    dict: El informe: fecha, alpha, resumen y un resultado por archivo (ver analizar_archivo).
+    """
+    pruebas = pruebas or PRUEBAS
+    workers = min(workers or multiprocessing.cpu_count(), len(archivos))
+    trabajos = [(archivo, alpha, pruebas) for archivo in archivos]
+    inicio = time.perf_counter()
+    print(f"Analizando {len(archivos)} archivos con {workers} procesos (α = {alpha})...\n")
+    print(f"{'Archivo':<40} {'Cantidad':>12} " + " ".join(f"{prueba[:11]:>11}" for prueba in pruebas) + f" {'Segundos':>9}")
+    print("-" * (40 + 13 + 12 * len(pruebas) + 10))
+    resultados = []
+    with multiprocessing.Pool(processes=workers) as pool:
+        for resultado in pool.imap(analizar_archivo, trabajos):
+            resultados.append(resultado)
+            nombre = os.path.basename(resultado["archivo"])[:40]
+            if resultado["aprobado"] is None:
+                print(f"{nombre:<40} ! ERROR: {resultado['error']}")
+                continue
+            marcas = " ".join(f"{'✓' if resultado['pruebas'][prueba]['aprobada'] else '✗':>11}" for prueba in pruebas)
+            print(f"{nombre:<40} {resultado['estadisticas']['n']:>12} {marcas} {resultado['tiempos']['total']:>9.2f}")
+
+    resumen = {
+        "archivos": len(resultados),
+        "aprobados": sum(1 for resultado in resultados if resultado["aprobado"]),
+        "rechazados": sum(1 for resultado in resultados if resultado["aprobado"] is False),
+        "errores": sum(1 for resultado in resultados if resultado["aprobado"] is None),
+        "segundos": time.perf_counter() - inicio
+    }
+    informe = {"fecha": datetime.now().isoformat(timespec="seconds"), "alpha": alpha, "pruebas": list(pruebas),
+               "resumen": resumen, "resultados": resultados}
+    print(f"\nAprobados: {resumen['aprobados']}  Rechazados: {resumen['rechazados']}  Errores: {resumen['errores']}"
+          f"  ({resumen['segundos']:.2f} s)")
+    if reporte:
+        with open(reporte, "w") as f:
+            json.dump(informe, f, indent=2, ensure_ascii=False)
+        print(f"Informe guardado en '{reporte}'.")
+    return informe
+
+ARCHIVO_POR_DEFECTO = "numeros_aleatorios_metodo_mixto.csv"
+
+def analizar_un_archivo(archivo_entrada=ARCHIVO_POR_DEFECTO, workers=None, alpha=0.05, pruebas=None):
+    """
+    Análisis detallado de un solo archivo, con la salida de cada prueba.
+
+    Parámetros:
+    archivo_entrada (str): Archivo de texto (.csv, un número por línea) o binario (.lcg, .npy, .f64, .bin, .raw).
+    workers (int): Procesos para recorrer los archivos binarios. Por defecto, todos los núcleos.
+    alpha (float): Nivel de significancia de las pruebas.
+    pruebas (tuple): Pruebas a ejecutar (ver TODAS_LAS_PRUEBAS). Por defecto, las cuatro básicas.
+
+    Retorna:
+    dict: Los estados de las pruebas (ver calcular_estados_pruebas).
+    """
     # Mostrar encabezado
     mostrar_encabezado()
     
-    # Cargar números aleatorios
+    # Estadísticas básicas y estados de las pruebas en una sola lectura por bloques:
+    # el archivo nunca se carga entero en memoria
     print(f"Cargando números aleatorios desde '{archivo_entrada}'...")
-    numeros = cargar_numeros_aleatorios(archivo_entrada)
-    
-    # Mostrar estadísticas básicas
-    mostrar_estadisticas_basicas(numeros)
+    try:
+        estados = calcular_estados_pruebas(archivo_entrada, workers, pruebas=pruebas)
+    except Exception as e:
+        print(f"Error al cargar el archivo: {str(e)}")
+        sys.exit(1)
+    mostrar_estadisticas_basicas(resumir_estados(estados))
     
     # Ejecutar pruebas estadísticas
-    nivel_significancia = 0.05
-    print(f"\nIniciando pruebas estadísticas con nivel de significancia α = {nivel_significancia}...")
-    resultados = ejecutar_pruebas(numeros, alpha=nivel_significancia)
+    print(f"\nIniciando pruebas estadísticas con nivel de significancia α = {alpha}...")
+    resultados = ejecutar_pruebas(None, alpha=alpha, estados=estados, pruebas=pruebas)
     
     # Mostrar conclusiones
     mostrar_conclusiones(resultados)
@@ -209,13 +568,58 @@ def main():
     print("\n" + "="*80)
     print(" "*15 + "FIN DEL ANÁLISIS DE NÚMEROS PSEUDOALEATORIOS")
     print("="*80 + "\n")
+    return estados
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Pruebas estadísticas de archivos de números pseudoaleatorios.")
+    parser.add_argument("archivos", nargs="*", default=[ARCHIVO_POR_DEFECTO],
+                        help="Archivos, carpetas o patrones glob (por ejemplo 'salidas/*.lcg'). Con un solo archivo "
+                             "se muestra el detalle de cada prueba; con varios se analizan por lotes.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia de las pruebas.")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos a usar (por defecto, todos los núcleos).")
+    parser.add_argument("--pruebas", default=",".join(PRUEBAS),
+                        help=f"Pruebas a ejecutar separadas por comas, o 'todas'. Opciones: {', '.join(TODAS_LAS_PRUEBAS)}.")
+    parser.add_argument("--reporte", default=None,
+                        help=f"Archivo JSON del informe por lotes (por defecto '{REPORTE_POR_DEFECTO}').")
+    return parser
+
+def main(argv=None):
+    """
+    Función principal del script: con un solo archivo hace el análisis detallado (ver analizar_un_archivo);
+    con varios, o con una carpeta o patrón, el análisis por lotes (ver ejecutar_lote).
+
+    Retorna:
+    int: Código de salida (en el modo por lotes, 1 si algún archivo no pasó las pruebas o no se pudo analizar).
+    """
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        pruebas = TODAS_LAS_PRUEBAS if args.pruebas == "todas" else validar_pruebas(args.pruebas.split(","))
+    except ValueError as e:
+        parser.error(str(e))
+    archivos = expandir_archivos(args.archivos)
+    if not archivos:
+        print("No se encontraron archivos para analizar.")
+        return 1
+    por_lotes = len(archivos) > 1 or any(os.path.isdir(ruta) or glob.has_magic(ruta) for ruta in args.archivos)
+    if not por_lotes:
+        estados = analizar_un_archivo(archivos[0], args.workers, args.alpha, pruebas)
+        if args.reporte:
+            # Mismo formato que el modo por lotes, con un solo archivo
+            with open(args.reporte, "w") as f:
+                json.dump({"fecha": datetime.now().isoformat(timespec="seconds"), "alpha": args.alpha,
+                           "pruebas": list(pruebas), "resultados": [informe_de_estados(archivos[0], estados, args.alpha, pruebas)]},
+                          f, indent=2, ensure_ascii=False)
+        return 0
+    informe = ejecutar_lote(archivos, args.alpha, args.workers, args.reporte or REPORTE_POR_DEFECTO, pruebas)
+    return 0 if informe["resumen"]["aprobados"] == len(archivos) else 1
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\nProceso interrumpido por el usuario.")
         sys.exit(0)
     except Exception as e:
         print(f"\nError inesperado: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
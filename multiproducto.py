@@ -0,0 +1,327 @@
+"""
+Simulación de varios productos (SKU) con su propia demanda y sus propios precios
+=======================================================================
+
+campania.py simula un solo producto, con la demanda de simulador.py (floor(r * 77) + 4 de lunes a jueves
+y floor(r * 90) + 18 de viernes a domingo) y los precios de simulador.PRECIOS. Este módulo lee una tabla
+de productos (un CSV con una fila por SKU) y evalúa las políticas registradas para todos a la vez:
+
+  1. La demanda es un array (S, R, D): cada producto tiene sus propias réplicas, con sus propios
+     números aprobados, y su demanda sale de sus tablas (simulador.tabla_demanda con su amplitud y mínimo).
+  2. Cada política se evalúa en una sola llamada sobre la demanda de todos los productos plegada a
+     (S * R, D), y los conteos vuelven a (S, R, P).
+  3. Cada producto se valoriza con sus propios precios (en todas las políticas, como en escenarios_costos.py).
+  4. Para cada política se elige la mejor combinación de cada producto y el resultado de la tienda es la
+     suma, réplica por réplica, de los resultados elegidos; la mezcla "mejor_por_producto" elige además
+     la mejor política de cada producto.
+
+Todas las políticas usan la grilla registrada (pensada para el producto de referencia) para todos los
+productos; con --grid se amplía para productos de demanda muy distinta. La mejor combinación se elige
+con las mismas réplicas con las que se estima, así que su promedio es algo optimista.
+
+Columnas de la tabla: producto, amplitud_semana, minimo_semana, amplitud_finde, minimo_finde,
+beneficio, costo_sb, costo_vp. La fila de productos.csv con 77, 4, 90, 18, 10, 7, 10 es el producto
+de referencia de simulador.py.
+
+Ejemplos:
+    python multiproducto.py productos.csv
+    python multiproducto.py productos.csv franco demanda_maxima --replicas 20000 --seed 1 --salida tienda.csv
+"""
+
+import argparse
+import csv
+import multiprocessing
+import random
+import sys
+import time
+
+import numpy as np
+
+from simulador import (generar_matriz_uniformes, mascara_fin_de_semana, tabla_demanda, intervalos_de_confianza,
+                       resultado_neto, MODOS_VALIDACION, CONTEOS, PRECIOS)
+from nros_aleatorios.motores import MOTORES, MOTOR_POR_DEFECTO, validar_motor
+from registro_politicas import POLITICAS
+from campania import cargar_politicas, combinaciones_de_politicas, interpretar_grillas, TAMANO_BLOQUE
+
+# Columnas de demanda de la tabla de productos (enteros) y de precios (con los nombres de simulador.PRECIOS)
+COLUMNAS_DEMANDA = ("amplitud_semana", "minimo_semana", "amplitud_finde", "minimo_finde")
+COLUMNAS_PRODUCTOS = ("producto",) + COLUMNAS_DEMANDA + tuple(PRECIOS)
+
+# Nombre de la mezcla que elige la mejor política de cada producto y de las filas con el total de la tienda
+MEZCLA = "mejor_por_producto"
+TIENDA = "TIENDA"
+
+def cargar_productos(nombre_archivo):
+    """
+    Lee la tabla de productos.
+
+    Returns:
+        dict: "productos" (list[str]) y un np.ndarray (S,) por cada columna de demanda (int64) y de precios (float64).
+    """
+    with open(nombre_archivo, newline='') as archivo:
+        lector = csv.DictReader(archivo)
+        faltantes = [columna for columna in COLUMNAS_PRODUCTOS if columna not in (lector.fieldnames or [])]
+        if faltantes:
+            raise ValueError(f"A la tabla de productos le faltan las columnas: {', '.join(faltantes)}")
+        filas = list(lector)
+    if not filas:
+        raise ValueError(f"La tabla de productos {nombre_archivo} está vacía")
+
+    productos = {"productos": [fila["producto"].strip() for fila in filas]}
+    repetidos = {nombre for nombre in productos["productos"] if productos["productos"].count(nombre) > 1}
+    if repetidos:
+        raise ValueError(f"Productos repetidos: {', '.join(sorted(repetidos))}")
+    for numero, fila in enumerate(filas, start=2):
+        try:
+            for columna in COLUMNAS_DEMANDA:
+                productos.setdefault(columna, []).append(int(fila[columna]))
+            for columna in PRECIOS:
+                productos.setdefault(columna, []).append(float(fila[columna]))
+        except (TypeError, ValueError):
+            raise ValueError(f"Fila {numero} de {nombre_archivo}: las columnas de demanda deben ser enteras y "
+                             f"las de precios numéricas")
+    for columna in COLUMNAS_DEMANDA:
+        productos[columna] = np.array(productos[columna], dtype=np.int64)
+    for columna in PRECIOS:
+        productos[columna] = np.array(productos[columna], dtype=np.float64)
+    if np.any(productos["amplitud_semana"] <= 0) or np.any(productos["amplitud_finde"] <= 0):
+        raise ValueError("Las amplitudes de demanda deben ser positivas")
+    if np.any(productos["minimo_semana"] < 0) or np.any(productos["minimo_finde"] < 0):
+        raise ValueError("Los mínimos de demanda no pueden ser negativos")
+    return productos
+
+def tablas_productos(productos):
+    """Tablas de demanda de cada producto: (entresemana (S, 10001), fin de semana (S, 10001))."""
+    return (tabla_demanda(productos["amplitud_semana"], productos["minimo_semana"]),
+            tabla_demanda(productos["amplitud_finde"], productos["minimo_finde"]))
+
+def generar_demanda_productos(productos, cant_replicas, dias_a_simular, rng=None, modo="por_replica",
+                              ajuste_alpha=None, motor=MOTOR_POR_DEFECTO):
+    """
+    Demanda de `cant_replicas` réplicas de `dias_a_simular` días para cada producto.
+
+    Los números aprobados se generan como S * R filas de generar_matriz_uniformes (las primeras R son las
+    del primer producto), así que con un solo producto la demanda es la de generar_matriz_demanda.
+
+    Returns:
+        tuple: (demandas (np.ndarray int64 (S, R, D)), es_finde (np.ndarray bool (D,)))
+    """
+    cant_productos = len(productos["productos"])
+    es_finde = mascara_fin_de_semana(dias_a_simular)
+    cuantizados = generar_matriz_uniformes(cant_productos * cant_replicas, dias_a_simular, rng=rng, modo=modo,
+                                           ajuste_alpha=ajuste_alpha, cuantizados=True, motor=motor)
+    cuantizados = cuantizados.reshape(cant_productos, cant_replicas, dias_a_simular)
+    tabla_semana, tabla_finde = tablas_productos(productos)
+    fila = np.arange(cant_productos)[:, None, None]
+    demandas = np.where(es_finde, tabla_finde[fila, cuantizados], tabla_semana[fila, cuantizados])
+    return demandas, es_finde
+
+def simular_productos(nombre, demandas, es_finde, combinaciones):
+    """
+    Evalúa una política registrada para todos los productos en una sola llamada.
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), cada una np.ndarray (S, R, P).
+    """
+    cant_productos, cant_replicas, cant_dias = demandas.shape
+    conteos = POLITICAS[nombre]["simular"](demandas.reshape(cant_productos * cant_replicas, cant_dias),
+                                           es_finde, combinaciones)
+    return tuple(conteo.reshape(cant_productos, cant_replicas, -1) for conteo in conteos)
+
+def valorizar_productos(conteos, productos):
+    """Resultado neto (S, R, P) de los conteos de cada producto con sus propios precios."""
+    precios = {clave: productos[clave][:, None, None] for clave in PRECIOS}
+    return resultado_neto(*conteos, **precios)
+
+def _simular_bloque(argumentos):
+    """
+    Trabajo de un proceso: genera la demanda de un bloque de réplicas de todos los productos y evalúa
+    todas las políticas. Devuelve los conteos (S, R, P) de cada política.
+    """
+    productos, cant_replicas, cant_dias, semilla, combinaciones_por_politica, opciones_demanda = argumentos
+    cargar_politicas()
+    demandas, es_finde = generar_demanda_productos(productos, cant_replicas, cant_dias, rng=random.Random(semilla),
+                                                   **opciones_demanda)
+    return {nombre: simular_productos(nombre, demandas, es_finde, combinaciones)
+            for nombre, combinaciones in combinaciones_por_politica.items()}
+
+def ejecutar_multiproducto(productos, politicas, cant_replicas, cant_dias, workers=None, semilla=None, grillas=None,
+                           validacion="por_replica", ajuste_alpha=None, motor=MOTOR_POR_DEFECTO):
+    """
+    Evalúa las políticas para todos los productos de la tabla.
+
+    Los bloques de trabajo tienen TAMANO_BLOQUE filas de demanda entre todos los productos (TAMANO_BLOQUE / S
+    réplicas), así que cada proceso usa la misma memoria que en campania.py. Con un solo producto los
+    bloques y sus semillas son los de campania.py.
+
+    Parámetros:
+    productos (dict): Tabla de cargar_productos.
+    politicas (list): Nombres de las políticas registradas a evaluar.
+    cant_replicas (int): Réplicas por producto.
+    cant_dias (int): Días por réplica.
+    workers, semilla, grillas, validacion, ajuste_alpha, motor: Como en campania.ejecutar_campania.
+
+    Retorna:
+    dict: politica -> {"combinaciones": list[dict], "conteos": tuple de np.ndarray (S, R, P),
+                       "beneficios": np.ndarray (S, R, P)}
+    """
+    cargar_politicas()
+    validar_motor(motor)
+    combinaciones_por_politica = combinaciones_de_politicas(politicas, grillas)
+
+    if semilla is None:
+        semilla = random.randrange(2**32)
+    opciones_demanda = {"modo": validacion, "ajuste_alpha": ajuste_alpha, "motor": motor}
+    replicas_por_bloque = max(1, TAMANO_BLOQUE // len(productos["productos"]))
+    trabajos = []
+    for indice, inicio in enumerate(range(0, cant_replicas, replicas_por_bloque)):
+        replicas_bloque = min(replicas_por_bloque, cant_replicas - inicio)
+        trabajos.append((productos, replicas_bloque, cant_dias, f"{semilla}:{indice}", combinaciones_por_politica,
+                         opciones_demanda))
+
+    workers = workers or multiprocessing.cpu_count()
+    if workers == 1 or len(trabajos) == 1:
+        resultados_bloques = [_simular_bloque(trabajo) for trabajo in trabajos]
+    else:
+        with multiprocessing.Pool(processes=min(workers, len(trabajos))) as pool:
+            resultados_bloques = pool.map(_simular_bloque, trabajos)
+
+    resultados = {}
+    for nombre, combinaciones in combinaciones_por_politica.items():
+        conteos = tuple(np.concatenate([bloque[nombre][i] for bloque in resultados_bloques], axis=1)
+                        for i in range(len(CONTEOS)))
+        resultados[nombre] = {
+            "combinaciones": combinaciones,
+            "conteos": conteos,
+            "beneficios": valorizar_productos(conteos, productos)
+        }
+    return resultados
+
+def elegir_combinaciones(resultados):
+    """
+    Mejor combinación de cada producto para cada política y la mezcla con la mejor política de cada producto.
+
+    Returns:
+        dict: politica (y MEZCLA) -> lista de (politica, índice de combinación), una por producto.
+    """
+    elecciones = {}
+    promedios = {}
+    for nombre, datos in resultados.items():
+        promedios[nombre] = datos["beneficios"].mean(axis=1)
+        elecciones[nombre] = [(nombre, int(j)) for j in promedios[nombre].argmax(axis=1)]
+    cant_productos = len(next(iter(elecciones.values())))
+    elecciones[MEZCLA] = [max((eleccion[s] for eleccion in elecciones.values()),
+                              key=lambda par: promedios[par[0]][s, par[1]])
+                          for s in range(cant_productos)]
+    return elecciones
+
+def resumir_productos(resultados, productos, alpha=0.05):
+    """
+    Intervalos de confianza de la combinación elegida de cada producto y del total de la tienda.
+
+    Returns:
+        list[dict]: Una fila por elección (politica o MEZCLA) y producto, y una fila TIENDA por elección,
+                    con la política y los parámetros, las columnas de intervalos_de_confianza y las
+                    unidades promedio de cada conteo.
+    """
+    filas = []
+    for eleccion, pares in elegir_combinaciones(resultados).items():
+        totales = 0
+        unidades_tienda = dict.fromkeys(CONTEOS, 0.0)
+        for s, (nombre, j) in enumerate(pares):
+            datos = resultados[nombre]
+            beneficios = datos["beneficios"][s, :, j]
+            totales = totales + beneficios
+            unidades = {conteo: datos["conteos"][i][s, :, j].mean() for i, conteo in enumerate(CONTEOS)}
+            for conteo in CONTEOS:
+                unidades_tienda[conteo] += unidades[conteo]
+            intervalo = intervalos_de_confianza(beneficios[:, None], alpha)
+            filas.append({"eleccion": eleccion, "producto": productos["productos"][s], "politica": nombre,
+                          "parametros": datos["combinaciones"][j],
+                          **{columna: valores[0] for columna, valores in intervalo.items()}, **unidades})
+        intervalo = intervalos_de_confianza(totales[:, None], alpha)
+        filas.append({"eleccion": eleccion, "producto": TIENDA, "politica": eleccion, "parametros": {},
+                      **{columna: valores[0] for columna, valores in intervalo.items()}, **unidades_tienda})
+    return filas
+
+def mostrar_resultados(filas, alpha=0.05):
+    """Muestra la combinación elegida de cada producto y el total de la tienda de cada elección."""
+    eleccion_actual = None
+    for fila in filas:
+        if fila["eleccion"] != eleccion_actual:
+            eleccion_actual = fila["eleccion"]
+            print(f"\n--- {eleccion_actual} ---\n")
+        parametros = ", ".join(f"{clave} = {valor}" for clave, valor in fila["parametros"].items())
+        if fila["eleccion"] == MEZCLA and fila["producto"] != TIENDA:
+            parametros = f"{fila['politica']}: {parametros}"
+        print(f"{fila['producto']:<16} {parametros:<45} | Beneficio Prom: {fila['beneficio_prom']:>10.2f} | "
+              f"IC {(1 - alpha) * 100:.0f}% = [{fila['lower']:.2f}, {fila['upper']:.2f}] | "
+              + " ".join(f"{conteo} {fila[conteo]:.1f}" for conteo in CONTEOS))
+
+def guardar_resultados_csv(filas, nombre_archivo):
+    """Guarda una fila por elección y producto (y el total de la tienda) con su intervalo y sus unidades."""
+    columnas = ('beneficio_prom', 'stddev', 'delta', 'lower', 'upper') + CONTEOS
+    with open(nombre_archivo, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['eleccion', 'producto', 'politica', 'parametros'] + list(columnas))
+        for fila in filas:
+            parametros = ";".join(f"{clave}={valor}" for clave, valor in fila["parametros"].items())
+            writer.writerow([fila["eleccion"], fila["producto"], fila["politica"], parametros]
+                            + [fila[columna] for columna in columnas])
+
+def crear_parser():
+    politicas = cargar_politicas()
+    parser = argparse.ArgumentParser(
+        description="Evalúa políticas de producción para varios productos, cada uno con su demanda y sus precios.",
+        epilog="Políticas disponibles: " + "; ".join(f"{nombre} ({datos['descripcion']})" for nombre, datos in politicas.items())
+    )
+    parser.add_argument("productos", help="Tabla CSV de productos (columnas: " + ", ".join(COLUMNAS_PRODUCTOS) + ").")
+    parser.add_argument("politicas", nargs="*", metavar="politica",
+                        help="Políticas a evaluar (por defecto, todas).")
+    parser.add_argument("--replicas", type=int, default=10000, help="Réplicas por producto (por defecto 10000).")
+    parser.add_argument("--days", type=int, default=30, help="Días por réplica (por defecto 30).")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos a usar (por defecto, todos los núcleos).")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de la simulación.")
+    parser.add_argument("--grid", action="append", metavar="POLITICA.PARAMETRO=VALORES",
+                        help="Reemplaza los valores de un parámetro para todos los productos, como en campania.py.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia de los intervalos.")
+    parser.add_argument("--salida", default=None, help="Archivo CSV donde guardar los resultados.")
+    parser.add_argument("--validacion", choices=MODOS_VALIDACION, default="por_replica",
+                        help="Validación de los números de cada réplica (ver campania.py).")
+    parser.add_argument("--ajuste-alpha", choices=["sidak"], default=None,
+                        help="Reparte alpha entre las cuatro pruebas para que la tasa de rechazo total sea alpha.")
+    parser.add_argument("--motor", choices=list(MOTORES), default=MOTOR_POR_DEFECTO,
+                        help=f"Generador de los números aleatorios (por defecto {MOTOR_POR_DEFECTO}).")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        productos = cargar_productos(args.productos)
+        grillas = interpretar_grillas(args.grid)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    desconocidas = [nombre for nombre in list(args.politicas) + list(grillas) if nombre not in POLITICAS]
+    if desconocidas:
+        parser.error(f"Políticas desconocidas: {', '.join(desconocidas)}. Disponibles: {', '.join(POLITICAS)}")
+    politicas = args.politicas or list(POLITICAS)
+
+    inicio = time.time()
+    print(f"Simulando {len(productos['productos'])} productos x {args.replicas} réplicas de {args.days} días "
+          f"para: {', '.join(politicas)}")
+    resultados = ejecutar_multiproducto(productos, politicas, args.replicas, args.days, args.workers, args.seed,
+                                        grillas, args.validacion, args.ajuste_alpha, args.motor)
+    filas = resumir_productos(resultados, productos, args.alpha)
+    mostrar_resultados(filas, args.alpha)
+    if args.salida:
+        guardar_resultados_csv(filas, args.salida)
+        print(f"\nResultados guardados en {args.salida}")
+    print(f"\nSimulación terminada en {(time.time() - inicio) / 60:.2f} minutos.")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nProceso interrumpido por el usuario.")
+        sys.exit(0)
@@ -0,0 +1,528 @@
+"""
+Explorador de parámetros del generador congruencial
+=======================================================================
+
+Evalúa en paralelo miles de ternas (a, c, m) candidatas y las ordena en una tabla. Para cada terna calcula:
+
+1. Período: analíticamente cuando se puede (Hull-Dobell si c != 0; orden multiplicativo de a, que
+   para m primo es la comprobación de raíz primitiva, si c = 0) y, para m chicos, con la detección
+   de ciclos de Brent.
+2. Prueba espectral en dimensiones 2 a 6: la distancia ν_t entre hiperplanos se obtiene del vector
+   más corto de la red dual (LLL exacto con fracciones y enumeración), normalizada por su cota
+   superior: S_t = ν_t / (γ_t^(1/2) m^(1/t)) está en (0, 1] y cuanto más cerca de 1, mejor.
+   La figura de mérito es el mínimo de S_2..S_6.
+3. Tasa de aprobación de la batería de pruebas (pruebas_fusionadas) sobre secuencias cortas
+   generadas desde semillas al azar.
+
+Uso:
+    python nros_aleatorios/explorador_parametros.py                              # módulos por defecto
+    python nros_aleatorios/explorador_parametros.py --modulos 2^32,2^48,2^64 --cantidad 500 --workers 8
+    python nros_aleatorios/explorador_parametros.py --modulos 2^31-1 --incremento 0 --salida ranking.csv
+"""
+
+import argparse
+import csv
+import math
+import multiprocessing
+import os
+import random
+import re
+import sys
+import time
+from fractions import Fraction
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from nros_aleatorios.generador_congruencial_np import generador_nros_cuantizados_por_semilla, metodo_multiplicacion
+from pruebas_estadisticas.pruebas_fusionadas import (estadisticos_suficientes, decidir_pruebas, validar_pruebas,
+                                                     TODAS_LAS_PRUEBAS)
+
+# Dimensiones de la prueba espectral y constantes de Hermite γ_t (ν_t <= γ_t^(1/2) m^(1/t))
+DIMENSIONES = (2, 3, 4, 5, 6)
+HERMITE = {2: 2 / math.sqrt(3), 3: 2 ** (1 / 3), 4: math.sqrt(2), 5: 8 ** (1 / 5), 6: (64 / 3) ** (1 / 6)}
+
+# Módulos hasta los que el período se puede contar con Brent cuando no hay fórmula
+LIMITE_BRENT = 2**22
+
+# Ternas conocidas que se agregan siempre a la tabla como referencia
+REFERENCIAS = (
+    (16807, 0, 2**31 - 1),                                       # la del proyecto (Park-Miller)
+    (48271, 0, 2**31 - 1),
+    (1103515245, 12345, 2**31),
+    (25214903917, 11, 2**48),
+    (6364136223846793005, 1442695040888963407, 2**64),
+)
+
+# --- Aritmética ---
+
+_BASES_MILLER_RABIN = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def es_primo(n):
+    """Miller-Rabin con las 13 primeras bases primas: determinista para n < 3.3 * 10^24."""
+    if n < 2:
+        return False
+    for p in _BASES_MILLER_RABIN:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for base in _BASES_MILLER_RABIN:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _rho_brent(n):
+    """Un factor no trivial de n (compuesto e impar) con el método rho de Pollard en la variante de Brent."""
+    generador = random.Random(n)
+    while True:
+        y, c, m = generador.randrange(1, n), generador.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+def factorizar(n):
+    """
+    Factorización en primos: dict primo -> exponente.
+    """
+    factores = {}
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factores[p] = factores.get(p, 0) + 1
+            n //= p
+    pendientes = [n] if n > 1 else []
+    while pendientes:
+        n = pendientes.pop()
+        if es_primo(n):
+            factores[n] = factores.get(n, 0) + 1
+            continue
+        d = _rho_brent(n)
+        pendientes.extend((d, n // d))
+    return factores
+
+def _carmichael(factores):
+    """λ(m) (exponente del grupo de unidades módulo m) a partir de la factorización de m."""
+    lam = 1
+    for p, e in factores.items():
+        if p == 2:
+            parcial = 1 if e == 1 else 2 if e == 2 else 2 ** (e - 2)
+        else:
+            parcial = p ** (e - 1) * (p - 1)
+        lam = lam * parcial // math.gcd(lam, parcial)
+    return lam
+
+def orden_multiplicativo(a, m):
+    """
+    Menor k > 0 con a^k ≡ 1 (mod m), o None si a no es invertible módulo m.
+    """
+    if m == 1:
+        return 1
+    if math.gcd(a, m) != 1:
+        return None
+    orden = _carmichael(factorizar(m))
+    for q in factorizar(orden):
+        while orden % q == 0 and pow(a, orden // q, m) == 1:
+            orden //= q
+    return orden
+
+def cumple_hull_dobell(a, c, m):
+    """
+    Teorema de Hull-Dobell: con c != 0 el período es m (para cualquier semilla) si y solo si
+    c y m son coprimos, a - 1 es divisible por todos los factores primos de m y por 4 si m lo es.
+    """
+    if c % m == 0 or math.gcd(c, m) != 1:
+        return False
+    if any((a - 1) % p for p in factorizar(m)):
+        return False
+    return m % 4 != 0 or (a - 1) % 4 == 0
+
+def periodo_brent(a, c, m, seed=1, limite=None):
+    """
+    Detección de ciclos de Brent: devuelve (λ, μ), el largo del ciclo y los pasos antes de entrar en él.
+    Hace O(λ + μ) pasos, así que solo sirve para m chicos; si se pasa de `limite` pasos devuelve None.
+    """
+    limite = limite or 4 * m
+    potencia = largo = 1
+    tortuga = seed % m
+    liebre = (a * tortuga + c) % m
+    pasos = 1
+    while tortuga != liebre:
+        if potencia == largo:
+            tortuga = liebre
+            potencia *= 2
+            largo = 0
+        liebre = (a * liebre + c) % m
+        largo += 1
+        pasos += 1
+        if pasos > limite:
+            return None
+    tortuga = liebre = seed % m
+    for _ in range(largo):
+        liebre = (a * liebre + c) % m
+    inicio = 0
+    while tortuga != liebre:
+        tortuga = (a * tortuga + c) % m
+        liebre = (a * liebre + c) % m
+        inicio += 1
+    return largo, inicio
+
+def periodo_maximo(c, m):
+    """Mayor período posible para un generador con ese tipo de incremento y módulo."""
+    if c % m:
+        return m
+    return _carmichael(factorizar(m))
+
+def periodo(a, c, m, seed=1):
+    """
+    Período de la secuencia que empieza en `seed`.
+
+    Retorna:
+    tuple: (período o None si no se pudo calcular, método: "hull_dobell", "raiz_primitiva",
+           "orden_multiplicativo", "brent" o "desconocido")
+    """
+    if c % m and cumple_hull_dobell(a, c, m):
+        return m, "hull_dobell"
+    if c % m == 0 and seed % m:
+        # x_n = seed * a^n: el período es el orden de a módulo m / mcd(seed, m)
+        modulo = m // math.gcd(seed, m)
+        orden = orden_multiplicativo(a, modulo)
+        if orden is not None:
+            return orden, "raiz_primitiva" if es_primo(m) else "orden_multiplicativo"
+    if m <= LIMITE_BRENT:
+        resultado = periodo_brent(a, c, m, seed)
+        if resultado is not None:
+            return resultado[0], "brent"
+    return None, "desconocido"
+
+# --- Prueba espectral ---
+
+def _producto(u, v):
+    return sum(x * y for x, y in zip(u, v))
+
+def _gram_schmidt(base):
+    """Vectores ortogonalizados (normas al cuadrado) y coeficientes μ, en aritmética exacta."""
+    ortogonales, normas, mu = [], [], [[Fraction(0)] * len(base) for _ in base]
+    for i, b in enumerate(base):
+        v = [Fraction(x) for x in b]
+        for j in range(i):
+            mu[i][j] = _producto(b, ortogonales[j]) / normas[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, ortogonales[j])]
+        ortogonales.append(v)
+        normas.append(_producto(v, v))
+    return normas, mu
+
+def reducir_lll(base, delta=Fraction(3, 4)):
+    """
+    Reducción LLL de una base entera (lista de filas), con fracciones para que sea exacta aunque
+    las coordenadas sean del orden de m (hasta 2^64). La reducción de tamaño actualiza los μ sin cambiar
+    los vectores ortogonalizados; para dimensiones chicas (t <= 6) alcanza con recalcular Gram-Schmidt
+    después de cada intercambio.
+    """
+    base = [list(b) for b in base]
+    normas, mu = _gram_schmidt(base)
+    k = 1
+    while k < len(base):
+        for j in range(k - 1, -1, -1):
+            q = round(mu[k][j])
+            if q:
+                base[k] = [x - q * y for x, y in zip(base[k], base[j])]
+                for i in range(j):
+                    mu[k][i] -= q * mu[j][i]
+                mu[k][j] -= q
+        if normas[k] >= (delta - mu[k][k - 1] ** 2) * normas[k - 1]:
+            k += 1
+        else:
+            base[k], base[k - 1] = base[k - 1], base[k]
+            normas, mu = _gram_schmidt(base)
+            k = max(k - 1, 1)
+    return base
+
+def vector_mas_corto(base):
+    """
+    Norma al cuadrado del vector no nulo más corto de la red (entera): LLL y después enumeración de
+    Fincke-Pohst sobre la base reducida. Las cotas se calculan en float; las normas candidatas, con enteros.
+    """
+    base = reducir_lll(base)
+    mejor = min(_producto(b, b) for b in base)
+    normas, mu = _gram_schmidt(base)
+    normas = [float(x) for x in normas]
+    mu = [[float(x) for x in fila] for fila in mu]
+    t = len(base)
+    x = [0] * t
+
+    def enumerar(i, parcial):
+        nonlocal mejor
+        centro = -sum(x[j] * mu[j][i] for j in range(i + 1, t))
+        radio = math.sqrt(max(mejor * (1 + 1e-9) + 1 - parcial, 0) / normas[i])
+        for xi in range(math.ceil(centro - radio), math.floor(centro + radio) + 1):
+            x[i] = xi
+            distancia = parcial + (xi - centro) ** 2 * normas[i]
+            if distancia > mejor * (1 + 1e-9) + 1:
+                continue
+            if i > 0:
+                enumerar(i - 1, distancia)
+            elif any(x):
+                vector = [sum(x[j] * base[j][col] for j in range(t)) for col in range(t)]
+                mejor = min(mejor, _producto(vector, vector))
+        x[i] = 0
+
+    enumerar(t - 1, 0.0)
+    return mejor
+
+def modulo_espectral(a, c, m):
+    """
+    Módulo de la red de puntos: m, salvo los multiplicativos con m potencia de 2, cuya secuencia
+    (semilla impar) vive en una red de módulo m / 4.
+    """
+    if c % m == 0 and m & (m - 1) == 0 and m >= 16:
+        return m // 4
+    return m
+
+def prueba_espectral(a, c, m, dimensiones=DIMENSIONES):
+    """
+    Prueba espectral: para cada dimensión t, S_t = ν_t / (γ_t^(1/2) m^(1/t)), donde ν_t es la norma
+    del vector más corto de la red dual {u : u_1 + a u_2 + ... + a^(t-1) u_t ≡ 0 (mod m)}
+    (1 / ν_t es la distancia máxima entre hiperplanos que cubren los puntos).
+
+    Retorna:
+    dict: t -> S_t
+    """
+    m = modulo_espectral(a, c, m)
+    resultado = {}
+    for t in dimensiones:
+        base = [[m] + [0] * (t - 1)]
+        for i in range(1, t):
+            fila = [0] * t
+            fila[0] = -pow(a, i, m)
+            fila[i] = 1
+            base.append(fila)
+        nu = math.sqrt(vector_mas_corto(base))
+        resultado[t] = nu / (math.sqrt(HERMITE[t]) * m ** (1 / t))
+    return resultado
+
+# --- Pruebas estadísticas sobre secuencias de muestra ---
+
+def semillas_de_muestra(c, m, cantidad, rng):
+    """Semillas al azar en [1, m); para los multiplicativos, coprimas con m (si no, el período se acorta)."""
+    semillas = []
+    while len(semillas) < cantidad:
+        semilla = rng.randrange(1, m)
+        if c % m == 0 and math.gcd(semilla, m) != 1:
+            continue
+        semillas.append(semilla)
+    return semillas
+
+def tasas_aprobacion(a, c, m, secuencias=50, n=1000, alpha=0.05, pruebas=TODAS_LAS_PRUEBAS, semilla=0):
+    """
+    Genera `secuencias` secuencias de n números (cuantizados) desde semillas al azar y aplica las pruebas.
+
+    Retorna:
+    dict: "todas" -> fracción de secuencias que pasan todas las pruebas, y prueba -> fracción que la pasa.
+    """
+    semillas = semillas_de_muestra(c, m, secuencias, random.Random(semilla))
+    numeros = generador_nros_cuantizados_por_semilla(semillas, a, c, m, n)
+    aprobadas = {prueba: 0 for prueba in pruebas}
+    todas = 0
+    for fila in numeros:
+        resultados = decidir_pruebas(estadisticos_suficientes(fila, pruebas=pruebas), alpha, pruebas=pruebas)
+        for prueba, resultado in resultados.items():
+            aprobadas[prueba] += bool(resultado)
+        todas += all(resultados.values())
+    tasas = {"todas": todas / secuencias}
+    tasas.update({prueba: cantidad / secuencias for prueba, cantidad in aprobadas.items()})
+    return tasas
+
+# --- Evaluación y ranking ---
+
+def evaluar_candidato(argumentos):
+    """
+    Trabajo de un proceso: evalúa una terna (a, c, m).
+
+    Parámetros:
+    argumentos (tuple): (a, c, m, opciones) con opciones = dict(secuencias, n, alpha, pruebas, semilla)
+
+    Retorna:
+    dict: una fila de la tabla (ver COLUMNAS).
+    """
+    a, c, m, opciones = argumentos
+    inicio = time.perf_counter()
+    largo, metodo = periodo(a, c, m)
+    espectral = prueba_espectral(a, c, m)
+    tasas = tasas_aprobacion(a, c, m, opciones["secuencias"], opciones["n"], opciones["alpha"], opciones["pruebas"],
+                             opciones["semilla"])
+    fila = {
+        "a": a, "c": c, "m": m,
+        "multiplicacion": metodo_multiplicacion(a, c, m),
+        "periodo": largo,
+        "metodo_periodo": metodo,
+        "periodo_completo": largo == periodo_maximo(c, m),
+        "merito": min(espectral.values()),
+    }
+    fila.update({f"s{t}": valor for t, valor in espectral.items()})
+    fila["tasa_aprobacion"] = tasas.pop("todas")
+    fila.update({f"tasa_{prueba}": valor for prueba, valor in tasas.items()})
+    fila["segundos"] = time.perf_counter() - inicio
+    return fila
+
+def clave_ranking(fila):
+    """Primero las de período completo, después por figura de mérito y por tasa de aprobación."""
+    return (not fila["periodo_completo"], -fila["merito"], -fila["tasa_aprobacion"])
+
+def interpretar_entero(texto):
+    """Entero escrito como '2147483647', '2^31-1', '2**48' o '2^64'."""
+    coincidencia = re.fullmatch(r"\s*(\d+)\s*(?:\^|\*\*)\s*(\d+)\s*(?:([+-])\s*(\d+))?\s*", texto)
+    if not coincidencia:
+        return int(texto)
+    base, exponente, signo, desplazamiento = coincidencia.groups()
+    valor = int(base) ** int(exponente)
+    if signo:
+        valor += int(desplazamiento) if signo == "+" else -int(desplazamiento)
+    return valor
+
+def generar_candidatos(modulos, cantidad, incremento="mixto", rng=None):
+    """
+    Ternas al azar para cada módulo.
+
+    Parámetros:
+    modulos (list): Módulos m.
+    cantidad (int): Ternas por módulo.
+    incremento (str | int): "mixto" (c coprimo con m y a que cumple Hull-Dobell, período m),
+      0 (multiplicativo: a al azar, invertible módulo m) o un c fijo (a que cumple Hull-Dobell si se puede;
+      con m primo ningún a > 1 lo cumple y a se elige al azar).
+    rng (random.Random): Generador para elegir los parámetros.
+    """
+    rng = rng or random.Random(0)
+    candidatos = []
+    for m in modulos:
+        radical = math.prod(factorizar(m))
+        paso_a = radical * 4 // math.gcd(radical, 4) if m % 4 == 0 else radical
+        vistos = set()
+        for _ in range(cantidad * 20):
+            if len(vistos) == cantidad:
+                break
+            if incremento == 0 or incremento == "0":
+                c = 0
+                a = rng.randrange(2, m)
+                if math.gcd(a, m) != 1:
+                    continue
+            else:
+                if incremento == "mixto":
+                    c = rng.randrange(1, m)
+                    if math.gcd(c, m) != 1:
+                        continue
+                else:
+                    c = int(incremento) % m
+                if paso_a < m - 1:
+                    # a ≡ 1 (mod rad(m)) y (mod 4 si 4 | m); se descarta a = 1
+                    a = 1 + paso_a * rng.randrange(1, max(2, (m - 1) // paso_a))
+                else:
+                    # m primo (o sin factores repetidos): Hull-Dobell solo lo cumple a = 1
+                    a = rng.randrange(2, m)
+            if (a, c) not in vistos:
+                vistos.add((a, c))
+                candidatos.append((a, c, m))
+    return candidatos
+
+COLUMNAS = (["a", "c", "m", "multiplicacion", "periodo", "metodo_periodo", "periodo_completo", "merito"]
+            + [f"s{t}" for t in DIMENSIONES] + ["tasa_aprobacion"])
+
+def explorar(candidatos, workers=None, secuencias=50, n=1000, alpha=0.05, pruebas=TODAS_LAS_PRUEBAS, semilla=0):
+    """
+    Evalúa las ternas en paralelo y devuelve las filas ordenadas (ver clave_ranking).
+    """
+    opciones = {"secuencias": secuencias, "n": n, "alpha": alpha, "pruebas": tuple(pruebas), "semilla": semilla}
+    trabajos = [(a, c, m, opciones) for a, c, m in candidatos]
+    workers = workers or multiprocessing.cpu_count()
+    if workers == 1:
+        filas = [evaluar_candidato(trabajo) for trabajo in trabajos]
+    else:
+        with multiprocessing.Pool(processes=workers) as pool:
+            filas = list(pool.imap_unordered(evaluar_candidato, trabajos, chunksize=max(1, len(trabajos) // (8 * workers))))
+    return sorted(filas, key=clave_ranking)
+
+def guardar_csv(filas, nombre_archivo):
+    """Guarda la tabla ordenada, con el puesto de cada terna."""
+    columnas = ["puesto"] + list(filas[0].keys()) if filas else ["puesto"] + COLUMNAS
+    with open(nombre_archivo, "w", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas)
+        escritor.writeheader()
+        for puesto, fila in enumerate(filas, start=1):
+            escritor.writerow(dict(fila, puesto=puesto))
+
+def mostrar_tabla(filas, cantidad=20):
+    print(f"{'#':>4} {'a':>22} {'c':>22} {'m':>22} {'mult.':>14} {'período':>10} {'mérito':>7} "
+          + " ".join(f"{f's{t}':>6}" for t in DIMENSIONES) + f" {'aprob.':>7}")
+    for puesto, fila in enumerate(filas[:cantidad], start=1):
+        largo = "?" if fila["periodo"] is None else f"2^{math.log2(fila['periodo']):.2f}"
+        marca = "" if fila["periodo_completo"] else "*"
+        print(f"{puesto:>4} {fila['a']:>22} {fila['c']:>22} {fila['m']:>22} {fila['multiplicacion']:>14} "
+              f"{largo + marca:>10} {fila['merito']:>7.4f} " + " ".join(f"{fila[f's{t}']:>6.3f}" for t in DIMENSIONES)
+              + f" {fila['tasa_aprobacion']:>7.2%}")
+    print("* período menor que el máximo posible para ese módulo")
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Explora ternas (a, c, m) del generador congruencial y las ordena.")
+    parser.add_argument("--modulos", default="2^31-1,2^32,2^48,2^64",
+                        help="Módulos separados por comas (por ejemplo 2^31-1,2^48).")
+    parser.add_argument("--cantidad", type=int, default=200, help="Ternas al azar por módulo.")
+    parser.add_argument("--incremento", default="mixto", help="'mixto' (c coprimo con m), 0 (multiplicativo) o un c fijo.")
+    parser.add_argument("--secuencias", type=int, default=50, help="Secuencias de muestra por terna para las pruebas.")
+    parser.add_argument("--n", type=int, default=1000, help="Números por secuencia de muestra.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia de las pruebas.")
+    parser.add_argument("--pruebas", default="todas", help="Pruebas separadas por comas, o 'todas'.")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos (por defecto, todos los núcleos).")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla para elegir las ternas y las secuencias de muestra.")
+    parser.add_argument("--sin-referencias", action="store_true", help="No agrega las ternas conocidas de REFERENCIAS.")
+    parser.add_argument("--salida", default="ranking_parametros.csv", help="Archivo CSV con la tabla ordenada.")
+    parser.add_argument("--mostrar", type=int, default=20, help="Filas de la tabla que se muestran.")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        pruebas = TODAS_LAS_PRUEBAS if args.pruebas == "todas" else validar_pruebas(args.pruebas.split(","))
+    except ValueError as e:
+        parser.error(str(e))
+    modulos = [interpretar_entero(texto) for texto in args.modulos.split(",")]
+    candidatos = generar_candidatos(modulos, args.cantidad, args.incremento, random.Random(args.seed))
+    if not args.sin_referencias:
+        candidatos = list(REFERENCIAS) + [terna for terna in candidatos if terna not in REFERENCIAS]
+
+    print(f"Evaluando {len(candidatos)} ternas ({args.secuencias} secuencias de {args.n} números cada una)...")
+    inicio = time.perf_counter()
+    filas = explorar(candidatos, args.workers, args.secuencias, args.n, args.alpha, pruebas, args.seed)
+    print(f"Listo en {time.perf_counter() - inicio:.1f} s\n")
+    mostrar_tabla(filas, args.mostrar)
+    guardar_csv(filas, args.salida)
+    print(f"\nTabla completa guardada en '{args.salida}'.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,17 @@
 # Generador de números aleatorios
 # Descripción: Este script implementa un generador de números aleatorios utilizando el método congruencial mixto.
 
+import os
+import struct
+
+import numpy as np
+try:
+    from nros_aleatorios.generador_congruencial_np import (estados_secuencia, cuantizados_desde_estados, cuantizar_4,
+                                                           flotantes_desde_cuantizados, es_cuantizado)
+except ImportError:  # ejecutado como script desde la carpeta nros_aleatorios
+    from generador_congruencial_np import (estados_secuencia, cuantizados_desde_estados, cuantizar_4,
+                                           flotantes_desde_cuantizados, es_cuantizado)
+
 def generador_nros_aleatorios(seed, a, c, m, n):
     """
     Genera una lista de números aleatorios utilizando el método congruencial mixto.
@@ -54,6 +65,149 @@ def guardar_nros_aleatorios_en_csv(numeros_aleatorios, nombre_archivo):
         for numero in numeros_aleatorios:
             f.write(f"{numero}\n")
 
+# --- Formato binario ---
+# Encabezado de 128 bytes seguido de los números empaquetados:
+#   magic (8 bytes) | versión (uint32) | tipo ('H' uint16 cuantizado o 'd' float64, 1 byte) |
+#   estado conocido (1 byte) | relleno (2 bytes)
+#   a, c, m, semilla, último estado (enteros sin signo de 16 bytes, little-endian) | cantidad (uint64)
+# Los cuantizados guardan k = número * 10^4 (ver generador_congruencial_np), 2 bytes por número.
+# El último estado permite seguir la secuencia al agregar más números al final del archivo; solo vale si
+# el byte de estado conocido es 1 (en la versión 1, que no lo tenía, el estado 0 indicaba desconocido).
+MAGIC_BINARIO = b"NROSLCG\0"
+VERSION_BINARIO = 2
+TAMANO_ENCABEZADO = 128
+EXTENSION_BINARIA = ".lcg"
+_FORMATO_ENCABEZADO = "<8sIc?2x16s16s16s16s16sQ"
+_TIPOS_BINARIOS = {b"H": np.dtype("<u2"), b"d": np.dtype("<f8")}
+
+def _empaquetar_encabezado(encabezado):
+    entero = lambda valor: int(valor).to_bytes(16, "little")
+    datos = struct.pack(_FORMATO_ENCABEZADO, MAGIC_BINARIO, VERSION_BINARIO, encabezado["tipo"], encabezado["estado_conocido"],
+                        entero(encabezado["a"]), entero(encabezado["c"]), entero(encabezado["m"]),
+                        entero(encabezado["semilla"]), entero(encabezado["ultimo_estado"]), encabezado["cantidad"])
+    return datos.ljust(TAMANO_ENCABEZADO, b"\0")
+
+def leer_encabezado_binario(nombre_archivo):
+    """
+    Lee el encabezado de un archivo binario de números.
+
+    Retorna:
+    dict: a, c, m, semilla, ultimo_estado, estado_conocido, cantidad y tipo (b"H" o b"d").
+    """
+    with open(nombre_archivo, "rb") as f:
+        datos = f.read(TAMANO_ENCABEZADO)
+    if len(datos) < TAMANO_ENCABEZADO or not datos.startswith(MAGIC_BINARIO):
+        raise ValueError(f"'{nombre_archivo}' no es un archivo binario de números aleatorios")
+    _, version, tipo, estado_conocido, a, c, m, semilla, ultimo_estado, cantidad = struct.unpack(
+        _FORMATO_ENCABEZADO, datos[:struct.calcsize(_FORMATO_ENCABEZADO)])
+    if version not in (1, VERSION_BINARIO):
+        raise ValueError(f"Versión de archivo binario no soportada: {version}")
+    entero = lambda valor: int.from_bytes(valor, "little")
+    if version == 1:
+        estado_conocido = entero(ultimo_estado) != 0
+    return {"a": entero(a), "c": entero(c), "m": entero(m), "semilla": entero(semilla),
+            "ultimo_estado": entero(ultimo_estado), "estado_conocido": bool(estado_conocido),
+            "cantidad": cantidad, "tipo": tipo}
+
+def guardar_nros_aleatorios_binario(numeros_aleatorios, nombre_archivo, a, c, m, seed, ultimo_estado=None, agregar=False):
+    """
+    Guarda los números en formato binario (ver el encabezado más arriba) con una sola escritura.
+
+    Parámetros:
+    numeros_aleatorios (list | np.ndarray): Números entre 0 y 1, o cuantizados (uint16).
+      Si todos tienen a lo sumo 4 decimales (la salida del generador) se guardan como uint16; si no, como float64.
+    nombre_archivo (str): Archivo de destino.
+    a, c, m, seed (int): Parámetros del generador con que se produjeron los números.
+    ultimo_estado (int): Último x_n generado, para poder continuar la secuencia con generar_archivo_binario.
+      Por defecto, desconocido: el archivo no se puede continuar.
+    agregar (bool): Si es True y el archivo existe, agrega los números al final y actualiza el encabezado.
+      Los parámetros del generador deben coincidir con los del archivo. Si no se pasa ultimo_estado,
+      el estado del archivo queda desconocido.
+    """
+    if es_cuantizado(numeros_aleatorios):
+        datos, tipo = numeros_aleatorios, b"H"
+    else:
+        flotantes = np.asarray(numeros_aleatorios, dtype=np.float64)
+        datos = cuantizar_4(flotantes)
+        tipo = b"H"
+        if not np.array_equal(flotantes_desde_cuantizados(datos), flotantes):
+            datos, tipo = flotantes, b"d"
+
+    if agregar and os.path.exists(nombre_archivo):
+        encabezado = leer_encabezado_binario(nombre_archivo)
+        if (encabezado["a"], encabezado["c"], encabezado["m"]) != (a, c, m):
+            raise ValueError("Los parámetros del generador no coinciden con los del archivo")
+        if encabezado["tipo"] != tipo:
+            # Se respeta el tipo del archivo; un float64 con 4 decimales se puede guardar cuantizado y viceversa
+            if encabezado["tipo"] == b"H":
+                raise ValueError("El archivo guarda números cuantizados y los nuevos tienen más de 4 decimales")
+            datos, tipo = flotantes_desde_cuantizados(datos), b"d"
+        encabezado["cantidad"] += len(datos)
+        encabezado["ultimo_estado"] = ultimo_estado or 0
+        encabezado["estado_conocido"] = ultimo_estado is not None
+        with open(nombre_archivo, "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            f.write(np.ascontiguousarray(datos, dtype=_TIPOS_BINARIOS[tipo]).tobytes())
+            f.seek(0)
+            f.write(_empaquetar_encabezado(encabezado))
+        return
+
+    encabezado = {"a": a, "c": c, "m": m, "semilla": seed, "ultimo_estado": ultimo_estado or 0,
+                  "estado_conocido": ultimo_estado is not None, "cantidad": len(datos), "tipo": tipo}
+    with open(nombre_archivo, "wb") as f:
+        f.write(_empaquetar_encabezado(encabezado) + np.ascontiguousarray(datos, dtype=_TIPOS_BINARIOS[tipo]).tobytes())
+
+def leer_nros_aleatorios_binario(nombre_archivo, mmap=True):
+    """
+    Lee un archivo binario de números.
+
+    Parámetros:
+    nombre_archivo (str): Archivo a leer.
+    mmap (bool): Si es True devuelve un np.memmap (los datos se leen del disco a medida que se usan).
+
+    Retorna:
+    tuple: (encabezado (dict), numeros (np.ndarray uint16 cuantizado o float64))
+    """
+    encabezado = leer_encabezado_binario(nombre_archivo)
+    tipo = _TIPOS_BINARIOS[encabezado["tipo"]]
+    if encabezado["cantidad"] == 0:
+        return encabezado, np.empty(0, dtype=tipo)
+    if mmap:
+        numeros = np.memmap(nombre_archivo, dtype=tipo, mode="r", offset=TAMANO_ENCABEZADO, shape=(encabezado["cantidad"],))
+    else:
+        numeros = np.fromfile(nombre_archivo, dtype=tipo, count=encabezado["cantidad"], offset=TAMANO_ENCABEZADO)
+    return encabezado, numeros
+
+def generar_archivo_binario(nombre_archivo, seed, a, c, m, n, tamano_bloque=10_000_000):
+    """
+    Genera n números con el generador vectorizado y los guarda en formato binario por bloques,
+    así la memoria usada no depende de n. Si el archivo ya existe con los mismos parámetros y semilla,
+    continúa la secuencia desde su último estado y agrega los números al final. Un archivo cuyo último
+    estado no se guardó (por ejemplo, uno de guardar_nros_aleatorios_binario sin ultimo_estado) no se
+    puede continuar.
+
+    Retorna:
+    dict: Encabezado final del archivo.
+    """
+    if os.path.exists(nombre_archivo):
+        encabezado = leer_encabezado_binario(nombre_archivo)
+        if (encabezado["a"], encabezado["c"], encabezado["m"]) != (a, c, m):
+            raise ValueError("Los parámetros del generador no coinciden con los del archivo")
+        if encabezado["semilla"] != seed:
+            raise ValueError(f"La semilla {seed} no coincide con la del archivo ({encabezado['semilla']})")
+        if not encabezado["estado_conocido"]:
+            raise ValueError(f"'{nombre_archivo}' no guarda su último estado: no se puede continuar la secuencia")
+        x = encabezado["ultimo_estado"]
+    else:
+        x = seed
+        guardar_nros_aleatorios_binario(np.empty(0, dtype=np.uint16), nombre_archivo, a, c, m, seed, ultimo_estado=seed)
+    for inicio in range(0, n, tamano_bloque):
+        estados = estados_secuencia(x, a, c, m, min(tamano_bloque, n - inicio))
+        x = int(estados[-1])
+        guardar_nros_aleatorios_binario(cuantizados_desde_estados(estados, m), nombre_archivo, a, c, m, seed,
+                                        ultimo_estado=x, agregar=True)
+    return leer_encabezado_binario(nombre_archivo)
+
 # Ejemplo de uso
 if __name__ == "__main__":
     # Parámetros del generador
@@ -0,0 +1,188 @@
+# Generador congruencial vectorizado
+# Descripción: Versión NumPy del método congruencial mixto. Da exactamente los mismos números que
+# generador_nros_aleatorios (generador_congruencial_mixto.py) pero sin enteros de Python en el bucle.
+#
+# El producto a * x no entra en int64 para cualquier (a, m), así que la multiplicación modular
+# se elige según los parámetros:
+#   - directa:  a * (m - 1) + c < 2^63, se calcula (a * x + c) % m en int64.
+#   - Schrage:  m % a < m // a, se descompone m = a * q + r y se evita el desborde.
+#   - potencia de 2: m = 2^k (k <= 64), se multiplica en uint64 (desborde = mod 2^64) y se enmascara.
+#   - por bytes: m < 2^54, se multiplica x por cada byte de a (Horner en base 256) reduciendo en cada paso.
+#   - enteros de Python: cualquier otro caso (m >= 2^54 que no es potencia de 2).
+#
+# Una sola secuencia es secuencial por definición; para vectorizarla se parte en "carriles":
+# el estado inicial de cada carril se obtiene saltando hacia adelante (a^B, c * (a^B - 1) / (a - 1))
+# y luego todos los carriles avanzan B pasos a la vez.
+
+import math
+
+import numpy as np
+
+_LIMITE_INT64 = 2**63
+
+def _multiplicacion_modular(a, c, m):
+    """
+    Devuelve una función paso(x) que calcula (a * x + c) % m para un array de estados x en [0, m).
+    """
+    if a * (m - 1) + c < _LIMITE_INT64:
+        def paso(x):
+            return (a * x + c) % m
+        return paso, np.int64
+
+    if m & (m - 1) == 0 and m <= 2**64:
+        mascara = np.uint64(m - 1)
+        a_u, c_u = np.uint64(a % 2**64), np.uint64(c % 2**64)
+        def paso(x):
+            return (a_u * x + c_u) & mascara
+        return paso, np.uint64
+
+    q, r = divmod(m, a)
+    if r < q and m + c < _LIMITE_INT64:
+        def paso(x):
+            t = a * (x % q) - r * (x // q)
+            t += m * (t < 0)
+            t += c
+            return t - m * (t >= m)
+        return paso, np.int64
+
+    if m * 511 < _LIMITE_INT64:
+        # a * x = sum(byte_i * 256^i) * x: Horner en base 256, cada término < 256 * m + 255 * m
+        bytes_a = list(a.to_bytes((a.bit_length() + 7) // 8 or 1, "big"))
+        def paso(x):
+            resultado = np.zeros_like(x)
+            for byte in bytes_a:
+                resultado = (resultado * 256 + byte * x) % m
+            return (resultado + c) % m
+        return paso, np.int64
+
+    def paso(x):
+        return (a * x + c) % m
+    return paso, object
+
+def metodo_multiplicacion(a, c, m):
+    """Nombre del método de multiplicación modular que se usa para (a, c, m)."""
+    if a * (m - 1) + c < _LIMITE_INT64:
+        return "directa"
+    if m & (m - 1) == 0 and m <= 2**64:
+        return "potencia_de_2"
+    q, r = divmod(m, a)
+    if r < q and m + c < _LIMITE_INT64:
+        return "schrage"
+    if m * 511 < _LIMITE_INT64:
+        return "por_bytes"
+    return "enteros_python"
+
+def salto_adelante(a, c, m, k):
+    """
+    Coeficientes (A, C) tales que x_{n+k} = (A * x_n + C) % m.
+    """
+    A, C = 1, 0
+    potencia_a, potencia_c = a % m, c % m
+    while k:
+        if k & 1:
+            A, C = (A * potencia_a) % m, (C * potencia_a + potencia_c) % m
+        potencia_c = (potencia_c * (potencia_a + 1)) % m
+        potencia_a = (potencia_a * potencia_a) % m
+        k >>= 1
+    return A, C
+
+def estados_congruenciales(semillas, a, c, m, n):
+    """
+    Avanza varias semillas a la vez: devuelve un array (S, n) con x_1..x_n de cada semilla.
+
+    Parámetros:
+    semillas (array-like de int): S semillas en [0, m).
+    a, c, m (int): Parámetros del generador.
+    n (int): Pasos por semilla.
+    """
+    paso, tipo = _multiplicacion_modular(a, c, m)
+    # Sin pasar por np.ravel: una lista de enteros mayores que 2^63 se convertiría a float64
+    x = np.array([int(s) for s in np.asarray(semillas, dtype=object).reshape(-1)], dtype=tipo)
+    estados = np.empty((n, x.size), dtype=tipo)
+    for i in range(n):
+        x = paso(x)
+        estados[i] = x
+    return estados.T
+
+def estados_secuencia(seed, a, c, m, n, carriles=None):
+    """
+    Devuelve los estados x_1..x_n de una sola secuencia, calculados por carriles en paralelo.
+    """
+    if n <= 0:
+        return np.empty(0, dtype=_multiplicacion_modular(a, c, m)[1])
+    if carriles is None:
+        carriles = min(n, max(1, 4 * math.isqrt(n)))
+    largo = -(-n // carriles)
+    A, C = salto_adelante(a, c, m, largo)
+    # x_0 de cada carril: la semilla y luego saltos de `largo` pasos
+    inicios = [seed % m]
+    for _ in range(carriles - 1):
+        inicios.append((A * inicios[-1] + C) % m)
+    return estados_congruenciales(inicios, a, c, m, largo).reshape(-1)[:n]
+
+def cuantizar_4(valores):
+    """
+    Devuelve round(v, 4) * 10^4 como enteros uint16 (0..10000; 10000 corresponde a 1.0).
+    numpy redondea v * 10^4, que puede diferir de round() de Python en los casos muy cercanos a ...5;
+    esos pocos casos se recalculan con round().
+    """
+    escalados = valores * 10000.0
+    cuantizados = np.rint(escalados)
+    dudosos = np.flatnonzero(np.abs(escalados - np.floor(escalados) - 0.5) < 1e-6)
+    # flatnonzero da índices planos: con arrays (S, n) se usa .flat
+    for i in dudosos:
+        cuantizados.flat[i] = round(round(float(valores.flat[i]), 4) * 10000)
+    return cuantizados.astype(np.uint16)
+
+def flotantes_desde_cuantizados(cuantizados):
+    """
+    Vista float64 de números cuantizados: k / 10^4 es exactamente round(v, 4) de la versión de referencia.
+    Se calcula solo cuando alguien la pide; los cuantizados ocupan 2 bytes por número en lugar de 8.
+    """
+    return cuantizados / 10000.0
+
+def redondear_4(valores):
+    """round(v, 4) de Python sobre un array de float64, con el mismo resultado bit a bit."""
+    return flotantes_desde_cuantizados(cuantizar_4(valores))
+
+def _cocientes(estados, m):
+    if m < 2**53 and estados.dtype != object:
+        # x y m son exactos en float64, así que x / m es la misma división correctamente redondeada de Python
+        return estados.astype(np.float64) / float(m)
+    return np.array([int(x) / m for x in np.ravel(estados)], dtype=np.float64).reshape(estados.shape)
+
+def uniformes_desde_estados(estados, m):
+    """Convierte estados en números [0, 1) redondeados a 4 decimales, igual que el generador de referencia."""
+    return redondear_4(_cocientes(estados, m))
+
+def cuantizados_desde_estados(estados, m):
+    """Convierte estados en números cuantizados uint16 (ver cuantizar_4)."""
+    return cuantizar_4(_cocientes(estados, m))
+
+def generador_nros_aleatorios_np(seed, a, c, m, n):
+    """
+    Versión vectorizada de generador_nros_aleatorios: devuelve un np.ndarray float64 con los
+    mismos n números.
+    """
+    return uniformes_desde_estados(estados_secuencia(seed, a, c, m, n), m)
+
+def generador_nros_aleatorios_por_semilla(semillas, a, c, m, n):
+    """
+    Genera n números para cada semilla: array (S, n), fila i == generador_nros_aleatorios(semillas[i], a, c, m, n).
+    """
+    return uniformes_desde_estados(estados_congruenciales(semillas, a, c, m, n), m)
+
+def generador_nros_cuantizados(seed, a, c, m, n):
+    """
+    Igual que generador_nros_aleatorios_np pero devuelve los 4 dígitos como uint16:
+    k = round(x / m, 4) * 10^4. Usar flotantes_desde_cuantizados para obtener los floats.
+    """
+    return cuantizados_desde_estados(estados_secuencia(seed, a, c, m, n), m)
+
+def generador_nros_cuantizados_por_semilla(semillas, a, c, m, n):
+    """Versión cuantizada (uint16, (S, n)) de generador_nros_aleatorios_por_semilla."""
+    return cuantizados_desde_estados(estados_congruenciales(semillas, a, c, m, n), m)
+
+def es_cuantizado(numeros):
+    """True si `numeros` es un array de enteros cuantizados (ver generador_nros_cuantizados)."""
+    return isinstance(numeros, np.ndarray) and numeros.dtype == np.uint16
@@ -0,0 +1,160 @@
+# Motores de números aleatorios
+# Descripción: Registro de generadores ("motores") que producen el stream uniforme de la simulación.
+# Todos comparten la misma interfaz, así que simulador.py y campania.py pueden cambiar de motor por nombre:
+#   - generar(semilla, n): devuelve n números cuantizados (np.ndarray uint16, k = número * 10^4, ver
+#     generador_congruencial_np), el formato que usan las pruebas y las tablas de demanda.
+#   - semilla(rng): elige la semilla de un conjunto nuevo a partir de un random.Random.
+#
+# El motor "congruencial" es el método de referencia de la materia (a = 16807, c = 0, m = 2^31 - 1) y da
+# los mismos números que generador_nros_aleatorios. Los demás son alternativas más rápidas o de mejor
+# calidad; sus uniformes también se redondean a 4 decimales para que el resto del proyecto no cambie.
+#
+# xorshift y MRG32k3a son secuenciales por definición: igual que estados_secuencia, la secuencia se arma
+# con varios carriles independientes (cada uno con su propio estado inicial, derivado de la semilla con
+# np.random.SeedSequence) que avanzan todos a la vez. El resultado depende solo de (semilla, n).
+
+import math
+import random
+
+import numpy as np
+try:
+    from nros_aleatorios.generador_congruencial_np import (generador_nros_cuantizados, cuantizar_4,
+                                                           flotantes_desde_cuantizados)
+except ImportError:  # ejecutado como script desde la carpeta nros_aleatorios
+    from generador_congruencial_np import generador_nros_cuantizados, cuantizar_4, flotantes_desde_cuantizados
+
+# nombre -> {"generar": función(semilla, n), "semilla": función(rng), "descripcion": str}
+MOTORES = {}
+
+MOTOR_POR_DEFECTO = "congruencial"
+
+# Parámetros del generador congruencial usados en todo el proyecto
+A, C, M = 16807, 0, 2**31 - 1
+
+def _semilla_64_bits(rng):
+    return rng.getrandbits(64)
+
+def registrar_motor(nombre, descripcion="", semilla=_semilla_64_bits):
+    """
+    Decorador para registrar la función generar(semilla, n) de un motor.
+
+    Args:
+        nombre (str): Nombre con el que se elige el motor (por ejemplo, --motor en campania.py).
+        descripcion (str): Texto corto para la ayuda de la línea de comandos.
+        semilla (callable): Función(rng) que elige la semilla de un conjunto nuevo. Por defecto, 64 bits al azar.
+    """
+    def decorador(funcion):
+        MOTORES[nombre] = {"generar": funcion, "semilla": semilla, "descripcion": descripcion}
+        return funcion
+    return decorador
+
+def validar_motor(nombre):
+    """Devuelve el motor registrado con ese nombre o lanza ValueError."""
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor desconocido: {nombre}. Opciones: {', '.join(MOTORES)}")
+    return MOTORES[nombre]
+
+def nueva_semilla(nombre, rng=None):
+    """Semilla para un conjunto nuevo del motor, elegida con `rng` (por defecto, el módulo random)."""
+    return validar_motor(nombre)["semilla"](rng or random)
+
+def generar_cuantizados(nombre, semilla, n):
+    """n números del motor como np.ndarray uint16 (k = número * 10^4)."""
+    return validar_motor(nombre)["generar"](semilla, n)
+
+def generar_uniformes(nombre, semilla, n):
+    """n números del motor como np.ndarray float64 en [0, 1] con 4 decimales."""
+    return flotantes_desde_cuantizados(generar_cuantizados(nombre, semilla, n))
+
+def generar_flujos(nombre, semilla, cantidad, n):
+    """
+    Parte una semilla en `cantidad` flujos de n números: array uint16 (cantidad, n).
+    El flujo i usa la semilla que elige el motor con random.Random(f"{semilla}:{i}"), igual que los
+    bloques de campania.py, así que cada flujo es reproducible por sí solo.
+    """
+    flujos = np.empty((cantidad, n), dtype=np.uint16)
+    for i in range(cantidad):
+        flujos[i] = generar_cuantizados(nombre, nueva_semilla(nombre, random.Random(f"{semilla}:{i}")), n)
+    return flujos
+
+def _carriles(n):
+    # Mismo criterio que estados_secuencia: unos 4 * sqrt(n) carriles de sqrt(n) / 4 pasos
+    return min(n, max(1, 4 * math.isqrt(n)))
+
+def _por_carriles(semilla, n, estados_iniciales, avanzar):
+    """
+    Arma una secuencia de n uniformes con carriles independientes.
+    estados_iniciales(semilla_carriles, carriles) devuelve el estado de todos los carriles y
+    avanzar(estado) devuelve (estado, uniformes de cada carril).
+    """
+    if n <= 0:
+        return np.empty(0, dtype=np.uint16)
+    carriles = _carriles(n)
+    largo = -(-n // carriles)
+    estado = estados_iniciales(np.random.SeedSequence(semilla), carriles)
+    uniformes = np.empty((largo, carriles), dtype=np.float64)
+    for i in range(largo):
+        estado, uniformes[i] = avanzar(estado)
+    # Cada carril es un tramo contiguo de la secuencia
+    return cuantizar_4(uniformes.T.reshape(-1)[:n])
+
+# --- Motores ---
+
+@registrar_motor("congruencial", "método congruencial de referencia (a = 16807, c = 0, m = 2^31 - 1)",
+                 semilla=lambda rng: rng.randint(10000, 99999))
+def generar_congruencial(semilla, n):
+    # Mismos números que generador_nros_aleatorios(semilla, A, C, M, n)
+    return generador_nros_cuantizados(semilla, A, C, M, n)
+
+@registrar_motor("pcg64", "PCG64 de NumPy (np.random.Generator)")
+def generar_pcg64(semilla, n):
+    return cuantizar_4(np.random.Generator(np.random.PCG64(semilla)).random(n))
+
+@registrar_motor("philox", "Philox 4x64 de NumPy, basado en contador")
+def generar_philox(semilla, n):
+    return cuantizar_4(np.random.Generator(np.random.Philox(semilla)).random(n))
+
+def _xorshift_iniciales(semillas, carriles):
+    s = semillas.generate_state(2 * carriles, np.uint64).reshape(2, carriles)
+    # El estado todo en cero es el único prohibido
+    s[0, (s[0] == 0) & (s[1] == 0)] = 1
+    return s[0], s[1]
+
+def _xorshift_paso(estado):
+    s1, s0 = estado
+    resultado = s0 + s1
+    s1 = s1 ^ (s1 << np.uint64(23))
+    s1 = s1 ^ s0 ^ (s1 >> np.uint64(17)) ^ (s0 >> np.uint64(26))
+    # Los 53 bits altos, que son los de mejor calidad, forman la mantisa
+    return (s0, s1), (resultado >> np.uint64(11)) * 2.0**-53
+
+@registrar_motor("xorshift", "xorshift128+ vectorizado por carriles")
+def generar_xorshift(semilla, n):
+    return _por_carriles(semilla, n, _xorshift_iniciales, _xorshift_paso)
+
+# Constantes de MRG32k3a (L'Ecuyer, 1999)
+MRG_M1, MRG_M2 = 4294967087, 4294944443
+MRG_A12, MRG_A13N = 1403580, 810728
+MRG_A21, MRG_A23N = 527612, 1370589
+
+def _mrg32k3a_iniciales(semillas, carriles):
+    s = semillas.generate_state(6 * carriles, np.uint32).astype(np.int64).reshape(6, carriles)
+    s[:3] %= MRG_M1
+    s[3:] %= MRG_M2
+    # Ninguna de las dos componentes puede empezar con sus tres valores en cero
+    for componente in (s[:3], s[3:]):
+        componente[0, ~componente.any(axis=0)] = 1
+    return tuple(s)
+
+def _mrg32k3a_paso(estado):
+    s10, s11, s12, s20, s21, s22 = estado
+    # Los productos son < 2^53, así que entran en int64
+    p1 = (MRG_A12 * s11 - MRG_A13N * s10) % MRG_M1
+    p2 = (MRG_A21 * s22 - MRG_A23N * s20) % MRG_M2
+    z = p1 - p2
+    z += MRG_M1 * (z <= 0)
+    return (s11, s12, p1, s21, s22, p2), z / (MRG_M1 + 1.0)
+
+@registrar_motor("mrg32k3a", "MRG32k3a de L'Ecuyer vectorizado por carriles")
+def generar_mrg32k3a(semilla, n):
+    return _por_carriles(semilla, n, _mrg32k3a_iniciales, _mrg32k3a_paso)
@@ -0,0 +1,258 @@
+"""
+Política de producción óptima por programación dinámica
+=======================================================================
+
+Las políticas de campania.py son heurísticas que se comparan por Monte Carlo. El modelo de
+simulador.py es lo bastante chico para resolverlo en forma exacta: la demanda de cada día es
+discreta (sale de TABLA_DEMANDA_ENTRESEMANA / TABLA_DEMANDA_FIN_DE_SEMANA con un número
+aleatorio de 4 decimales), el producto dura 2 días y lo único que pasa de un día al otro son los
+sobrantes de ayer. Con el estado (sobrantes de ayer, día de la semana) se calcula la producción
+óptima de cada estado y su beneficio esperado con actualizaciones de Bellman vectorizadas, sin réplicas.
+
+Convenciones (las mismas de recurrencia_sobrantes y resultado_neto):
+  - Cada día se venden primero los sobrantes de ayer; los que no se venden se desperdician (COSTO_SB).
+  - La demanda que no se cubre es venta perdida (COSTO_VP); cada unidad vendida deja BENEFICIO.
+  - Los sobrantes del último día no se cuentan como desperdicio.
+
+Ejemplos:
+    python politica_optima.py                       # 30 días desde FECHA_INICIO y política estacionaria
+    python politica_optima.py --days 365 --paso 6   # producción en múltiplos de 6, como las heurísticas
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from simulador import (TABLA_DEMANDA_ENTRESEMANA, TABLA_DEMANDA_FIN_DE_SEMANA, FECHA_INICIO, BENEFICIO, COSTO_SB,
+                       COSTO_VP, mascara_fin_de_semana)
+
+DIAS_SEMANA = 7
+NOMBRES_DIAS = ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo")
+
+def distribucion_demanda(tabla):
+    """
+    Distribución de la demanda de un tipo de día: (valores, probabilidades).
+    Los números aleatorios son uniformes redondeados a 4 decimales, así que k = 1..9999 tienen la
+    misma probabilidad y los extremos k = 0 y k = 10000 la mitad (cada uno cubre medio intervalo).
+    """
+    pesos = np.ones(len(tabla))
+    pesos[[0, -1]] = 0.5
+    probabilidades = np.bincount(tabla, weights=pesos) / pesos.sum()
+    valores = np.flatnonzero(probabilidades)
+    return valores, probabilidades[valores]
+
+def construir_modelo(producciones, beneficio=BENEFICIO, costo_sb=COSTO_SB, costo_vp=COSTO_VP):
+    """
+    Recompensa esperada y probabilidades de transición de un día de cada tipo.
+
+    Los sobrantes nunca superan a la producción del día, así que los estados son s = 0..max(producciones).
+
+    Args:
+        producciones (np.ndarray): Producciones posibles (acciones), enteros no negativos crecientes.
+        beneficio, costo_sb, costo_vp (float): Valorización de las unidades (ver resultado_neto).
+
+    Returns:
+        dict: es_finde (bool) -> {"recompensa": (S, A), "transicion": (S * A, S)}, donde transicion[s * A + a]
+              es la distribución de los sobrantes de mañana si hoy hay s sobrantes y se produce producciones[a].
+    """
+    producciones = np.asarray(producciones)
+    cant_estados = int(producciones.max()) + 1
+    cant_acciones = len(producciones)
+    s = np.arange(cant_estados)[:, None, None]
+    p = producciones[None, :, None]
+    modelo = {}
+    for es_finde, tabla in ((False, TABLA_DEMANDA_ENTRESEMANA), (True, TABLA_DEMANDA_FIN_DE_SEMANA)):
+        valores, probabilidades = distribucion_demanda(tabla)
+        d = valores[None, None, :]
+        vendidas = np.minimum(d, s + p)
+        desperdiciadas = np.maximum(s - d, 0)
+        perdidas = np.maximum(d - s - p, 0)
+        recompensa = (beneficio * vendidas - costo_sb * desperdiciadas - costo_vp * perdidas) @ probabilidades
+        # Sobrantes de mañana: lo que queda de la producción de hoy
+        siguiente = np.minimum(np.maximum(s + p - d, 0), p)
+        filas = np.arange(cant_estados * cant_acciones).reshape(cant_estados, cant_acciones, 1)
+        transicion = np.bincount((filas * cant_estados + siguiente).ravel(),
+                                 weights=np.broadcast_to(probabilidades, siguiente.shape).ravel(),
+                                 minlength=cant_estados * cant_acciones * cant_estados)
+        modelo[es_finde] = {"recompensa": recompensa,
+                            "transicion": transicion.reshape(cant_estados * cant_acciones, cant_estados)}
+    return modelo
+
+def _bellman(modelo_dia, valor_siguiente):
+    """Valor de cada acción en cada estado (S, A) dado el valor de mañana (S,)."""
+    recompensa = modelo_dia["recompensa"]
+    return recompensa + (modelo_dia["transicion"] @ valor_siguiente).reshape(recompensa.shape)
+
+def grilla_producciones(paso=1, max_produccion=None):
+    """Producciones 0, paso, 2 * paso, ... hasta la demanda máxima posible (o max_produccion)."""
+    if max_produccion is None:
+        max_produccion = int(max(TABLA_DEMANDA_ENTRESEMANA.max(), TABLA_DEMANDA_FIN_DE_SEMANA.max()))
+    return np.arange(0, max_produccion + 1, paso)
+
+def tipos_de_dia(cant_dias, fecha_inicio=FECHA_INICIO):
+    """Día de la semana (Lunes = 0) y máscara de fin de semana de cada día del horizonte."""
+    dia_semana = (fecha_inicio.weekday() + np.arange(cant_dias)) % DIAS_SEMANA
+    return dia_semana, mascara_fin_de_semana(cant_dias, fecha_inicio)
+
+def resolver_horizonte_finito(cant_dias, paso=1, max_produccion=None, fecha_inicio=FECHA_INICIO,
+                              beneficio=BENEFICIO, costo_sb=COSTO_SB, costo_vp=COSTO_VP):
+    """
+    Política óptima para un horizonte de cant_dias días (inducción hacia atrás), el mismo problema que
+    simula una réplica de campania.py.
+
+    Args:
+        cant_dias (int): Días del horizonte.
+        paso (int): La producción se elige entre los múltiplos de paso.
+        max_produccion (int): Producción máxima a considerar. Por defecto, la demanda máxima posible.
+        fecha_inicio (date): Fecha del primer día (define qué días son fin de semana).
+        beneficio, costo_sb, costo_vp (float): Valorización de las unidades.
+
+    Returns:
+        dict: "politica" (D, S) con la producción óptima de cada día según los sobrantes de ayer,
+              "valor" (D + 1, S) con el beneficio esperado desde cada día y estado,
+              "beneficio_esperado" desde el primer día sin sobrantes, "es_finde" (D,) y "producciones".
+    """
+    producciones = grilla_producciones(paso, max_produccion)
+    modelo = construir_modelo(producciones, beneficio, costo_sb, costo_vp)
+    _, es_finde = tipos_de_dia(cant_dias, fecha_inicio)
+    cant_estados = int(producciones.max()) + 1
+    valor = np.zeros((cant_dias + 1, cant_estados))
+    politica = np.empty((cant_dias, cant_estados), dtype=producciones.dtype)
+    for dia in range(cant_dias - 1, -1, -1):
+        q = _bellman(modelo[bool(es_finde[dia])], valor[dia + 1])
+        mejor = q.argmax(axis=1)
+        politica[dia] = producciones[mejor]
+        valor[dia] = q[np.arange(cant_estados), mejor]
+    return {
+        "producciones": producciones,
+        "es_finde": es_finde,
+        "politica": politica,
+        "valor": valor,
+        "beneficio_esperado": valor[0, 0]
+    }
+
+def resolver_estacionaria(paso=1, max_produccion=None, tolerancia=1e-9, max_iteraciones=10000,
+                          beneficio=BENEFICIO, costo_sb=COSTO_SB, costo_vp=COSTO_VP):
+    """
+    Política óptima a largo plazo por iteración de valores relativa sobre el ciclo semanal.
+
+    Cada iteración aplica la actualización de Bellman de los 7 días de la semana (de domingo a lunes).
+    La diferencia entre dos iteraciones del valor del lunes tiende al beneficio esperado de una semana;
+    se corta cuando su rango (máximo - mínimo entre estados) es menor que tolerancia.
+
+    Returns:
+        dict: "politica" (7, S) con la producción óptima por día de la semana (Lunes = 0) y sobrantes de ayer,
+              "valor" (7, S) relativo, "beneficio_diario" y "beneficio_semanal" esperados, "iteraciones",
+              "convergio" y "producciones".
+    """
+    producciones = grilla_producciones(paso, max_produccion)
+    modelo = construir_modelo(producciones, beneficio, costo_sb, costo_vp)
+    dia_finde = np.arange(DIAS_SEMANA) >= 4
+    cant_estados = int(producciones.max()) + 1
+    valor = np.zeros((DIAS_SEMANA, cant_estados))
+    politica = np.empty((DIAS_SEMANA, cant_estados), dtype=producciones.dtype)
+    diferencia = np.zeros(cant_estados)
+    convergio = False
+    for iteracion in range(1, max_iteraciones + 1):
+        valor_lunes = valor[0].copy()
+        siguiente = valor_lunes
+        for dia in range(DIAS_SEMANA - 1, -1, -1):
+            q = _bellman(modelo[bool(dia_finde[dia])], siguiente)
+            mejor = q.argmax(axis=1)
+            politica[dia] = producciones[mejor]
+            valor[dia] = q[np.arange(cant_estados), mejor]
+            siguiente = valor[dia]
+        diferencia = valor[0] - valor_lunes
+        # Normalización: el valor relativo del lunes sin sobrantes queda en 0
+        valor -= valor[0, 0]
+        if diferencia.max() - diferencia.min() < tolerancia:
+            convergio = True
+            break
+    beneficio_semanal = (diferencia.max() + diferencia.min()) / 2
+    return {
+        "producciones": producciones,
+        "politica": politica,
+        "valor": valor,
+        "beneficio_semanal": beneficio_semanal,
+        "beneficio_diario": beneficio_semanal / DIAS_SEMANA,
+        "iteraciones": iteracion,
+        "convergio": convergio
+    }
+
+def evaluar_politica(politica, fecha_inicio=FECHA_INICIO, beneficio=BENEFICIO, costo_sb=COSTO_SB, costo_vp=COSTO_VP):
+    """
+    Beneficio esperado exacto de una política que depende solo del día y de los sobrantes de ayer.
+
+    Args:
+        politica (np.ndarray): Producción de cada día (D,) o de cada día y estado (D, S); por ejemplo la
+                               política constante de franco.py es np.where(es_finde, finde, semana).
+        fecha_inicio (date): Fecha del primer día.
+
+    Returns:
+        float: Beneficio esperado de los D días empezando sin sobrantes.
+    """
+    politica = np.asarray(politica)
+    cant_dias = politica.shape[0]
+    # Las acciones son todas las producciones 0..max, así el índice de la acción es la producción.
+    # Los sobrantes no superan a la producción de ayer, así que los estados también son 0..max.
+    producciones = np.arange(int(politica.max()) + 1)
+    cant_estados = len(producciones)
+    if politica.ndim == 1:
+        politica = np.repeat(politica[:, None], cant_estados, axis=1)
+    modelo = construir_modelo(producciones, beneficio, costo_sb, costo_vp)
+    _, es_finde = tipos_de_dia(cant_dias, fecha_inicio)
+    estados = np.arange(cant_estados)
+    valor = np.zeros(cant_estados)
+    for dia in range(cant_dias - 1, -1, -1):
+        modelo_dia = modelo[bool(es_finde[dia])]
+        filas = estados * cant_estados + politica[dia, :cant_estados]
+        valor = modelo_dia["recompensa"].ravel()[filas] + modelo_dia["transicion"][filas] @ valor
+    return valor[0]
+
+def mostrar_politica(politica, etiquetas, paso_estados=6, max_estado=None):
+    """Imprime una tabla con la producción de cada fila (día) para algunos niveles de sobrantes."""
+    if max_estado is None:
+        max_estado = int(politica.max())
+    estados = list(range(0, min(max_estado, politica.shape[1] - 1) + 1, paso_estados))
+    print(f"{'Sobrantes de ayer':<18}" + "".join(f"{s:>5}" for s in estados))
+    for etiqueta, fila in zip(etiquetas, politica):
+        print(f"{etiqueta:<18}" + "".join(f"{fila[s]:>5}" for s in estados))
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Calcula la política de producción óptima del modelo de simulador.py por programación dinámica.")
+    parser.add_argument("--days", type=int, default=30, help="Días del horizonte finito (por defecto 30).")
+    parser.add_argument("--paso", type=int, default=1,
+                        help="La producción se elige entre los múltiplos de este valor (por defecto 1).")
+    parser.add_argument("--max-produccion", type=int, default=None,
+                        help="Producción máxima a considerar (por defecto, la demanda máxima posible).")
+    parser.add_argument("--tolerancia", type=float, default=1e-9,
+                        help="Tolerancia de la iteración de valores de la política estacionaria.")
+    return parser
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+
+    inicio = time.perf_counter()
+    estacionaria = resolver_estacionaria(args.paso, args.max_produccion, args.tolerancia)
+    duracion = time.perf_counter() - inicio
+    estado = "convergió" if estacionaria["convergio"] else "NO convergió"
+    print(f"\n--- Política estacionaria ({estado} en {estacionaria['iteraciones']} iteraciones, {duracion:.2f} s) ---\n")
+    print(f"Beneficio esperado: {estacionaria['beneficio_diario']:.2f} por día, "
+          f"{estacionaria['beneficio_semanal']:.2f} por semana\n")
+    mostrar_politica(estacionaria["politica"], NOMBRES_DIAS)
+
+    inicio = time.perf_counter()
+    finito = resolver_horizonte_finito(args.days, args.paso, args.max_produccion)
+    duracion = time.perf_counter() - inicio
+    print(f"\n--- Horizonte de {args.days} días desde {FECHA_INICIO:%d/%m/%Y} ({duracion:.2f} s) ---\n")
+    print(f"Beneficio esperado sin sobrantes iniciales: {finito['beneficio_esperado']:.2f}")
+    print(f"(comparable con el beneficio promedio de campania.py --days {args.days})\n")
+    dia_semana, _ = tipos_de_dia(args.days)
+    primeros = min(args.days, DIAS_SEMANA)
+    mostrar_politica(finito["politica"][:primeros],
+                     [f"Día {dia + 1} ({NOMBRES_DIAS[dia_semana[dia]][:3]})" for dia in range(primeros)])
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 # VERSIÓN CON PRODUCCIÓN DIFERENCIADA
 # Asumiendo que las constantes están en un archivo config.py o en simulador.py
-from simulador import genera_demanda_diaria, COSTO_VP, COSTO_SB, BENEFICIO
+from simulador import genera_demanda_diaria, recurrencia_sobrantes, COSTO_VP, COSTO_SB, BENEFICIO
+from registro_politicas import registrar_politica
 import itertools
-from scipy.stats import t 
+import numpy as np
+from pruebas_estadisticas.valores_criticos import t_ppf
 import math
 def simular_politica_produccion(
     produccion_semana: int, 
@@ -120,7 +122,7 @@ def generar_intervalos(cant_replicas,acum_benef,alpha = 0.05):
     for combi in acum_benef:
         result[combi]['beneficio_prom'] = sum(acum_benef[combi]) / cant_replicas
         result[combi]['stddev'] = math.sqrt(sum((x - result[combi]['beneficio_prom']) ** 2 for x in acum_benef[combi]) / (cant_replicas - 1))
-        t_critical = t.ppf(1 - alpha / 2, df=cant_replicas - 1)
+        t_critical = t_ppf(1 - alpha / 2, cant_replicas - 1)
         result[combi]['delta'] = t_critical * (result[combi]['stddev'] / math.sqrt(cant_replicas))
         result[combi]['lower'] = result[combi]['beneficio_prom'] - result[combi]['delta']
         result[combi]['upper'] = result[combi]['beneficio_prom'] + result[combi]['delta']
@@ -145,10 +147,34 @@ def mostrar_resultados(resultados_intervalos):
         intervalo_longitud = lista['upper'] - lista['lower']
         print(f"{i}.  p = {lista['produccion']:<3} | Beneficio Prom: {lista['beneficio_prom']:>9.2f} | "
               f"Intervalo de Confianza = [{lista['lower']:.2f}, {lista['upper']:.2f}] (longitud = {intervalo_longitud:.2f})")
+
+@registrar_politica(
+    "ctev4",
+    {"produccion_semana": [x*6 for x in range(1, 20)], "produccion_finde": [x*6 for x in range(1, 20)]},
+    "Producción constante diferenciada L-J / V-S-D"
+)
+def simular_politica_produccion_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """
+    Versión vectorizada de simular_politica_produccion: evalúa todas las réplicas y todas las
+    combinaciones (produccion_semana, produccion_finde) en una sola recurrencia.
+
+    Args:
+        demandas (np.ndarray): Matriz de demanda (R, D).
+        es_finde (np.ndarray): Máscara de fin de semana (D,).
+        combinaciones (list[dict]): Combinaciones con 'produccion_semana' y 'produccion_finde'.
+        tamano_lote (int): Si se pasa, conteos por lotes de días (ver recurrencia_sobrantes).
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades con forma (R, P) (o (R, P, L) por lotes).
+    """
+    semana = np.array([combi["produccion_semana"] for combi in combinaciones])
+    finde = np.array([combi["produccion_finde"] for combi in combinaciones])
+    # Producción (P, D): no depende de la réplica
+    produccion = np.where(es_finde, finde[:, None], semana[:, None])
+    vendidas, desperdiciadas, perdidas = recurrencia_sobrantes(demandas[:, None, :], produccion, tamano_lote)
+    return vendidas, desperdiciadas, perdidas
+
 # --- Bloque de ejecución de ejemplo ---
 if __name__ == "__main__":
-    dias_a_simular = 30
-    cant_replicas = 10000
-    beneficios_acumulados = generar_replicas(cant_replicas,dias_a_simular)
-    lista_intervalos = generar_intervalos(cant_replicas,beneficios_acumulados)
-    mostrar_resultados(lista_intervalos)
\ No newline at end of file
+    from campania import main
+    main(["ctev4", "--replicas", "10000", "--days", "30"])
\ No newline at end of file
@@ -5,20 +5,22 @@ import csv
 import math
 import multiprocessing
 import time
-from simulador import generar_numeros_aprobados
-from scipy.stats import t 
+import numpy as np
+from simulador import generar_numeros_aprobados, generar_demanda_entresemana, generar_demanda_fin_de_semana, balance_sin_arrastre
+from registro_politicas import registrar_politica
+from pruebas_estadisticas.valores_criticos import t_ppf
 from datetime import date, timedelta
 # --- Las funciones originales no necesitan cambios ---
 
 def generador_weekday(n_dias):
     nros = generar_numeros_aprobados(n_dias)
     """formula: 77*x+4"""
-    return [math.floor(77 * x) + 4 for x in nros]
+    return [generar_demanda_entresemana(x) for x in nros]
 
 def generador_weekend(n_dias):
     nros = generar_numeros_aprobados(n_dias)
     """formula: 90x+18"""
-    return [math.floor(90 * x) + 18 for x in nros]
+    return [generar_demanda_fin_de_semana(x) for x in nros]
 
 def count_weekend_days_in_next_30():
     today = date(2025,7,6)
@@ -76,7 +78,7 @@ def simular_para_un_p(p, iteraciones, generador_var_al):
     length = len(beneficios_obtenidos)
     beneficio_prom = sum(beneficios_obtenidos) / length
     stddev = math.sqrt(sum((x - beneficio_prom) ** 2 for x in beneficios_obtenidos) / (length - 1))
-    t_critical = t.ppf(1 - alpha / 2, df=length - 1)
+    t_critical = t_ppf(1 - alpha / 2, length - 1)
     delta = t_critical * (stddev / math.sqrt(length))
     lower = beneficio_prom - delta
     upper = beneficio_prom + delta
@@ -140,5 +142,33 @@ def main():
     fin_total = time.time()
     print(f"\nTodas las simulaciones terminaron en {(fin_total - inicio_total) / 60:.2f} minutos.")
 
+# Mismos precios que simular_para_un_p
+@registrar_politica("ctev5", {"p": [x*6 for x in range(1, 13)]}, "Producción constante p solo en días L-J, sin arrastre de sobrantes",
+                    precios={"beneficio": 10, "costo_sb": 7, "costo_vp": 10})
+def simular_para_un_p_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """
+    Versión vectorizada de simular_para_un_p: usa solo los días de semana de la matriz de demanda
+    (los mismos n_dias que cuenta count_weekend_days_in_next_30) y evalúa todos los p a la vez.
+
+    Args:
+        demandas (np.ndarray): Matriz de demanda (R, D).
+        es_finde (np.ndarray): Máscara de fin de semana (D,).
+        combinaciones (list[dict]): Combinaciones con la clave 'p'.
+        tamano_lote (int): Si se pasa, conteos por lotes de días (ver recurrencia_sobrantes).
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades con forma (R, P) (o (R, P, L) por lotes).
+    """
+    demandas_semana = demandas[:, ~es_finde]
+    p = np.array([combi["p"] for combi in combinaciones])
+    if tamano_lote is not None:
+        # Solo se usan los días de semana: con lotes de semanas completas cada lote tiene los mismos
+        if tamano_lote % 7:
+            raise ValueError(f"ctev5 necesita lotes de semanas completas (múltiplos de 7 días), no {tamano_lote}")
+        tamano_lote = tamano_lote // 7 * int(np.count_nonzero(~es_finde[:7]))
+    vendidas, desperdiciadas, perdidas = balance_sin_arrastre(demandas_semana[:, None, :], p[None, :, None], tamano_lote)
+    return vendidas, desperdiciadas, perdidas
+
 if __name__ == "__main__":
-    main()
+    from campania import main as ejecutar_campania
+    ejecutar_campania(["ctev5", "--replicas", "10000", "--days", "30"])
@@ -1,6 +1,8 @@
-from simulador import genera_demanda_diaria, COSTO_VP, COSTO_SB, BENEFICIO
+from simulador import genera_demanda_diaria, recurrencia_sobrantes, COSTO_VP, COSTO_SB, BENEFICIO
+from registro_politicas import registrar_politica
 import math
-from scipy.stats import t
+import numpy as np
+from pruebas_estadisticas.valores_criticos import t_ppf
 
 def simular_criterio_demanda_anterior(p_cte: int, cronograma_demanda: list[dict]) -> dict:
     """
@@ -97,7 +99,7 @@ def generar_intervalos(cant_replicas, acum_benef, alpha=0.05):
     for p_cte in acum_benef:
         prom = sum(acum_benef[p_cte]) / cant_replicas
         stddev = math.sqrt(sum((x - prom) ** 2 for x in acum_benef[p_cte]) / (cant_replicas - 1))
-        t_critical = t.ppf(1 - alpha / 2, df=cant_replicas - 1)
+        t_critical = t_ppf(1 - alpha / 2, cant_replicas - 1)
         delta = t_critical * (stddev / math.sqrt(cant_replicas))
         result[p_cte].update({
             'beneficio_prom': prom,
@@ -132,11 +134,37 @@ def mostrar_resultados(resultados_intervalos):
               f"IC 95% = [{item['lower']:.2f}, {item['upper']:.2f}] (longitud = {longitud:.2f})")
 
 
+@registrar_politica(
+    "demanda_anterior",
+    {"p_cte": list(range(0, 61, 6))},  # probamos desde 0 hasta 60 en pasos de 6
+    "Producción = demanda de ayer + constante"
+)
+def simular_criterio_demanda_anterior_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """
+    Versión vectorizada de simular_criterio_demanda_anterior: evalúa todas las réplicas y todos los
+    valores de p_cte en una sola recurrencia.
+
+    Args:
+        demandas (np.ndarray): Matriz de demanda (R, D).
+        es_finde (np.ndarray): Máscara de fin de semana (D,). No se usa en este criterio.
+        combinaciones (list[dict]): Combinaciones con la clave 'p_cte'.
+        tamano_lote (int): Si se pasa, conteos por lotes de días (ver recurrencia_sobrantes).
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades con forma (R, P) (o (R, P, L) por lotes).
+    """
+    p_cte = np.array([combi["p_cte"] for combi in combinaciones])
+    # Demanda de ayer, un día por fila (D, R): el primer día no se conoce y cuenta como 0
+    demanda_ayer = np.zeros(demandas.shape[::-1], dtype=demandas.dtype)
+    demanda_ayer[1:] = demandas.T[:-1]
+    # Producción (R, P, D) como vista de un array guardado día por día, que es el orden en que
+    # la recorre recurrencia_sobrantes (así no se copia)
+    produccion = np.moveaxis(demanda_ayer[:, :, None] + p_cte, 0, -1)
+    vendidas, desperdiciadas, perdidas = recurrencia_sobrantes(demandas[:, None, :], produccion, tamano_lote)
+    return vendidas, desperdiciadas, perdidas
+
+
 # --- Ejecución ---
 if __name__ == "__main__":
-    dias_a_simular = 30
-    cant_replicas = 50000
-    valores_de_pcte = list(range(0, 61, 6))  # probamos desde 0 hasta 60 en pasos de 6
-    beneficios = generar_replicas(valores_de_pcte, cant_replicas, dias_a_simular)
-    intervalos = generar_intervalos(cant_replicas, beneficios)
-    mostrar_resultados(intervalos)
+    from campania import main
+    main(["demanda_anterior", "--replicas", "50000", "--days", "30"])
@@ -1,6 +1,6 @@
-import math
-from scipy.stats import t
-from simulador import genera_demanda_diaria, COSTO_VP, COSTO_SB, BENEFICIO
+import numpy as np
+from simulador import recurrencia_sobrantes, COSTO_VP, COSTO_SB, BENEFICIO
+from registro_politicas import registrar_politica
 
 def simular_produccion_maxima(cronograma_demanda, N=5, produccion_inicial=60):
     """
@@ -97,51 +97,61 @@ def simular_produccion_maxima(cronograma_demanda, N=5, produccion_inicial=60):
     }
 
 
-if __name__ == "__main__":
-    # dias_a_simular = 30
+@registrar_politica(
+    "demanda_maxima",
+    {"N": [2, 3, 4, 5, 6], "produccion_inicial": [30]},
+    "Producción = máximo de la demanda de los últimos N días del mismo tipo"
+)
+def simular_produccion_maxima_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """
+    Versión vectorizada de simular_produccion_maxima: evalúa todas las réplicas y todos los valores
+    de N en una sola recurrencia.
+    Como todas las réplicas comparten el calendario, los días de cada tipo son las mismas columnas
+    para todas las filas: con ventanas deslizantes sobre esas columnas se obtiene, para cada día, el
+    máximo de los últimos 1..max(N) días del mismo tipo, y de ahí la producción de cada N.
 
-    # cronograma = genera_demanda_diaria(dias_a_simular)
-    
-    # resultados = simular_produccion_maxima(
-    #     cronograma_demanda=cronograma,
-    #     N=3,
-    #     produccion_inicial=30
-    # )
-
-    # print("\n" + "*"*40)
-    # print("      RESULTADOS FINALES DE LA SIMULACIÓN")
-    # print("*"*40)
-    # print(f"Período simulado: {dias_a_simular} días")
-    # print(f"Criterio: Producción igual al máximo de los últimos 5 días")
-    # print(f"Ganancia Bruta Total: ${resultados['ganancia_total']:,.2f}")
-    # print(f"Costo por Desperdicio: ${resultados['costo_desperdicio']:,.2f}")
-    # print(f"Costo por Ventas Perdidas: ${resultados['costo_faltantes']:,.2f}")
-    # print(f"Costo Total Combinado: ${resultados['costo_total']:,.2f}")
-    # print("-" * 40)
-    # print(f"RESULTADO NETO (Ganancia - Costo): ${resultados['resultado_neto']:,.2f}")
-    # print("*"*40)
-  dias_a_simular = 30
-  num_corridas = 10_000
-  beneficios_obtenidos = []
-  alpha = 0.05
-
-  N = [2, 3, 4, 5, 6]
-  for n in N:
-      for i in range(num_corridas):
-          cronograma = genera_demanda_diaria(dias_a_simular)
-          resultados = simular_produccion_maxima(
-              cronograma_demanda=cronograma,
-              N=n,
-              produccion_inicial=30
-          )
-          beneficios_obtenidos.append(resultados['resultado_neto'])
-      
-      length = len(beneficios_obtenidos)
-      beneficio_prom = sum(beneficios_obtenidos) / length
-      stddev = math.sqrt(sum((x - beneficio_prom) ** 2 for x in beneficios_obtenidos) / (length - 1))
-      t_critical = t.ppf(1 - alpha / 2, df=length - 1)
-      delta = t_critical * (stddev / math.sqrt(length))
-      lower = beneficio_prom - delta
-      upper = beneficio_prom + delta
-
-      print(f"N = {n} | Beneficio Promedio: {beneficio_prom:.2f} | IC: [{lower:.2f}, {upper:.2f}] | Longitud: {upper - lower:.2f}")
\ No newline at end of file
+    Args:
+        demandas (np.ndarray): Matriz de demanda (R, D).
+        es_finde (np.ndarray): Máscara de fin de semana (D,).
+        combinaciones (list[dict]): Combinaciones con las claves 'N' y 'produccion_inicial'.
+        tamano_lote (int): Si se pasa, conteos por lotes de días (ver recurrencia_sobrantes).
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades con forma (R, P) (o (R, P, L) por lotes).
+    """
+    cant_replicas, cant_dias = demandas.shape
+    N = np.array([combi["N"] for combi in combinaciones])
+    if np.any(N < 1):
+        raise ValueError(f"demanda_maxima necesita N >= 1, no {int(N.min())}")
+    produccion_inicial = np.array([combi["produccion_inicial"] for combi in combinaciones])
+    N_max = int(N.max())
+    # round(x / 6) * 6 de cada demanda posible (las demandas son enteros no negativos)
+    redondeo = (np.round(np.arange(demandas.max() + 1) / 6) * 6).astype(demandas.dtype)
+    # Producción guardada día por día (D, R, P), el orden en que la recorre recurrencia_sobrantes
+    produccion = np.empty((cant_dias, cant_replicas, len(combinaciones)), dtype=demandas.dtype)
+    for tipo in (False, True):
+        columnas = np.flatnonzero(es_finde == tipo)
+        if len(columnas) == 0:
+            continue
+        # Historial de este tipo de día con N_max días de relleno al principio: la ventana k cubre los
+        # N_max días del mismo tipo anteriores al k-ésimo (el relleno 0 no cambia el máximo)
+        historial = np.pad(demandas[:, columnas], ((0, 0), (N_max, 0)))
+        ventanas = np.lib.stride_tricks.sliding_window_view(historial, N_max, axis=1)[:, :len(columnas)]
+        # Máximo de los últimos n días del mismo tipo para n = 1..N_max: se agrega un día por vez
+        # (cada columna de las ventanas es un array (R, K)) y se guarda cuando n es uno de los N
+        maximo = ventanas[:, :, -1].copy()
+        por_tipo = np.empty((cant_replicas, len(columnas), len(combinaciones)), dtype=demandas.dtype)
+        for n in range(1, N_max + 1):
+            if n > 1:
+                np.maximum(maximo, ventanas[:, :, -n], out=maximo)
+            por_tipo[:, :, N == n] = redondeo[maximo][:, :, None]
+        produccion[columnas] = np.moveaxis(por_tipo, 1, 0)
+    # Primeros N-1 dias ocupa produccion_inicial
+    dias_iniciales = np.arange(min(N_max, cant_dias))[:, None] < N
+    produccion[:N_max] = np.where(dias_iniciales[:, None, :], produccion_inicial, produccion[:N_max])
+    vendidas, desperdiciadas, perdidas = recurrencia_sobrantes(demandas[:, None, :], np.moveaxis(produccion, 0, -1), tamano_lote)
+    return vendidas, desperdiciadas, perdidas
+
+if __name__ == "__main__":
+    from campania import main
+    main(["demanda_maxima", "--replicas", "10000", "--days", "30"])
@@ -1,7 +1,29 @@
 import math
-import itertools
-from simulador import genera_demanda_diaria, COSTO_VP, COSTO_SB, BENEFICIO
-from scipy.stats import t 
+import numpy as np
+from simulador import genera_demanda_diaria, recurrencia_sobrantes, COSTO_VP, COSTO_SB, BENEFICIO
+from registro_politicas import registrar_politica
+from pruebas_estadisticas.valores_criticos import t_ppf
+
+TIPOS_DIA = ("Entre Semana", "Fin de Semana")
+
+def nuevo_seguimiento_produccion() -> dict:
+    """
+    Acumulador de la producción de una réplica: suma y cantidad de días por tipo de día.
+    Se actualiza en O(1) por día, así que el promedio final cuesta O(D) en total.
+    """
+    return {tipo: {"suma": 0, "dias": 0} for tipo in TIPOS_DIA}
+
+def registrar_produccion(seguimiento: dict, tipo_dia: str, produccion: int) -> None:
+    """Suma la producción de un día al acumulador de su tipo de día."""
+    acumulado = seguimiento[tipo_dia]
+    acumulado["suma"] += produccion
+    acumulado["dias"] += 1
+
+def promedio_produccion(seguimiento: dict, tipo_dia: str) -> float:
+    """Producción promedio de un tipo de día (0 si no hubo días de ese tipo)."""
+    acumulado = seguimiento[tipo_dia]
+    return acumulado["suma"] / max(1, acumulado["dias"])
+
 def simular_politica_produccion(
         dias_anteriores: int,
         cronograma_demanda: list[dict]
@@ -18,11 +40,11 @@ def simular_politica_produccion(
                                          que contiene la demanda y los detalles de cada día.
 
     Returns:
-        dict: Un diccionario con los resultados finales de la simulación.
+        dict: Un diccionario con los resultados finales de la simulación. Además del resultado neto incluye
+              la producción promedio de cada tipo de día y el acumulador de producción de la réplica
+              ("seguimiento_produccion", ver nuevo_seguimiento_produccion).
     """
-    producciones = {}
-    produccion_finde_acumulado = []
-    produccion_semana_acumulado = []
+    seguimiento = nuevo_seguimiento_produccion()
     historial_demanda_dia_semana = []
     historial_demanda_fin_de_semana = []
     # Acumuladores finales
@@ -63,7 +85,7 @@ def simular_politica_produccion(
                 historial_demanda_fin_de_semana.append(demanda_real)
                 produccion_finde = produccion
         
-            produccion_finde_acumulado.append(produccion_finde)
+            registrar_produccion(seguimiento, tipo_dia_hoy, produccion_finde)
         else: # "Entre Semana"
             # Si es el primer dia, utilizamos la producción fija
             if len(historial_demanda_dia_semana) == 0:           
@@ -84,7 +106,7 @@ def simular_politica_produccion(
                 historial_demanda_dia_semana.append(demanda_real)
                 produccion_semana = produccion
 
-            produccion_semana_acumulado.append(produccion_semana)
+            registrar_produccion(seguimiento, tipo_dia_hoy, produccion_semana)
 
         
                 # --- Usar sobrante del día anterior ---
@@ -108,24 +130,15 @@ def simular_politica_produccion(
         # El sobrante de hoy será el que se pueda usar mañana
         sobrante_anterior = sobrante_nuevo
 
-
-        # Guardo la producción del día
-        producciones[idx] = {
-            "produccion_finde_acumulado": produccion_finde_acumulado,
-            "produccion_semana_acumulado": produccion_semana_acumulado
-        }
-
     # --- Resultados finales ---
     costo_total = costo_total_desperdicio + costo_total_faltantes
     resultado_neto = ganancias_totales - costo_total
 
     return {
         "resultado_neto": resultado_neto,
-        "produccion_finde_prom": (sum(itertools.chain.from_iterable(produccion["produccion_finde_acumulado"] for produccion in producciones.values())) / 
-                                  max(1, sum(len(produccion["produccion_finde_acumulado"]) for produccion in producciones.values())) 
-        ),
-        "produccion_semana_prom": (sum(itertools.chain.from_iterable(produccion["produccion_semana_acumulado"] for produccion in producciones.values())) / 
-                                   max(1, sum(len(produccion["produccion_semana_acumulado"]) for produccion in producciones.values())))
+        "produccion_finde_prom": promedio_produccion(seguimiento, "Fin de Semana"),
+        "produccion_semana_prom": promedio_produccion(seguimiento, "Entre Semana"),
+        "seguimiento_produccion": seguimiento
     }
 
 def generar_replicas(cant_replicas, n_dias, dias_anteriores):
@@ -161,7 +174,7 @@ def generar_intervalos(beneficios_acumulados):
         dias_anteriores = beneficios_acumulados[prom]["dias_anteriores"]
         length = len(beneficios_obtenidos)
         stddev = math.sqrt(sum((x - beneficio_prom) ** 2 for x in beneficios_obtenidos) / (length - 1))
-        t_critical = t.ppf(1 - alpha / 2, df=length - 1)
+        t_critical = t_ppf(1 - alpha / 2, length - 1)
         delta = t_critical * (stddev / math.sqrt(length))
         lower = beneficio_prom - delta
         upper = beneficio_prom + delta
@@ -192,12 +205,61 @@ def mostrar_resultados(lista_intervalos):
               f"Prod. semana: {res['produccion_semana_promedio']:.2f} | "
               f"Prod. finde: {res['produccion_finde_promedio']:.2f}")
 
+@registrar_politica(
+    "promedio_intervalo",
+    {"dias_anteriores": list(range(1, 30, 6))},
+    "Producción = promedio de los últimos días del mismo tipo, con sobrantes",
+    # Misma valorización que simular_politica_produccion (desperdicio a COSTO_VP, faltante a COSTO_SB)
+    precios={"beneficio": BENEFICIO, "costo_sb": COSTO_VP, "costo_vp": COSTO_SB}
+)
+def simular_politica_produccion_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """
+    Versión vectorizada de simular_politica_produccion: evalúa todas las réplicas y todos los valores
+    de dias_anteriores en una sola recurrencia.
+    Las sumas acumuladas de la demanda de cada tipo de día se calculan una sola vez; el promedio de
+    cualquier ventana (incluidos los primeros días, en que se promedia lo que hay) es una resta de
+    dos sumas acumuladas para todos los días y réplicas a la vez, así que cada tamaño de ventana
+    agrega muy poco al costo de la recurrencia.
+
+    Args:
+        demandas (np.ndarray): Matriz de demanda (R, D).
+        es_finde (np.ndarray): Máscara de fin de semana (D,).
+        combinaciones (list[dict]): Combinaciones con la clave 'dias_anteriores'.
+        tamano_lote (int): Si se pasa, conteos por lotes de días (ver recurrencia_sobrantes).
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades con forma (R, P) (o (R, P, L) por lotes).
+    """
+    cant_replicas, cant_dias = demandas.shape
+    dias_anteriores = np.array([combi["dias_anteriores"] for combi in combinaciones])
+    # Producción guardada día por día y con las réplicas en el último eje (D, P, R): así cada
+    # suma acumulada que se toma es una fila completa y cada día es contiguo para recurrencia_sobrantes
+    produccion = np.empty((cant_dias, len(combinaciones), cant_replicas), dtype=demandas.dtype)
+    for tipo, produccion_fija in ((False, 42), (True, 60)):
+        columnas = np.flatnonzero(es_finde == tipo)
+        if len(columnas) == 0:
+            continue
+        # acumuladas[k] = demanda total de los primeros k días de este tipo, (K + 1, R)
+        acumuladas = np.zeros((len(columnas) + 1, cant_replicas), dtype=demandas.dtype)
+        np.cumsum(demandas[:, columnas].T, axis=0, out=acumuladas[1:])
+        # El k-ésimo día de este tipo promedia los últimos min(k, dias_anteriores) días disponibles
+        k = np.arange(len(columnas))
+        for j, dias in enumerate(dias_anteriores):
+            ventana = np.maximum(np.minimum(k, dias), 1)
+            # Mismas operaciones que la versión escalar: (suma / días) / 6, redondeado y por 6
+            promedios = (acumuladas[k] - acumuladas[k - ventana]) / ventana[:, None]
+            promedios /= 6
+            np.round(promedios, out=promedios)
+            promedios *= 6
+            # Primer día de cada tipo: producción fija
+            promedios[0] = produccion_fija
+            produccion[columnas, j] = promedios
+    vendidas, desperdiciadas, perdidas = recurrencia_sobrantes(demandas[None], np.moveaxis(produccion, 0, -1), tamano_lote)
+    # (P, R) -> (R, P) contiguo, para que las estadísticas por columna sumen en el mismo orden de siempre
+    return tuple(np.ascontiguousarray(np.swapaxes(conteo, 0, 1)) for conteo in (vendidas, desperdiciadas, perdidas))
+
 # --- Bloque de ejecución de ejemplo ---
 if __name__ == "__main__":
-    n_dias = 30
-    cant_replicas = 10000
-    dias_anteriores = 30
-    beneficios_acumulados = generar_replicas(cant_replicas, n_dias, dias_anteriores)
-    lista_intervalos = generar_intervalos(beneficios_acumulados)
-    mostrar_resultados(lista_intervalos)
+    from campania import main
+    main(["promedio_intervalo", "--replicas", "10000", "--days", "30"])
     
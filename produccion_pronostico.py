@@ -0,0 +1,186 @@
+import numpy as np
+from simulador import cantidad_de_lotes, sumar_por_lotes
+from registro_politicas import registrar_politica
+
+DIAS_SEMANA = 7
+
+# --- Modelos de pronóstico ---
+# Cada modelo guarda un estado de tamaño fijo (R, U), con U los juegos distintos de parámetros de suavizado,
+# y se avanza de a un día: pronosticar(estado, dia, tipo) devuelve el pronóstico de hoy (R, U) hecho con
+# los días anteriores (None si todavía no hay) y actualizar(estado, dia, tipo, demanda) incorpora la demanda
+# de hoy (R, 1).
+
+def _nuevo_estado_simple(cant_replicas, alpha):
+    return {"alpha": alpha, "niveles": {}}
+
+def _pronosticar_simple(estado, dia, tipo):
+    return estado["niveles"].get(tipo)
+
+def _actualizar_simple(estado, dia, tipo, demanda):
+    """
+    Suavizado exponencial simple con un nivel por tipo de día (L-J y V-S-D): el nivel de cada tipo empieza
+    en la primera demanda de ese tipo y después se actualiza con nivel += alpha * (demanda - nivel).
+    """
+    nivel = estado["niveles"].get(tipo)
+    if nivel is None:
+        estado["niveles"][tipo] = np.repeat(demanda.astype(np.float64), len(estado["alpha"]), axis=1)
+    else:
+        nivel += estado["alpha"] * (demanda - nivel)
+
+def _nuevo_estado_holt_winters(cant_replicas, alpha, beta, gamma):
+    forma = (cant_replicas, len(alpha))
+    return {"alpha": alpha, "beta": beta, "gamma": gamma,
+            "primera_semana": np.empty((DIAS_SEMANA, cant_replicas)),
+            "nivel": np.empty(forma), "tendencia": np.zeros(forma), "nivel_anterior": np.empty(forma),
+            "estacionalidad": np.empty((DIAS_SEMANA,) + forma), "pronostico": np.empty(forma)}
+
+def _pronosticar_holt_winters(estado, dia, tipo):
+    if dia < DIAS_SEMANA:
+        return None
+    pronostico = estado["pronostico"]
+    np.add(estado["nivel"], estado["tendencia"], out=pronostico)
+    pronostico += estado["estacionalidad"][dia % DIAS_SEMANA]
+    return pronostico
+
+def _actualizar_holt_winters(estado, dia, tipo, demanda):
+    """
+    Holt-Winters aditivo con estacionalidad semanal. La primera semana inicializa el estado (nivel = su
+    promedio, tendencia 0, índices = cada día menos el promedio); desde el octavo día, después de observar
+    la demanda d del día con índice s:
+        nivel' = alpha * (d - s) + (1 - alpha) * (nivel + tendencia)
+        tendencia' = beta * (nivel' - nivel) + (1 - beta) * tendencia
+        s' = gamma * (d - nivel') + (1 - gamma) * s
+    """
+    if dia < DIAS_SEMANA:
+        estado["primera_semana"][dia] = demanda[:, 0]
+        if dia == DIAS_SEMANA - 1:
+            primera_semana = estado["primera_semana"]
+            estado["nivel"][...] = primera_semana.mean(axis=0)[:, None]
+            estado["estacionalidad"][...] = (primera_semana - primera_semana.mean(axis=0))[:, :, None]
+        return
+    alpha, beta, gamma = estado["alpha"], estado["beta"], estado["gamma"]
+    nivel, tendencia, nivel_anterior = estado["nivel"], estado["tendencia"], estado["nivel_anterior"]
+    indice = estado["estacionalidad"][dia % DIAS_SEMANA]
+    nivel_anterior[...] = nivel
+    nivel[...] = alpha * (demanda - indice) + (1 - alpha) * (nivel + tendencia)
+    tendencia[...] = beta * (nivel - nivel_anterior) + (1 - beta) * tendencia
+    indice[...] = gamma * (demanda - nivel) + (1 - gamma) * indice
+
+# modelo -> parámetros de suavizado y funciones para crear, pronosticar y actualizar su estado
+MODELOS_PRONOSTICO = {
+    "simple": {"parametros": ("alpha",), "nuevo_estado": _nuevo_estado_simple,
+               "pronosticar": _pronosticar_simple, "actualizar": _actualizar_simple},
+    "holt_winters": {"parametros": ("alpha", "beta", "gamma"), "nuevo_estado": _nuevo_estado_holt_winters,
+                     "pronosticar": _pronosticar_holt_winters, "actualizar": _actualizar_holt_winters},
+}
+
+def simular_pronostico_matriz(demandas, es_finde, combinaciones, modelo, restar_sobrantes=False, tamano_lote=None):
+    """
+    Evalúa una política de producción guiada por un pronóstico para todas las réplicas y combinaciones.
+    Cada día se produce round(pronóstico + stock_seguridad) (al menos 0), o produccion_inicial mientras el
+    modelo no tiene pronóstico. Con restar_sobrantes ese valor es el nivel objetivo y se le restan los
+    sobrantes de ayer (pedido hasta un nivel).
+
+    Un solo bucle de días avanza el pronóstico, decide la producción y aplica la recurrencia de sobrantes
+    (la de simulador.recurrencia_sobrantes), así que el estado es de tamaño fijo por réplica y combinación:
+    nunca se guarda la producción ni el pronóstico de todos los días. El pronóstico no depende de la
+    producción, así que se lleva una sola vez por cada juego distinto de parámetros de suavizado (U <= P)
+    y el stock de seguridad solo lo desplaza.
+
+    Args:
+        demandas (np.ndarray): Matriz de demanda (R, D).
+        es_finde (np.ndarray): Máscara de fin de semana (D,).
+        combinaciones (list[dict]): Combinaciones con los parámetros del modelo, 'stock_seguridad' y
+                                    'produccion_inicial'.
+        modelo (str): Clave de MODELOS_PRONOSTICO.
+        restar_sobrantes (bool): Si es True, pedido hasta un nivel.
+        tamano_lote (int): Si se pasa, conteos por lotes de días (ver recurrencia_sobrantes).
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades con forma (R, P) (o (R, P, L) por lotes).
+    """
+    cant_replicas, cant_dias = demandas.shape
+    definicion = MODELOS_PRONOSTICO[modelo]
+    suavizados = np.array([[combi[parametro] for parametro in definicion["parametros"]] for combi in combinaciones],
+                          dtype=np.float64)
+    distintos, indice = np.unique(suavizados, axis=0, return_inverse=True)
+    indice = indice.ravel()
+    estado = definicion["nuevo_estado"](cant_replicas, *distintos.T)
+    stock_seguridad = np.array([combi["stock_seguridad"] for combi in combinaciones], dtype=np.float64)
+    produccion_inicial = np.array([combi["produccion_inicial"] for combi in combinaciones], dtype=np.int64)
+
+    # Sin lotes, un solo lote con todos los días
+    tamano = cant_dias if tamano_lote is None else tamano_lote
+    cant_lotes = cantidad_de_lotes(cant_dias, tamano)
+    forma = (cant_replicas, len(combinaciones))
+    vendidas = np.zeros((cant_lotes,) + forma, dtype=np.int64)
+    desperdiciadas = np.zeros((cant_lotes,) + forma, dtype=np.int64)
+    sobrantes = np.zeros(forma, dtype=np.int64)
+    produccion = np.empty(forma, dtype=np.int64)
+    disponible = np.empty(forma, dtype=np.int64)
+    vendidas_de_hoy = np.empty(forma, dtype=np.int64)
+    for dia, demanda in enumerate(np.ascontiguousarray(demandas.T)):
+        tipo = bool(es_finde[dia])
+        demanda = demanda[:, None]
+        pronostico = definicion["pronosticar"](estado, dia, tipo)
+        if pronostico is None:
+            produccion[...] = produccion_inicial
+        else:
+            objetivo = pronostico[:, indice] + stock_seguridad
+            np.rint(objetivo, out=objetivo)
+            np.maximum(objetivo, 0, out=objetivo)
+            produccion[...] = objetivo
+        if restar_sobrantes:
+            produccion -= sobrantes
+            np.maximum(produccion, 0, out=produccion)
+        # Recurrencia de sobrantes: se vende min(d, s + p), sobra para mañana min(p, max(s + p - d, 0))
+        # y el resto de lo que no se vendió (sobrantes de ayer) se desperdicia
+        lote = dia // tamano
+        np.add(sobrantes, produccion, out=disponible)
+        np.minimum(disponible, demanda, out=vendidas_de_hoy)
+        vendidas[lote] += vendidas_de_hoy
+        disponible -= demanda
+        np.maximum(disponible, 0, out=disponible)
+        np.minimum(disponible, produccion, out=sobrantes)
+        disponible -= sobrantes
+        desperdiciadas[lote] += disponible
+        definicion["actualizar"](estado, dia, tipo, demanda)
+    # Demanda total de cada lote (L, R, 1): lo que no se vendió se perdió
+    perdidas = sumar_por_lotes(demandas, tamano).T[:, :, None] - vendidas
+    if tamano_lote is None:
+        return vendidas[0], desperdiciadas[0], perdidas[0]
+    return tuple(np.moveaxis(conteo, 0, -1) for conteo in (vendidas, desperdiciadas, perdidas))
+
+@registrar_politica(
+    "suavizado_exponencial",
+    {"alpha": [0.1, 0.2, 0.3, 0.5, 0.7], "stock_seguridad": [0, 6, 12, 18, 24], "produccion_inicial": [60]},
+    "Producción = suavizado exponencial de la demanda del mismo tipo de día + stock de seguridad"
+)
+def simular_suavizado_exponencial_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """Suavizado exponencial simple por tipo de día (ver simular_pronostico_matriz)."""
+    return simular_pronostico_matriz(demandas, es_finde, combinaciones, "simple", tamano_lote=tamano_lote)
+
+@registrar_politica(
+    "holt_winters",
+    {"alpha": [0.1, 0.3, 0.5], "beta": [0, 0.1], "gamma": [0.1, 0.3, 0.5], "stock_seguridad": [0, 6, 12, 18],
+     "produccion_inicial": [60]},
+    "Producción = pronóstico de Holt-Winters con estacionalidad semanal + stock de seguridad"
+)
+def simular_holt_winters_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """Holt-Winters aditivo con estacionalidad semanal (ver simular_pronostico_matriz)."""
+    return simular_pronostico_matriz(demandas, es_finde, combinaciones, "holt_winters", tamano_lote=tamano_lote)
+
+@registrar_politica(
+    "pedido_hasta_nivel",
+    {"alpha": [0.1, 0.3, 0.5], "beta": [0, 0.1], "gamma": [0.1, 0.3, 0.5], "stock_seguridad": [0, 12, 24, 36],
+     "produccion_inicial": [60]},
+    "Producción = pronóstico de Holt-Winters + stock de seguridad - sobrantes de ayer"
+)
+def simular_pedido_hasta_nivel_matriz(demandas, es_finde, combinaciones, tamano_lote=None):
+    """Pedido hasta el nivel de Holt-Winters + stock de seguridad, restando los sobrantes (ver simular_pronostico_matriz)."""
+    return simular_pronostico_matriz(demandas, es_finde, combinaciones, "holt_winters", restar_sobrantes=True,
+                                     tamano_lote=tamano_lote)
+
+if __name__ == "__main__":
+    from campania import main
+    main(["suavizado_exponencial", "holt_winters", "pedido_hasta_nivel", "--replicas", "10000", "--days", "30"])
@@ -0,0 +1,159 @@
+# Prueba estadística para números aleatorios
+# Descripción: Este script implementa la "Prueba de Corridas Arriba y Abajo" para verificar la independencia
+# de una secuencia de números aleatorios: cuenta las rachas de subidas y bajadas consecutivas y compara la
+# cantidad con la esperada, (2n - 1) / 3, con varianza (16n - 29) / 90.
+#
+# Los empates (dos números iguales seguidos) no son ni subida ni bajada y se saltean: n es la cantidad
+# de números que quedan después de sacar los repetidos consecutivos.
+
+import math
+
+import numpy as np
+try:
+    from pruebas_estadisticas.valores_criticos import normal_ppf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import normal_ppf
+
+# --- Versión por bloques ---
+# Cada bloque guarda sus signos extremos y su primer y último número, así al combinar dos bloques
+# se puede contar el cambio de signo que cae justo en el borde entre ellos.
+
+def nuevo_estado_corridas():
+    """
+    Estado vacío de la prueba de corridas: cantidad de números, signos (subidas o bajadas sin empates),
+    cambios de signo, primer y último número y primer y último signo (0 si no hay).
+    """
+    return {"n": 0, "signos": 0, "cambios": 0, "primero": None, "ultimo": None, "signo_inicial": 0, "signo_final": 0}
+
+def _valores(bloque):
+    bloque = np.asarray(bloque)
+    # Los cuantizados (uint16) se comparan como enteros: el orden es el mismo que el de k / 10^4
+    if bloque.dtype == np.uint16:
+        return bloque.astype(np.int32)
+    return bloque.astype(np.float64, copy=False)
+
+def _estado_de_bloque(bloque):
+    valores = _valores(bloque)
+    if len(valores) == 0:
+        return nuevo_estado_corridas()
+    signos = np.sign(np.diff(valores))
+    signos = signos[signos != 0]
+    return {
+        "n": len(valores),
+        "signos": len(signos),
+        "cambios": int(np.count_nonzero(signos[1:] != signos[:-1])),
+        # Los extremos se guardan como float para poder combinar bloques cuantizados y de floats
+        "primero": float(valores[0] / 10000.0 if valores.dtype == np.int32 else valores[0]),
+        "ultimo": float(valores[-1] / 10000.0 if valores.dtype == np.int32 else valores[-1]),
+        "signo_inicial": int(signos[0]) if len(signos) else 0,
+        "signo_final": int(signos[-1]) if len(signos) else 0
+    }
+
+def combinar_corridas(estado, otro):
+    """Combina dos estados calculados sobre partes consecutivas de la secuencia (`otro` va después)."""
+    if estado["n"] == 0:
+        return dict(otro)
+    if otro["n"] == 0:
+        return dict(estado)
+    signos = estado["signos"] + otro["signos"]
+    cambios = estado["cambios"] + otro["cambios"]
+    # Signo entre el último número de `estado` y el primero de `otro`, y los cambios que agrega en el borde
+    signo_borde = int(np.sign(otro["primero"] - estado["ultimo"]))
+    extremos = [s for s in (estado["signo_final"], signo_borde, otro["signo_inicial"]) if s != 0]
+    if signo_borde != 0:
+        signos += 1
+    cambios += sum(1 for anterior, siguiente in zip(extremos, extremos[1:]) if anterior != siguiente)
+    return {
+        "n": estado["n"] + otro["n"],
+        "signos": signos,
+        "cambios": cambios,
+        "primero": estado["primero"],
+        "ultimo": otro["ultimo"],
+        "signo_inicial": estado["signo_inicial"] or signo_borde or otro["signo_inicial"],
+        "signo_final": otro["signo_final"] or signo_borde or estado["signo_final"]
+    }
+
+def actualizar_corridas(estado, bloque):
+    """Agrega al estado el bloque de números que sigue en la secuencia."""
+    estado.update(combinar_corridas(estado, _estado_de_bloque(bloque)))
+    return estado
+
+def prueba_de_corridas(numeros_aleatorios, alpha=0.05, verbose=True):
+    """
+    Realiza la prueba de corridas arriba y abajo para determinar si un conjunto de números
+    aleatorios es independiente.
+
+    Parámetros:
+    numeros_aleatorios (list): Lista de números aleatorios entre 0 y 1.
+    alpha (float): Nivel de significancia. Por defecto es 0.05.
+
+    Retorna:
+    bool: True si se acepta la hipótesis nula (los números son independientes), False en caso contrario.
+    """
+    return finalizar_corridas(actualizar_corridas(nuevo_estado_corridas(), numeros_aleatorios), alpha, verbose)
+
+def estadistico_corridas(estado):
+    """
+    Estadístico z de la prueba de corridas y su p-valor de dos colas (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad (None) y p_valor.
+    """
+    # Números que quedan sin los repetidos consecutivos y corridas que forman
+    n = estado["signos"] + 1
+    corridas = estado["cambios"] + 1 if estado["signos"] else 0
+    media = (2 * n - 1) / 3
+    desviacion = math.sqrt((16 * n - 29) / 90)
+    z = (corridas - media) / desviacion
+    return {"estadistico": z, "grados_libertad": None, "p_valor": math.erfc(abs(z) / math.sqrt(2))}
+
+def finalizar_corridas(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba de corridas a partir del estado acumulado (ver prueba_de_corridas).
+    """
+    # Hacen falta al menos 2 números distintos para la varianza (16n - 29) / 90
+    if estado["signos"] + 1 < 2:
+        if verbose:
+            print("ERROR: Número insuficiente de datos para realizar la prueba.")
+        return False
+    n = estado["signos"] + 1
+    corridas = estado["cambios"] + 1
+    media = (2 * n - 1) / 3
+    estadistico = estadistico_corridas(estado)
+    z = estadistico["estadistico"]
+    z_critico = normal_ppf(1 - alpha/2)  # Para una prueba de dos colas
+    if verbose:
+        print("\n=== PRUEBA DE CORRIDAS ARRIBA Y ABAJO ===")
+        print("Hipótesis nula: La secuencia de números aleatorios es independiente.")
+        print("Hipótesis alternativa: La secuencia de números aleatorios no es independiente.")
+        print(f"Números analizados (sin repetidos consecutivos): {n} de {estado['n']}")
+        print(f"Corridas observadas: {corridas}")
+        print(f"Corridas esperadas: {media:.4f}")
+        print(f"Estadístico Z: {z:.4f}")
+        print(f"Valor crítico (alpha={alpha}): ±{z_critico:.4f}")
+        print(f"P-valor: {estadistico['p_valor']:.6f}")
+
+    resultado = abs(z) <= z_critico
+    if verbose:
+        if resultado:
+            print(f"\nCONCLUSIÓN PRUEBA DE CORRIDAS: La secuencia pasa la prueba de corridas y puede considerarse independiente (nivel de confianza {(1-alpha)*100}%).")
+        else:
+            print(f"\nCONCLUSIÓN PRUEBA DE CORRIDAS: La secuencia no pasa la prueba de corridas. Las subidas y bajadas no son consistentes con una secuencia independiente (nivel de confianza {(1-alpha)*100}%).")
+        print("=== FIN DE LA PRUEBA DE CORRIDAS ===")
+    return resultado
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    try:
+        # Cargar los números aleatorios desde el archivo CSV
+        with open('numeros_aleatorios_metodo_mixto.csv', 'r') as f:
+            numeros_aleatorios = [float(line.strip()) for line in f]
+
+        # Realizar la prueba de corridas
+        resultado = prueba_de_corridas(numeros_aleatorios)
+
+    except FileNotFoundError:
+        print("Error: No se encontró el archivo 'numeros_aleatorios_metodo_mixto.csv'.")
+        print("Primero genera los números aleatorios con el script generador.")
+    except Exception as e:
+        print(f"Error al ejecutar la prueba: {str(e)}")
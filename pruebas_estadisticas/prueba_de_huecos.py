@@ -0,0 +1,157 @@
+# Prueba estadística para números aleatorios
+# Descripción: Este script implementa la "Prueba de Huecos" para verificar la independencia de una secuencia
+# de números aleatorios: mide cuántos números hay entre dos apariciones consecutivas de un número dentro del
+# intervalo [alfa, beta) y compara esas longitudes con la distribución geométrica que tendrían si los números
+# fueran independientes: P(hueco = i) = p (1 - p)^i, con p = beta - alfa.
+#
+# Los huecos de longitud >= max_hueco van en una sola clase. Los números anteriores a la primera aparición
+# no forman un hueco y no se cuentan.
+
+import numpy as np
+try:
+    from pruebas_estadisticas.valores_criticos import chi2_ppf, chi2_cdf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import chi2_ppf, chi2_cdf
+
+# --- Versión por bloques ---
+# Cada bloque guarda, además de las frecuencias de los huecos completos, cuántos números hay antes de su
+# primera aparición y después de la última: al combinar dos bloques esos dos tramos forman un hueco más.
+
+def nuevo_estado_huecos(alfa=0.0, beta=0.5, max_hueco=5):
+    """
+    Estado vacío de la prueba de huecos: cantidad de números, frecuencias de las longitudes 0..max_hueco
+    (la última es ">= max_hueco"), números antes de la primera aparición y después de la última.
+    """
+    return {"n": 0, "alfa": alfa, "beta": beta, "frecuencias": np.zeros(max_hueco + 1, dtype=np.int64),
+            "hay_apariciones": False, "antes_primera": 0, "despues_ultima": 0}
+
+def _frecuencias_huecos(longitudes, max_hueco):
+    return np.bincount(np.minimum(longitudes, max_hueco), minlength=max_hueco + 1).astype(np.int64)
+
+def _estado_de_bloque(estado, bloque):
+    bloque = np.asarray(bloque)
+    if bloque.dtype == np.uint16:
+        bloque = bloque / 10000.0
+    max_hueco = len(estado["frecuencias"]) - 1
+    apariciones = np.flatnonzero((bloque >= estado["alfa"]) & (bloque < estado["beta"]))
+    parcial = nuevo_estado_huecos(estado["alfa"], estado["beta"], max_hueco)
+    parcial["n"] = len(bloque)
+    if len(apariciones) == 0:
+        parcial["antes_primera"] = parcial["despues_ultima"] = len(bloque)
+        return parcial
+    parcial["frecuencias"] = _frecuencias_huecos(np.diff(apariciones) - 1, max_hueco)
+    parcial["hay_apariciones"] = True
+    parcial["antes_primera"] = int(apariciones[0])
+    parcial["despues_ultima"] = len(bloque) - 1 - int(apariciones[-1])
+    return parcial
+
+def combinar_huecos(estado, otro):
+    """Combina dos estados calculados sobre partes consecutivas de la secuencia (`otro` va después)."""
+    combinado = dict(estado, n=estado["n"] + otro["n"], frecuencias=estado["frecuencias"] + otro["frecuencias"],
+                     hay_apariciones=estado["hay_apariciones"] or otro["hay_apariciones"])
+    if estado["hay_apariciones"] and otro["hay_apariciones"]:
+        # El tramo final de `estado` y el inicial de `otro` forman un hueco completo
+        longitud = min(estado["despues_ultima"] + otro["antes_primera"], len(estado["frecuencias"]) - 1)
+        combinado["frecuencias"] = combinado["frecuencias"].copy()
+        combinado["frecuencias"][longitud] += 1
+    combinado["antes_primera"] = estado["antes_primera"] if estado["hay_apariciones"] else estado["n"] + otro["antes_primera"]
+    combinado["despues_ultima"] = otro["despues_ultima"] if otro["hay_apariciones"] else estado["despues_ultima"] + otro["n"]
+    return combinado
+
+def actualizar_huecos(estado, bloque):
+    """Agrega al estado el bloque de números que sigue en la secuencia."""
+    estado.update(combinar_huecos(estado, _estado_de_bloque(estado, bloque)))
+    return estado
+
+def prueba_de_huecos(numeros_aleatorios, alfa=0.0, beta=0.5, max_hueco=5, alpha=0.05, verbose=True):
+    """
+    Realiza la prueba de huecos para determinar si un conjunto de números aleatorios es independiente.
+
+    Parámetros:
+    numeros_aleatorios (list): Lista de números aleatorios entre 0 y 1.
+    alfa, beta (float): Intervalo [alfa, beta) que marca las apariciones. Por defecto [0, 0.5).
+    max_hueco (int): Longitud a partir de la cual los huecos van en una sola clase. Por defecto es 5.
+    alpha (float): Nivel de significancia. Por defecto es 0.05.
+
+    Retorna:
+    bool: True si se acepta la hipótesis nula (los números son independientes), False en caso contrario.
+    """
+    estado = actualizar_huecos(nuevo_estado_huecos(alfa, beta, max_hueco), numeros_aleatorios)
+    return finalizar_huecos(estado, alpha, verbose)
+
+def _frecuencias_esperadas(estado):
+    max_hueco = len(estado["frecuencias"]) - 1
+    p = estado["beta"] - estado["alfa"]
+    total = estado["frecuencias"].sum()
+    probabilidades = p * (1 - p) ** np.arange(max_hueco, dtype=np.float64)
+    return total * np.append(probabilidades, (1 - p) ** max_hueco)
+
+def estadistico_huecos(estado):
+    """
+    Estadístico chi-cuadrado de la prueba de huecos y su p-valor (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad y p_valor.
+    """
+    esperadas = _frecuencias_esperadas(estado)
+    chi_cuadrado = float(np.sum((estado["frecuencias"] - esperadas) ** 2 / esperadas))
+    df = len(esperadas) - 1
+    return {"estadistico": chi_cuadrado, "grados_libertad": df, "p_valor": 1 - chi2_cdf(chi_cuadrado, df)}
+
+def finalizar_huecos(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba de huecos a partir del estado acumulado (ver prueba_de_huecos).
+    """
+    frecuencias = estado["frecuencias"]
+    total_huecos = int(frecuencias.sum())
+    if total_huecos == 0:
+        if verbose:
+            print("ERROR: Número insuficiente de datos para realizar la prueba.")
+        return False
+    esperadas = _frecuencias_esperadas(estado)
+    if verbose and esperadas.min() < 5:
+        print(f"ADVERTENCIA: Hay clases con frecuencia esperada menor que 5 ({total_huecos} huecos).")
+
+    chi_cuadrado = np.sum((frecuencias - esperadas) ** 2 / esperadas)
+    df = len(frecuencias) - 1
+    chi_cuadrado_critico = chi2_ppf(1 - alpha, df)
+    if verbose:
+        p_valor = 1 - chi2_cdf(chi_cuadrado, df)
+        print("\n=== PRUEBA DE HUECOS ===")
+        print("Hipótesis nula: La secuencia de números aleatorios es independiente.")
+        print("Hipótesis alternativa: La secuencia de números aleatorios no es independiente.")
+        print(f"Intervalo de aparición: [{estado['alfa']}, {estado['beta']})")
+        print(f"Huecos analizados: {total_huecos}")
+        print(f"{'Longitud':<12} {'Frec. Observada':<20} {'Frec. Esperada':<20}")
+        for i, (observada, esperada) in enumerate(zip(frecuencias, esperadas)):
+            longitud = f">= {i}" if i == len(frecuencias) - 1 else str(i)
+            print(f"{longitud:<12} {observada:<20} {esperada:.2f}")
+        print(f"Estadístico Chi-Cuadrado: {chi_cuadrado:.4f}")
+        print(f"Grados de libertad: {df}")
+        print(f"Valor crítico (alpha={alpha}): {chi_cuadrado_critico:.4f}")
+        print(f"P-valor: {p_valor:.6f}")
+
+    resultado = chi_cuadrado <= chi_cuadrado_critico
+    if verbose:
+        if resultado:
+            print(f"\nCONCLUSIÓN PRUEBA DE HUECOS: La secuencia pasa la prueba de huecos y puede considerarse independiente (nivel de confianza {(1-alpha)*100}%).")
+        else:
+            print(f"\nCONCLUSIÓN PRUEBA DE HUECOS: La secuencia no pasa la prueba de huecos. Las distancias entre apariciones no son consistentes con una secuencia independiente (nivel de confianza {(1-alpha)*100}%).")
+        print("=== FIN DE LA PRUEBA DE HUECOS ===")
+    return bool(resultado)
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    try:
+        # Cargar los números aleatorios desde el archivo CSV
+        with open('numeros_aleatorios_metodo_mixto.csv', 'r') as f:
+            numeros_aleatorios = [float(line.strip()) for line in f]
+
+        # Realizar la prueba de huecos
+        resultado = prueba_de_huecos(numeros_aleatorios)
+
+    except FileNotFoundError:
+        print("Error: No se encontró el archivo 'numeros_aleatorios_metodo_mixto.csv'.")
+        print("Primero genera los números aleatorios con el script generador.")
+    except Exception as e:
+        print(f"Error al ejecutar la prueba: {str(e)}")
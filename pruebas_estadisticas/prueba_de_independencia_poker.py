@@ -2,9 +2,14 @@
 # Descripción: Este script implementa la cuarta prueba estadística, "Prueba de Poker" para verificar la independencia de una secuencia de números aleatorios.
 
 # import numpy as np
-from scipy import stats
+try:
+    from pruebas_estadisticas.valores_criticos import chi2_ppf, chi2_cdf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import chi2_ppf, chi2_cdf
 # import math
 from collections import Counter
+from functools import lru_cache
+import numpy as np
 
 def obtener_patron_poker(grupo):
     """
@@ -72,34 +77,107 @@ def probabilidades_poker_teoricas(tamano_grupo=5):
         # Para otros tamaños de grupo, sería necesario calcular las probabilidades
         raise ValueError(f"No hay probabilidades teóricas implementadas para grupos de tamaño {tamano_grupo}")
 
+PATRONES = ("TD", "1P", "2P", "T", "TP", "P", "Q")
+
+def digitos_poker(num, tamano_grupo=5):
+    """Primeros `tamano_grupo` dígitos de un número, tal como los toma la prueba de poker."""
+    # Convertir el número a string, quitar el '0.' y tomar los primeros dígitos
+    return str(num).replace("0.", "").ljust(tamano_grupo, '0')[:tamano_grupo]
+
+@lru_cache(maxsize=None)
+def tabla_patrones_cuantizados(tamano_grupo=5):
+    """
+    Tabla k -> índice en PATRONES para los números cuantizados k = 0..10000 (k / 10^4).
+    Se arma aplicando la misma extracción de dígitos a cada uno de los 10001 valores posibles,
+    así que da los mismos patrones que la versión con cadenas (incluido 1.0).
+    """
+    return np.array([PATRONES.index(obtener_patron_poker(digitos_poker(k / 10000.0, tamano_grupo)))
+                     for k in range(10001)], dtype=np.uint8)
+
+def conteo_patrones_poker(numeros_aleatorios, tamano_grupo=5):
+    """
+    Cuenta los patrones de poker de la secuencia.
+    Los números cuantizados (array uint16, ver generador_congruencial_np) y los floats con a lo sumo
+    4 decimales (k / 10^4, como los del generador) se cuentan con una tabla; el resto con cadenas.
+    """
+    if isinstance(numeros_aleatorios, np.ndarray) and numeros_aleatorios.dtype == np.uint16:
+        cuantizados, resto = numeros_aleatorios, []
+    else:
+        flotantes = np.asarray(numeros_aleatorios, dtype=np.float64)
+        k = np.rint(flotantes * 10000)
+        # Solo los que son exactamente k / 10^4 (y no -0.0, que se escribe distinto) tienen los dígitos de la tabla
+        en_tabla = (k >= 0) & (k <= 10000) & (k / 10000.0 == flotantes) & ~np.signbit(flotantes)
+        cuantizados, resto = k[en_tabla].astype(np.uint16), flotantes[~en_tabla].tolist()
+    conteos = np.bincount(tabla_patrones_cuantizados(tamano_grupo)[cuantizados], minlength=len(PATRONES))
+    conteo = Counter({patron: int(cantidad) for patron, cantidad in zip(PATRONES, conteos) if cantidad})
+    # Identificar el patrón de poker de cada grupo
+    conteo.update(obtener_patron_poker(digitos_poker(num, tamano_grupo)) for num in resto)
+    return conteo
+
+# --- Versión por bloques ---
+# La prueba se puede calcular sobre una secuencia que no entra en memoria: se actualiza un estado
+# con cada bloque (en uno o varios procesos), se combinan los estados y se decide al final.
+
+def nuevo_estado_poker(tamano_grupo=5):
+    """Estado vacío de la prueba de poker: cantidad y conteo acumulado de cada patrón."""
+    return {"n": 0, "tamano_grupo": tamano_grupo, "conteo": Counter()}
+
+def actualizar_poker(estado, bloque):
+    """Agrega un bloque de números (floats o cuantizados) al estado."""
+    estado["n"] += len(bloque)
+    estado["conteo"].update(conteo_patrones_poker(bloque, estado["tamano_grupo"]))
+    return estado
+
+def combinar_poker(estado, otro):
+    """Combina dos estados calculados sobre partes distintas de la secuencia."""
+    return {"n": estado["n"] + otro["n"], "tamano_grupo": estado["tamano_grupo"], "conteo": estado["conteo"] + otro["conteo"]}
+
 def prueba_poker(numeros_aleatorios, tamano_grupo=5, alpha=0.05,verbose=True):
     """
     Realiza la prueba de Poker para determinar la independencia de un conjunto de números aleatorios.
     
     Parámetros:
-    numeros_aleatorios (list): Lista de números aleatorios entre 0 y 1.
+    numeros_aleatorios (list): Lista de números aleatorios entre 0 y 1 (o array uint16 de números cuantizados).
     tamano_grupo (int): Tamaño del grupo de dígitos a analizar. Por defecto es 5.
     alpha (float): Nivel de significancia. Por defecto es 0.05.
     
     Retorna:
     bool: True si se acepta la hipótesis nula (independencia), False en caso contrario.
     """
-    # Verificar que tenemos suficientes datos
-    n = len(numeros_aleatorios)
-    
-    # Convertir números a cadenas con dígitos específicos
-    # Necesitamos extraer los primeros 'tamano_grupo' dígitos de cada número
-    grupos = []
-    for num in numeros_aleatorios:
-        # Convertir el número a string, quitar el '0.' y tomar los primeros dígitos
-        digitos = str(num).replace("0.", "").ljust(tamano_grupo, '0')[:tamano_grupo]
-        grupos.append(digitos)
+    return finalizar_poker(actualizar_poker(nuevo_estado_poker(tamano_grupo), numeros_aleatorios), alpha, verbose)
+
+def categorias_poker(estado):
+    """
+    Categorías de la prueba chi-cuadrado de poker: los patrones con frecuencia esperada >= 5 y,
+    si entre todos llegan a 5, los demás agrupados en "Otros".
+
+    Retorna:
+    tuple: (nombres, frecuencias observadas, frecuencias esperadas)
+    """
+    conteo_patrones = estado["conteo"]
+    freq_esperadas = {patron: prob * estado["n"] for patron, prob in probabilidades_poker_teoricas(estado["tamano_grupo"]).items()}
+    nombres = [patron for patron, esp in freq_esperadas.items() if esp >= 5]
+    observados = [conteo_patrones.get(patron, 0) for patron in nombres]
+    esperados = [freq_esperadas[patron] for patron in nombres]
     
-    # Identificar el patrón de poker de cada grupo
-    patrones = [obtener_patron_poker(grupo) for grupo in grupos]
+    total_agrupado_obs = sum(conteo_patrones.get(patron, 0) for patron, esp in freq_esperadas.items() if esp < 5)
+    total_agrupado_esp = sum(esp for esp in freq_esperadas.values() if esp < 5)
+    if total_agrupado_esp >= 5:
+        nombres.append("Otros")
+        observados.append(total_agrupado_obs)
+        esperados.append(total_agrupado_esp)
+    return nombres, observados, esperados
+
+def finalizar_poker(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba de poker a partir del estado acumulado (ver prueba_poker).
+    """
+    # Verificar que tenemos suficientes datos
+    n = estado["n"]
+    tamano_grupo = estado["tamano_grupo"]
     
-    # Contar ocurrencias de cada patrón
-    conteo_patrones = Counter(patrones)
+    # Ocurrencias de cada patrón
+    conteo_patrones = estado["conteo"]
     
     # Obtener probabilidades teóricas
     prob_teoricas = probabilidades_poker_teoricas(tamano_grupo)
@@ -107,10 +185,8 @@ def prueba_poker(numeros_aleatorios, tamano_grupo=5, alpha=0.05,verbose=True):
     # Calcular frecuencias esperadas
     freq_esperadas = {patron: prob * n for patron, prob in prob_teoricas.items()}
     
-    # Preparamos los datos para la prueba chi-cuadrado
-    patrones_observados = []
-    patrones_esperados = []
-    nombres_patrones = []
+    # Categorías de la prueba chi-cuadrado (las de frecuencia esperada < 5 van agrupadas en "Otros")
+    nombres_patrones, patrones_observados, patrones_esperados = categorias_poker(estado)
     if verbose:
         print("\n=== PRUEBA POKER DE INDEPENDENCIA ===")
         print("Hipótesis nula: La secuencia de números aleatorios es independiente.")
@@ -132,49 +208,29 @@ def prueba_poker(numeros_aleatorios, tamano_grupo=5, alpha=0.05,verbose=True):
     
     # Calcular el estadístico chi-cuadrado
     chi_cuadrado = 0
-    for patron, prob in prob_teoricas.items():
-        observada = conteo_patrones.get(patron, 0)
-        esperada = freq_esperadas[patron]
-        
-        # Solo incluimos categorías con frecuencia esperada >= 5
-        if esperada >= 5:
-            patrones_observados.append(observada)
-            patrones_esperados.append(esperada)
-            nombres_patrones.append(patron)
-            
-            # Contribución al estadístico chi-cuadrado
-            contribucion = ((observada - esperada) ** 2) / esperada
-            chi_cuadrado += contribucion
-            if verbose:
+    for observada, esperada in zip(patrones_observados, patrones_esperados):
+        chi_cuadrado += ((observada - esperada) ** 2) / esperada
+    if verbose:
+        for patron, esperada in freq_esperadas.items():
+            observada = conteo_patrones.get(patron, 0)
+            if esperada >= 5:
+                contribucion = ((observada - esperada) ** 2) / esperada
                 print(f"{patron:<20} {descripciones.get(patron, ''):<20} {observada:<20} {esperada:.2f} {' '*10} {contribucion:.4f}")
-        else:
-            if verbose:
+            else:
                 print(f"{patron:<20} {descripciones.get(patron, ''):<20} {observada:<20} {esperada:.2f} {' '*10} {'Agrupado* ':<20}")
-    
-    # Agrupar categorías con frecuencias esperadas pequeñas
-    # En este ejemplo, agrupamos las categorías con esperados < 5
-    total_agrupado_obs = sum(conteo_patrones.get(patron, 0) for patron, esp in freq_esperadas.items() if esp < 5)
-    total_agrupado_esp = sum(esp for esp in freq_esperadas.values() if esp < 5)
-    
-    if total_agrupado_esp >= 5:
-        if verbose:
-            print(f"{'Otros':<20} {'Categorías agrupadas':<20} {total_agrupado_obs:<20} {total_agrupado_esp:.2f} {' '*10} "
-                f"{((total_agrupado_obs - total_agrupado_esp) ** 2) / total_agrupado_esp:.4f}")
-            
-        patrones_observados.append(total_agrupado_obs)
-        patrones_esperados.append(total_agrupado_esp)
-        nombres_patrones.append("Otros")
-        chi_cuadrado += ((total_agrupado_obs - total_agrupado_esp) ** 2) / total_agrupado_esp
-        if verbose:
+        if "Otros" in nombres_patrones:
+            observada, esperada = patrones_observados[-1], patrones_esperados[-1]
+            print(f"{'Otros':<20} {'Categorías agrupadas':<20} {observada:<20} {esperada:.2f} {' '*10} "
+                f"{((observada - esperada) ** 2) / esperada:.4f}")
             print("*Nota: Las categorías con frecuencia esperada < 5 se han agrupado para la prueba Chi-Cuadrado.")
 
     # Grados de libertad (número de categorías - 1)
     df = len(patrones_observados) - 1
     
-    # Valor crítico y p-valor
-    chi_cuadrado_critico = stats.chi2.ppf(1 - alpha, df)
-    p_valor = 1 - stats.chi2.cdf(chi_cuadrado, df)
+    # Valor crítico y p-valor (el p-valor solo hace falta para el informe)
+    chi_cuadrado_critico = chi2_ppf(1 - alpha, df)
     if verbose:
+        p_valor = 1 - chi2_cdf(chi_cuadrado, df)
         print(f"Estadístico Chi-Cuadrado: {chi_cuadrado:.4f}")
         print(f"Grados de libertad: {df}")
         print(f"Valor crítico (alpha={alpha}): {chi_cuadrado_critico:.4f}")
@@ -192,6 +248,20 @@ def prueba_poker(numeros_aleatorios, tamano_grupo=5, alpha=0.05,verbose=True):
         print("=== FIN DE LA PRUEBA DE INDEPENDENCIA ===")
     return resultado
 
+def estadistico_poker(estado):
+    """
+    Estadístico chi-cuadrado de la prueba de poker y su p-valor (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad y p_valor.
+    """
+    _, observados, esperados = categorias_poker(estado)
+    chi_cuadrado = 0
+    for observada, esperada in zip(observados, esperados):
+        chi_cuadrado += ((observada - esperada) ** 2) / esperada
+    df = len(observados) - 1
+    return {"estadistico": float(chi_cuadrado), "grados_libertad": df, "p_valor": 1 - chi2_cdf(chi_cuadrado, df)}
+
 # Función auxiliar para mostrar ejemplos de patrones
 # def mostrar_ejemplos_patrones():
 #     """
@@ -1,8 +1,32 @@
 # Prueba estadística para números aleatorios
 # Descripción: Este script implementa la primera prueba estadística, "Prueba de Medias", para determinar la validez de un conjunto de números aleatorios.
 
+import math
+
 import numpy as np
-from scipy import stats
+try:
+    from pruebas_estadisticas.valores_criticos import normal_ppf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import normal_ppf
+
+# --- Versión por bloques ---
+# La prueba se puede calcular sobre una secuencia que no entra en memoria: se actualiza un estado
+# con cada bloque (en uno o varios procesos), se combinan los estados y se decide al final.
+
+def nuevo_estado_medias():
+    """Estado vacío de la prueba de medias: cantidad y suma de los números."""
+    return {"n": 0, "suma": 0.0}
+
+def actualizar_medias(estado, bloque):
+    """Agrega un bloque de números al estado."""
+    bloque = np.asarray(bloque, dtype=np.float64)
+    estado["n"] += len(bloque)
+    estado["suma"] += float(np.sum(bloque))
+    return estado
+
+def combinar_medias(estado, otro):
+    """Combina dos estados calculados sobre partes distintas de la secuencia."""
+    return {"n": estado["n"] + otro["n"], "suma": estado["suma"] + otro["suma"]}
 
 def prueba_de_medias(numeros_aleatorios, alpha=0.05, verbose=True):
     """
@@ -16,9 +40,15 @@ def prueba_de_medias(numeros_aleatorios, alpha=0.05, verbose=True):
     Retorna:
     bool: True si se acepta la hipótesis nula (los números son aleatorios), False en caso contrario.
     """
+    return finalizar_medias(actualizar_medias(nuevo_estado_medias(), numeros_aleatorios), alpha, verbose)
+
+def finalizar_medias(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba de medias a partir del estado acumulado (ver prueba_de_medias).
+    """
     
     # Calcular la media
-    media = np.mean(numeros_aleatorios)
+    media = estado["suma"] / estado["n"]
     
     # Valor esperado para una distribución uniforme entre 0 y 1
     media_esperada = 0.5
@@ -27,10 +57,10 @@ def prueba_de_medias(numeros_aleatorios, alpha=0.05, verbose=True):
     desviacion_estandar = 1/np.sqrt(12)
     
     # Error estándar de la media
-    error_estandar = desviacion_estandar / np.sqrt(len(numeros_aleatorios))
+    error_estandar = desviacion_estandar / np.sqrt(estado["n"])
     
     # Valor crítico para el nivel de significancia alpha
-    z_critico = stats.norm.ppf(1 - alpha/2)  # Para una prueba de dos colas
+    z_critico = normal_ppf(1 - alpha/2)  # Para una prueba de dos colas
     
     # Calcular los límites de aceptación
     limite_inferior = media_esperada - z_critico * error_estandar
@@ -58,6 +88,17 @@ def prueba_de_medias(numeros_aleatorios, alpha=0.05, verbose=True):
             print("=== FIN DE LA PRUEBA DE MEDIAS ===")
         return False
 
+def estadistico_medias(estado):
+    """
+    Estadístico z de la prueba de medias y su p-valor de dos colas (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad (None) y p_valor.
+    """
+    error_estandar = (1 / math.sqrt(12)) / math.sqrt(estado["n"])
+    z = (estado["suma"] / estado["n"] - 0.5) / error_estandar
+    return {"estadistico": float(z), "grados_libertad": None, "p_valor": math.erfc(abs(z) / math.sqrt(2))}
+
 # Ejemplo de uso
 if __name__ == "__main__":
     try:
@@ -2,7 +2,29 @@
 # Descripción: Este script implementa la tercera prueba estadística "Chi-Cuadrada" para verificar la uniformidad de un conjunto de números aleatorios.
 
 import numpy as np
-from scipy import stats
+try:
+    from pruebas_estadisticas.valores_criticos import chi2_ppf, chi2_cdf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import chi2_ppf, chi2_cdf
+
+# --- Versión por bloques ---
+# La prueba se puede calcular sobre una secuencia que no entra en memoria: se actualiza un estado
+# con cada bloque (en uno o varios procesos), se combinan los estados y se decide al final.
+
+def nuevo_estado_chi_cuadrada(num_intervalos=10):
+    """Estado vacío de la prueba chi-cuadrada: cantidad y frecuencias acumuladas de cada intervalo."""
+    return {"n": 0, "frecuencias": np.zeros(num_intervalos, dtype=np.int64)}
+
+def actualizar_chi_cuadrada(estado, bloque):
+    """Agrega un bloque de números al estado."""
+    frecuencias, _ = np.histogram(bloque, bins=len(estado["frecuencias"]), range=(0, 1))
+    estado["n"] += len(bloque)
+    estado["frecuencias"] += frecuencias
+    return estado
+
+def combinar_chi_cuadrada(estado, otro):
+    """Combina dos estados calculados sobre partes distintas de la secuencia."""
+    return {"n": estado["n"] + otro["n"], "frecuencias": estado["frecuencias"] + otro["frecuencias"]}
 
 def prueba_chi_cuadrada(numeros_aleatorios, num_intervalos=10, alpha=0.05, verbose = True):
     """
@@ -17,8 +39,16 @@ def prueba_chi_cuadrada(numeros_aleatorios, num_intervalos=10, alpha=0.05, verbo
     Retorna:
     bool: True si se acepta la hipótesis nula (distribución uniforme), False en caso contrario.
     """
+    estado = actualizar_chi_cuadrada(nuevo_estado_chi_cuadrada(num_intervalos), numeros_aleatorios)
+    return finalizar_chi_cuadrada(estado, alpha, verbose)
+
+def finalizar_chi_cuadrada(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba chi-cuadrada a partir del estado acumulado (ver prueba_chi_cuadrada).
+    """
     # Número total de observaciones
-    n = len(numeros_aleatorios)
+    n = estado["n"]
+    num_intervalos = len(estado["frecuencias"])
     
     # Verificar que tenemos suficientes datos para el número de intervalos
     if n < 5 * num_intervalos:
@@ -32,8 +62,9 @@ def prueba_chi_cuadrada(numeros_aleatorios, num_intervalos=10, alpha=0.05, verbo
     # Frecuencia esperada en cada intervalo (distribución uniforme)
     frecuencia_esperada = n / num_intervalos
     
-    # Crear histograma para contar frecuencias observadas
-    frecuencias_observadas, bordes = np.histogram(numeros_aleatorios, bins=num_intervalos, range=(0, 1))
+    # Frecuencias observadas (histograma acumulado) y bordes de los intervalos, los mismos de np.histogram
+    frecuencias_observadas = estado["frecuencias"]
+    bordes = np.linspace(0, 1, num_intervalos + 1)
     
     # Calcular el estadístico Chi-Cuadrado
     chi_cuadrado = np.sum((frecuencias_observadas - frecuencia_esperada) ** 2 / frecuencia_esperada)
@@ -43,13 +74,12 @@ def prueba_chi_cuadrada(numeros_aleatorios, num_intervalos=10, alpha=0.05, verbo
     df = num_intervalos - 1
     
     # Valor crítico de chi-cuadrado
-    chi_cuadrado_critico = stats.chi2.ppf(1 - alpha, df)
-    
-    # Calcular p-valor
-    p_valor = 1 - stats.chi2.cdf(chi_cuadrado, df)
+    chi_cuadrado_critico = chi2_ppf(1 - alpha, df)
     
     # Mostrar resultados
     if verbose:
+        # Calcular p-valor (solo hace falta para el informe)
+        p_valor = 1 - chi2_cdf(chi_cuadrado, df)
         print(f"\n=== PRUEBA CHI-CUADRADA DE UNIFORMIDAD ===")
         print("Hipótesis nula: La secuencia de números aleatorios sigue una distribución uniforme.")
         print("Hipótesis alternativa: La secuencia de números aleatorios no sigue una distribución uniforme.")
@@ -81,6 +111,19 @@ def prueba_chi_cuadrada(numeros_aleatorios, num_intervalos=10, alpha=0.05, verbo
         print("=== FIN DE LA PRUEBA DE UNIFORMIDAD ===")
     return resultado
 
+def estadistico_chi_cuadrada(estado):
+    """
+    Estadístico de la prueba chi-cuadrada y su p-valor (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad y p_valor.
+    """
+    num_intervalos = len(estado["frecuencias"])
+    frecuencia_esperada = estado["n"] / num_intervalos
+    chi_cuadrado = float(np.sum((estado["frecuencias"] - frecuencia_esperada) ** 2 / frecuencia_esperada))
+    df = num_intervalos - 1
+    return {"estadistico": chi_cuadrado, "grados_libertad": df, "p_valor": 1 - chi2_cdf(chi_cuadrado, df)}
+
 # Ejemplo de uso
 if __name__ == "__main__":
     try:
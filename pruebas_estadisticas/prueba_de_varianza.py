@@ -2,7 +2,47 @@
 # Descripción: Este script implementa la prueba estadística llamada "Prueba de Varianza" para determinar la validez de un conjunto de números aleatorios.
 
 import numpy as np
-from scipy import stats
+try:
+    from pruebas_estadisticas.valores_criticos import chi2_ppf, chi2_cdf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import chi2_ppf, chi2_cdf
+
+# --- Versión por bloques ---
+# La prueba se puede calcular sobre una secuencia que no entra en memoria: se actualiza un estado
+# con cada bloque (en uno o varios procesos), se combinan los estados y se decide al final.
+# El estado guarda la media y la suma de cuadrados centrados (m2) en lugar de la suma de cuadrados,
+# que con miles de millones de números pierde precisión al restar dos cantidades grandes.
+
+def nuevo_estado_varianza():
+    """Estado vacío de la prueba de varianza: cantidad, media y suma de cuadrados centrados."""
+    return {"n": 0, "media": 0.0, "m2": 0.0}
+
+def combinar_varianza(estado, otro):
+    """
+    Combina dos estados calculados sobre partes distintas de la secuencia (Chan et al.).
+    """
+    if estado["n"] == 0:
+        return dict(otro)
+    if otro["n"] == 0:
+        return dict(estado)
+    n = estado["n"] + otro["n"]
+    delta = otro["media"] - estado["media"]
+    return {
+        "n": n,
+        "media": estado["media"] + delta * otro["n"] / n,
+        "m2": estado["m2"] + otro["m2"] + delta ** 2 * estado["n"] * otro["n"] / n
+    }
+
+def actualizar_varianza(estado, bloque):
+    """Agrega un bloque de números al estado."""
+    bloque = np.asarray(bloque, dtype=np.float64)
+    if len(bloque) == 0:
+        return estado
+    media = bloque.mean()
+    desvios = bloque - media
+    estado.update(combinar_varianza(estado, {"n": len(bloque), "media": float(media),
+                                             "m2": float(np.sum(desvios * desvios))}))
+    return estado
 
 def prueba_de_varianza(numeros_aleatorios, alpha=0.05, verbose=True):
     """
@@ -16,12 +56,18 @@ def prueba_de_varianza(numeros_aleatorios, alpha=0.05, verbose=True):
     Retorna:
     bool: True si se acepta la hipótesis nula (los números son aleatorios), False en caso contrario.
     """
+    return finalizar_varianza(actualizar_varianza(nuevo_estado_varianza(), numeros_aleatorios), alpha, verbose)
+
+def finalizar_varianza(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba de varianza a partir del estado acumulado (ver prueba_de_varianza).
+    """
     
     # Número de observaciones
-    n = len(numeros_aleatorios)
+    n = estado["n"]
     
-    # Calcular la varianza muestral
-    varianza_muestral = np.var(numeros_aleatorios, ddof=1)  # ddof=1 para varianza muestral insesgada
+    # Calcular la varianza muestral (insesgada, como np.var con ddof=1)
+    varianza_muestral = estado["m2"] / (n - 1)
     
     # Varianza teórica para una distribución uniforme entre 0 y 1
     varianza_teorica = 1/12
@@ -30,8 +76,8 @@ def prueba_de_varianza(numeros_aleatorios, alpha=0.05, verbose=True):
     df = n - 1
     
     # Valores críticos de chi-cuadrado para el nivel de significancia alpha
-    chi2_inferior = stats.chi2.ppf(alpha/2, df)
-    chi2_superior = stats.chi2.ppf(1 - alpha/2, df)
+    chi2_inferior = chi2_ppf(alpha/2, df)
+    chi2_superior = chi2_ppf(1 - alpha/2, df)
     
     # Calcular los límites de aceptación para la varianza
     limite_inferior = (df * varianza_teorica) / chi2_superior
@@ -66,12 +112,24 @@ def prueba_de_varianza(numeros_aleatorios, alpha=0.05, verbose=True):
     # Verificación alternativa con p-valor
     if verbose:
         print("\n=== VERIFICACIÓN CON P-VALOR ===")
-        p_valor = 2 * min(stats.chi2.cdf(estadistico, df), 1 - stats.chi2.cdf(estadistico, df))
+        p_valor = 2 * min(chi2_cdf(estadistico, df), 1 - chi2_cdf(estadistico, df))
         print(f"P-valor de la prueba: {p_valor:.6f}")
         print(f"Interpretación p-valor: {f'Se acepta la hipótesis nula ({p_valor:.6f} > {alpha})' if p_valor > alpha else f'Se rechaza la hipótesis nula ({p_valor:.6f} <= {alpha})'}")
         print("=== FIN DE LA PRUEBA DE VARIANZA ===")
     return resultado
 
+def estadistico_varianza(estado):
+    """
+    Estadístico chi-cuadrado de la prueba de varianza y su p-valor de dos colas (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad y p_valor.
+    """
+    df = estado["n"] - 1
+    estadistico = df * (estado["m2"] / df) / (1/12)
+    acumulada = chi2_cdf(estadistico, df)
+    return {"estadistico": float(estadistico), "grados_libertad": df, "p_valor": 2 * min(acumulada, 1 - acumulada)}
+
 # Ejemplo de uso
 if __name__ == "__main__":
     try:
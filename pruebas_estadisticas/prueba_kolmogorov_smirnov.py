@@ -0,0 +1,122 @@
+# Prueba estadística para números aleatorios
+# Descripción: Este script implementa la "Prueba de Kolmogorov-Smirnov" para verificar la uniformidad de un
+# conjunto de números aleatorios: compara la función de distribución empírica con la de la uniforme en [0, 1]
+# y rechaza si la mayor distancia D entre ambas supera el valor crítico.
+#
+# La distribución empírica se arma contando cuántas veces aparece cada valor k / 10^4 (10001 casillas), así que
+# se puede acumular por bloques sin ordenar la secuencia. Para los números del generador, que tienen 4 decimales,
+# D es exacto; otros floats se redondean a 4 decimales, lo que cambia D en a lo sumo 0.00005.
+
+import numpy as np
+try:
+    from pruebas_estadisticas.valores_criticos import ks_ppf, ks_sf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import ks_ppf, ks_sf
+
+# Casillas de la distribución empírica: los valores k / 10^4 con k = 0..10000
+CASILLAS = 10001
+
+# --- Versión por bloques ---
+# El estado es el conteo de cada valor; los conteos de distintos bloques se suman.
+
+def nuevo_estado_kolmogorov_smirnov():
+    """Estado vacío de la prueba de Kolmogorov-Smirnov: cantidad y conteo de cada valor k / 10^4."""
+    return {"n": 0, "conteo": np.zeros(CASILLAS, dtype=np.int64)}
+
+def actualizar_kolmogorov_smirnov(estado, bloque):
+    """Agrega un bloque de números al estado."""
+    bloque = np.asarray(bloque)
+    if bloque.dtype == np.uint16:
+        k = bloque
+    else:
+        k = np.clip(np.rint(np.asarray(bloque, dtype=np.float64) * 10000), 0, CASILLAS - 1).astype(np.intp)
+    estado["n"] += len(bloque)
+    estado["conteo"] += np.bincount(k, minlength=CASILLAS)
+    return estado
+
+def combinar_kolmogorov_smirnov(estado, otro):
+    """Combina dos estados calculados sobre partes distintas de la secuencia."""
+    return {"n": estado["n"] + otro["n"], "conteo": estado["conteo"] + otro["conteo"]}
+
+def prueba_kolmogorov_smirnov(numeros_aleatorios, alpha=0.05, verbose=True):
+    """
+    Realiza la prueba de Kolmogorov-Smirnov para determinar si un conjunto de números aleatorios
+    sigue una distribución uniforme.
+
+    Parámetros:
+    numeros_aleatorios (list): Lista de números aleatorios entre 0 y 1.
+    alpha (float): Nivel de significancia. Por defecto es 0.05.
+
+    Retorna:
+    bool: True si se acepta la hipótesis nula (distribución uniforme), False en caso contrario.
+    """
+    estado = actualizar_kolmogorov_smirnov(nuevo_estado_kolmogorov_smirnov(), numeros_aleatorios)
+    return finalizar_kolmogorov_smirnov(estado, alpha, verbose)
+
+def distancia_kolmogorov_smirnov(estado):
+    """
+    Estadístico D = max(D+, D-) a partir del conteo de cada valor.
+
+    En x = k / 10^4 la empírica salta de F(k-1) a F(k) (acumulados / n), y la uniforme vale x, así que
+    D+ = max(F(k) - x) y D- = max(x - F(k-1)).
+    """
+    acumulada = np.cumsum(estado["conteo"]) / estado["n"]
+    x = np.arange(CASILLAS) / 10000.0
+    d_mas = np.max(acumulada - x)
+    d_menos = np.max(x - np.concatenate(([0.0], acumulada[:-1])))
+    return float(max(d_mas, d_menos))
+
+def estadistico_kolmogorov_smirnov(estado):
+    """
+    Estadístico D de Kolmogorov-Smirnov y su p-valor (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad (None) y p_valor.
+    """
+    d = distancia_kolmogorov_smirnov(estado)
+    return {"estadistico": d, "grados_libertad": None, "p_valor": ks_sf(d, estado["n"])}
+
+def finalizar_kolmogorov_smirnov(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba de Kolmogorov-Smirnov a partir del estado acumulado (ver prueba_kolmogorov_smirnov).
+    """
+    n = estado["n"]
+    if n == 0:
+        if verbose:
+            print("ERROR: Número insuficiente de datos para realizar la prueba.")
+        return False
+    d = distancia_kolmogorov_smirnov(estado)
+    d_critico = ks_ppf(1 - alpha, n)
+    if verbose:
+        print("\n=== PRUEBA DE KOLMOGOROV-SMIRNOV ===")
+        print("Hipótesis nula: Los números aleatorios siguen una distribución uniforme en [0, 1].")
+        print("Hipótesis alternativa: Los números aleatorios no siguen una distribución uniforme en [0, 1].")
+        print(f"Números analizados: {n}")
+        print(f"Estadístico D: {d:.6f}")
+        print(f"Valor crítico (alpha={alpha}): {d_critico:.6f}")
+        print(f"P-valor: {ks_sf(d, n):.6f}")
+
+    resultado = d <= d_critico
+    if verbose:
+        if resultado:
+            print(f"\nCONCLUSIÓN PRUEBA DE KOLMOGOROV-SMIRNOV: La secuencia pasa la prueba y puede considerarse uniforme (nivel de confianza {(1-alpha)*100}%).")
+        else:
+            print(f"\nCONCLUSIÓN PRUEBA DE KOLMOGOROV-SMIRNOV: La secuencia no pasa la prueba. La distribución empírica se aleja de la uniforme (nivel de confianza {(1-alpha)*100}%).")
+        print("=== FIN DE LA PRUEBA DE KOLMOGOROV-SMIRNOV ===")
+    return resultado
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    try:
+        # Cargar los números aleatorios desde el archivo CSV
+        with open('numeros_aleatorios_metodo_mixto.csv', 'r') as f:
+            numeros_aleatorios = [float(line.strip()) for line in f]
+
+        # Realizar la prueba de Kolmogorov-Smirnov
+        resultado = prueba_kolmogorov_smirnov(numeros_aleatorios)
+
+    except FileNotFoundError:
+        print("Error: No se encontró el archivo 'numeros_aleatorios_metodo_mixto.csv'.")
+        print("Primero genera los números aleatorios con el script generador.")
+    except Exception as e:
+        print(f"Error al ejecutar la prueba: {str(e)}")
@@ -0,0 +1,154 @@
+# Prueba estadística para números aleatorios
+# Descripción: Este script implementa la "Prueba Serial" para verificar la independencia de una secuencia de
+# números aleatorios: agrupa los números en pares no superpuestos (x1, x2), (x3, x4), ..., divide el cuadrado
+# [0, 1) x [0, 1) en d x d celdas y aplica una prueba chi-cuadrado con d^2 - 1 grados de libertad sobre la
+# cantidad de pares que cae en cada celda. Si la cantidad de números es impar, el último queda sin par.
+
+import numpy as np
+try:
+    from pruebas_estadisticas.valores_criticos import chi2_ppf, chi2_cdf
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from valores_criticos import chi2_ppf, chi2_cdf
+
+# --- Versión por bloques ---
+# Qué números forman un par depende de la posición global de cada bloque en la secuencia, que no se conoce
+# al procesarlo. Por eso cada bloque cuenta los pares que empiezan en posición par y los que empiezan en
+# posición impar (relativas al bloque); al combinar se elige cuál corresponde según la cantidad de números
+# anteriores y se agrega el par que cruza el borde entre los bloques.
+
+def nuevo_estado_serial(num_intervalos=5):
+    """
+    Estado vacío de la prueba serial: cantidad de números, frecuencias de los pares que empiezan en posición
+    par e impar (2 x d^2) y celdas del primer y último número.
+    """
+    return {"n": 0, "num_intervalos": num_intervalos,
+            "frecuencias": np.zeros((2, num_intervalos * num_intervalos), dtype=np.int64),
+            "primera_celda": None, "ultima_celda": None}
+
+def _celdas(bloque, num_intervalos):
+    bloque = np.asarray(bloque)
+    if bloque.dtype == np.uint16:
+        bloque = bloque / 10000.0
+    return np.clip((np.asarray(bloque, dtype=np.float64) * num_intervalos).astype(np.int64), 0, num_intervalos - 1)
+
+def _estado_de_bloque(estado, bloque):
+    num_intervalos = estado["num_intervalos"]
+    parcial = nuevo_estado_serial(num_intervalos)
+    celdas = _celdas(bloque, num_intervalos)
+    if len(celdas) == 0:
+        return parcial
+    # Celda del par (x_j, x_{j+1}) en el cuadrado de d x d
+    pares = celdas[:-1] * num_intervalos + celdas[1:]
+    for paridad in (0, 1):
+        parcial["frecuencias"][paridad] = np.bincount(pares[paridad::2], minlength=num_intervalos * num_intervalos)
+    parcial.update(n=len(celdas), primera_celda=int(celdas[0]), ultima_celda=int(celdas[-1]))
+    return parcial
+
+def combinar_serial(estado, otro):
+    """Combina dos estados calculados sobre partes consecutivas de la secuencia (`otro` va después)."""
+    if estado["n"] == 0:
+        return dict(otro, frecuencias=otro["frecuencias"].copy())
+    if otro["n"] == 0:
+        return dict(estado, frecuencias=estado["frecuencias"].copy())
+    num_intervalos = estado["num_intervalos"]
+    frecuencias = estado["frecuencias"].copy()
+    # La posición j de `otro` es la estado["n"] + j de la secuencia combinada
+    if estado["n"] % 2 == 0:
+        frecuencias += otro["frecuencias"]
+    else:
+        frecuencias += otro["frecuencias"][::-1]
+    # Par que cruza el borde: empieza en la posición estado["n"] - 1
+    frecuencias[(estado["n"] - 1) % 2, estado["ultima_celda"] * num_intervalos + otro["primera_celda"]] += 1
+    return {"n": estado["n"] + otro["n"], "num_intervalos": num_intervalos, "frecuencias": frecuencias,
+            "primera_celda": estado["primera_celda"], "ultima_celda": otro["ultima_celda"]}
+
+def actualizar_serial(estado, bloque):
+    """Agrega al estado el bloque de números que sigue en la secuencia."""
+    estado.update(combinar_serial(estado, _estado_de_bloque(estado, bloque)))
+    return estado
+
+def prueba_serial(numeros_aleatorios, num_intervalos=5, alpha=0.05, verbose=True):
+    """
+    Realiza la prueba serial de pares para determinar si un conjunto de números aleatorios es independiente.
+
+    Parámetros:
+    numeros_aleatorios (list): Lista de números aleatorios entre 0 y 1.
+    num_intervalos (int): Intervalos por dimensión (d); el cuadrado se divide en d x d celdas. Por defecto es 5.
+    alpha (float): Nivel de significancia. Por defecto es 0.05.
+
+    Retorna:
+    bool: True si se acepta la hipótesis nula (los números son independientes), False en caso contrario.
+    """
+    estado = actualizar_serial(nuevo_estado_serial(num_intervalos), numeros_aleatorios)
+    return finalizar_serial(estado, alpha, verbose)
+
+def estadistico_serial(estado):
+    """
+    Estadístico chi-cuadrado de la prueba serial y su p-valor (para los informes).
+
+    Retorna:
+    dict: estadistico, grados_libertad y p_valor.
+    """
+    # Los pares no superpuestos son los que empiezan en las posiciones pares de la secuencia
+    frecuencias = estado["frecuencias"][0]
+    esperada = frecuencias.sum() / len(frecuencias)
+    chi_cuadrado = float(np.sum((frecuencias - esperada) ** 2 / esperada))
+    df = len(frecuencias) - 1
+    return {"estadistico": chi_cuadrado, "grados_libertad": df, "p_valor": 1 - chi2_cdf(chi_cuadrado, df)}
+
+def finalizar_serial(estado, alpha=0.05, verbose=True):
+    """
+    Decide la prueba serial a partir del estado acumulado (ver prueba_serial).
+    """
+    frecuencias = estado["frecuencias"][0]
+    celdas = len(frecuencias)
+    pares = int(frecuencias.sum())
+    if pares < 5 * celdas:
+        if verbose:
+            print(f"ADVERTENCIA: Se recomienda tener al menos {5 * celdas} pares para {celdas} celdas.")
+        if pares < celdas:
+            if verbose:
+                print("ERROR: Número insuficiente de datos para realizar la prueba.")
+            return False
+
+    esperada = pares / celdas
+    chi_cuadrado = np.sum((frecuencias - esperada) ** 2 / esperada)
+    df = celdas - 1
+    chi_cuadrado_critico = chi2_ppf(1 - alpha, df)
+    if verbose:
+        p_valor = 1 - chi2_cdf(chi_cuadrado, df)
+        print("\n=== PRUEBA SERIAL ===")
+        print("Hipótesis nula: Los pares de números consecutivos son independientes y uniformes en el cuadrado unitario.")
+        print("Hipótesis alternativa: Los pares de números consecutivos no son independientes.")
+        print(f"Pares analizados: {pares} en {celdas} celdas")
+        print(f"Frecuencia esperada por celda: {esperada:.2f}")
+        print(f"Frecuencias observadas (mínima / máxima): {frecuencias.min()} / {frecuencias.max()}")
+        print(f"Estadístico Chi-Cuadrado: {chi_cuadrado:.4f}")
+        print(f"Grados de libertad: {df}")
+        print(f"Valor crítico (alpha={alpha}): {chi_cuadrado_critico:.4f}")
+        print(f"P-valor: {p_valor:.6f}")
+
+    resultado = chi_cuadrado <= chi_cuadrado_critico
+    if verbose:
+        if resultado:
+            print(f"\nCONCLUSIÓN PRUEBA SERIAL: La secuencia pasa la prueba serial y puede considerarse independiente (nivel de confianza {(1-alpha)*100}%).")
+        else:
+            print(f"\nCONCLUSIÓN PRUEBA SERIAL: La secuencia no pasa la prueba serial. Los pares consecutivos no se reparten de manera uniforme (nivel de confianza {(1-alpha)*100}%).")
+        print("=== FIN DE LA PRUEBA SERIAL ===")
+    return bool(resultado)
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    try:
+        # Cargar los números aleatorios desde el archivo CSV
+        with open('numeros_aleatorios_metodo_mixto.csv', 'r') as f:
+            numeros_aleatorios = [float(line.strip()) for line in f]
+
+        # Realizar la prueba serial
+        resultado = prueba_serial(numeros_aleatorios)
+
+    except FileNotFoundError:
+        print("Error: No se encontró el archivo 'numeros_aleatorios_metodo_mixto.csv'.")
+        print("Primero genera los números aleatorios con el script generador.")
+    except Exception as e:
+        print(f"Error al ejecutar la prueba: {str(e)}")
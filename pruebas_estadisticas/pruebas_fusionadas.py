@@ -0,0 +1,257 @@
+# Pruebas estadísticas fusionadas
+# Descripción: Calcula en una sola pasada sobre los datos los estadísticos suficientes de las cuatro pruebas
+# (suma, media y suma de cuadrados centrados, frecuencias por intervalo y conteo de patrones de poker)
+# y toma las cuatro decisiones a partir de ellos, en lugar de recorrer los números una vez por prueba.
+#
+# Los estados que devuelve son los mismos de la versión por bloques de cada prueba, así que se pueden
+# combinar con combinar_medias, combinar_varianza, etc. y decidir con finalizar_*.
+#
+# Las pruebas extendidas (corridas, huecos, serial y Kolmogorov-Smirnov) se piden por nombre con `pruebas`;
+# sus estados se actualizan en la misma pasada, sobre el mismo bloque.
+
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+try:
+    from pruebas_estadisticas.prueba_de_medias import finalizar_medias, combinar_medias, estadistico_medias
+    from pruebas_estadisticas.prueba_de_varianza import finalizar_varianza, combinar_varianza, estadistico_varianza
+    from pruebas_estadisticas.prueba_de_uniformidad_chi_cuadrada import (finalizar_chi_cuadrada, combinar_chi_cuadrada,
+                                                                         estadistico_chi_cuadrada)
+    from pruebas_estadisticas.prueba_de_independencia_poker import (PATRONES, finalizar_poker, combinar_poker, estadistico_poker,
+                                                                    tabla_patrones_cuantizados, conteo_patrones_poker)
+    from pruebas_estadisticas.prueba_de_corridas import (nuevo_estado_corridas, actualizar_corridas, combinar_corridas,
+                                                         finalizar_corridas, estadistico_corridas)
+    from pruebas_estadisticas.prueba_de_huecos import (nuevo_estado_huecos, actualizar_huecos, combinar_huecos,
+                                                       finalizar_huecos, estadistico_huecos)
+    from pruebas_estadisticas.prueba_serial import (nuevo_estado_serial, actualizar_serial, combinar_serial,
+                                                    finalizar_serial, estadistico_serial)
+    from pruebas_estadisticas.prueba_kolmogorov_smirnov import (nuevo_estado_kolmogorov_smirnov, actualizar_kolmogorov_smirnov,
+                                                                combinar_kolmogorov_smirnov, finalizar_kolmogorov_smirnov,
+                                                                estadistico_kolmogorov_smirnov)
+except ImportError:  # ejecutado como script desde la carpeta pruebas_estadisticas
+    from prueba_de_medias import finalizar_medias, combinar_medias, estadistico_medias
+    from prueba_de_varianza import finalizar_varianza, combinar_varianza, estadistico_varianza
+    from prueba_de_uniformidad_chi_cuadrada import finalizar_chi_cuadrada, combinar_chi_cuadrada, estadistico_chi_cuadrada
+    from prueba_de_independencia_poker import (PATRONES, finalizar_poker, combinar_poker, estadistico_poker,
+                                               tabla_patrones_cuantizados, conteo_patrones_poker)
+    from prueba_de_corridas import (nuevo_estado_corridas, actualizar_corridas, combinar_corridas, finalizar_corridas,
+                                    estadistico_corridas)
+    from prueba_de_huecos import nuevo_estado_huecos, actualizar_huecos, combinar_huecos, finalizar_huecos, estadistico_huecos
+    from prueba_serial import nuevo_estado_serial, actualizar_serial, combinar_serial, finalizar_serial, estadistico_serial
+    from prueba_kolmogorov_smirnov import (nuevo_estado_kolmogorov_smirnov, actualizar_kolmogorov_smirnov,
+                                           combinar_kolmogorov_smirnov, finalizar_kolmogorov_smirnov,
+                                           estadistico_kolmogorov_smirnov)
+
+# Nombres de las pruebas, en el orden en que se informan
+PRUEBAS = ("medias", "varianza", "uniformidad", "independencia")
+
+# Pruebas que se agregan a pedido (ver prueba_de_corridas.py, prueba_de_huecos.py, prueba_serial.py
+# y prueba_kolmogorov_smirnov.py)
+PRUEBAS_EXTENDIDAS = ("corridas", "huecos", "serial", "kolmogorov_smirnov")
+TODAS_LAS_PRUEBAS = PRUEBAS + PRUEBAS_EXTENDIDAS
+
+# Funciones de la versión por bloques de cada prueba. Las cuatro básicas se actualizan juntas en el núcleo
+# fusionado; las extendidas, cada una con su función actualizar sobre el mismo bloque.
+COMBINAR = {
+    "medias": combinar_medias,
+    "varianza": combinar_varianza,
+    "uniformidad": combinar_chi_cuadrada,
+    "independencia": combinar_poker,
+    "corridas": combinar_corridas,
+    "huecos": combinar_huecos,
+    "serial": combinar_serial,
+    "kolmogorov_smirnov": combinar_kolmogorov_smirnov
+}
+FINALIZAR = {
+    "medias": finalizar_medias,
+    "varianza": finalizar_varianza,
+    "uniformidad": finalizar_chi_cuadrada,
+    "independencia": finalizar_poker,
+    "corridas": finalizar_corridas,
+    "huecos": finalizar_huecos,
+    "serial": finalizar_serial,
+    "kolmogorov_smirnov": finalizar_kolmogorov_smirnov
+}
+ESTADISTICO = {
+    "medias": estadistico_medias,
+    "varianza": estadistico_varianza,
+    "uniformidad": estadistico_chi_cuadrada,
+    "independencia": estadistico_poker,
+    "corridas": estadistico_corridas,
+    "huecos": estadistico_huecos,
+    "serial": estadistico_serial,
+    "kolmogorov_smirnov": estadistico_kolmogorov_smirnov
+}
+_EXTENDIDAS = {
+    "corridas": (nuevo_estado_corridas, actualizar_corridas),
+    "huecos": (nuevo_estado_huecos, actualizar_huecos),
+    "serial": (nuevo_estado_serial, actualizar_serial),
+    "kolmogorov_smirnov": (nuevo_estado_kolmogorov_smirnov, actualizar_kolmogorov_smirnov)
+}
+
+def validar_pruebas(pruebas):
+    """Devuelve los nombres de `pruebas` como tupla, o ValueError si alguno no existe."""
+    desconocidas = [prueba for prueba in pruebas if prueba not in TODAS_LAS_PRUEBAS]
+    if desconocidas:
+        raise ValueError(f"Pruebas desconocidas: {', '.join(desconocidas)}. Opciones: {', '.join(TODAS_LAS_PRUEBAS)}")
+    return tuple(pruebas)
+
+# Cantidad a partir de la cual conviene contar primero cada valor cuantizado (bincount de 10001 casillas)
+MINIMO_HISTOGRAMA = 20_000
+
+# Bloque para los floats que no están cuantizados (la pasada se hace por bloques que entran en caché)
+TAMANO_BLOQUE = 65_536
+
+@lru_cache(maxsize=None)
+def tabla_intervalos_cuantizados(num_intervalos=10):
+    """
+    Tabla k -> intervalo de la prueba chi-cuadrada para los números cuantizados k / 10^4.
+    Usa los mismos bordes que np.histogram (np.linspace(0, 1, num_intervalos + 1)), así que por ejemplo
+    0.3 cae en el intervalo [0.2, 0.3) porque el borde calculado es 0.30000000000000004.
+    """
+    bordes = np.linspace(0, 1, num_intervalos + 1)
+    intervalos = np.searchsorted(bordes, np.arange(10001) / 10000.0, side="right") - 1
+    # np.histogram incluye el borde derecho en el último intervalo
+    return np.minimum(intervalos, num_intervalos - 1).astype(np.intp)
+
+def _cuantizados_exactos(numeros):
+    """
+    Devuelve los números como enteros k (k / 10^4 == número) si todos lo son exactamente, o None.
+    """
+    if isinstance(numeros, np.ndarray) and numeros.dtype == np.uint16:
+        return numeros
+    flotantes = np.asarray(numeros, dtype=np.float64)
+    k = np.rint(flotantes * 10000)
+    if len(k) and (k.min() < 0 or k.max() > 10000):
+        return None
+    # -0.0 se escribe distinto que 0.0 (importa para los dígitos de poker)
+    if not np.array_equal(k / 10000.0, flotantes) or np.signbit(flotantes).any():
+        return None
+    return k.astype(np.uint16)
+
+def _estados_desde_conteos(n, suma_k, suma_k2, intervalos, patrones, tamano_grupo):
+    """Arma los estados de las cuatro pruebas a partir de sumas enteras exactas de k."""
+    # Con enteros de Python las sumas son exactas: solo se redondea al dividir
+    media = suma_k / (n * 10000) if n else 0.0
+    m2 = (n * suma_k2 - suma_k * suma_k) / (n * 10000 ** 2) if n else 0.0
+    return {
+        "medias": {"n": n, "suma": suma_k / 10000},
+        "varianza": {"n": n, "media": media, "m2": m2},
+        "uniformidad": {"n": n, "frecuencias": intervalos.astype(np.int64)},
+        "independencia": {"n": n, "tamano_grupo": tamano_grupo,
+                          "conteo": Counter({patron: int(c) for patron, c in zip(PATRONES, patrones) if c})}
+    }
+
+def _estados_extendidos(bloque, extendidas):
+    """Estados de las pruebas extendidas pedidas, calculados sobre un bloque."""
+    estados = {}
+    for prueba in extendidas:
+        nuevo, actualizar = _EXTENDIDAS[prueba]
+        estados[prueba] = actualizar(nuevo(), bloque)
+    return estados
+
+def _estados_cuantizados(k, num_intervalos, tamano_grupo, extendidas=()):
+    n = len(k)
+    tabla_intervalos = tabla_intervalos_cuantizados(num_intervalos)
+    tabla_patrones = tabla_patrones_cuantizados(tamano_grupo)
+    conteo = None
+    if n >= MINIMO_HISTOGRAMA:
+        # Una sola pasada sobre los datos: cuántas veces aparece cada k; el resto se calcula sobre 10001 casillas
+        conteo = np.bincount(k, minlength=10001).astype(np.int64)
+        valores = np.arange(10001, dtype=np.int64)
+        suma_k = int(conteo @ valores)
+        suma_k2 = int(conteo @ (valores * valores))
+        intervalos = np.bincount(tabla_intervalos, weights=conteo, minlength=num_intervalos)
+        patrones = np.bincount(tabla_patrones, weights=conteo, minlength=len(PATRONES))
+    else:
+        k64 = k.astype(np.int64)
+        suma_k = int(k64.sum())
+        suma_k2 = int((k64 * k64).sum())
+        intervalos = np.bincount(tabla_intervalos[k], minlength=num_intervalos)
+        patrones = np.bincount(tabla_patrones[k], minlength=len(PATRONES))
+    estados = _estados_desde_conteos(n, suma_k, suma_k2, intervalos, patrones, tamano_grupo)
+    if conteo is not None and "kolmogorov_smirnov" in extendidas:
+        # La distribución empírica de Kolmogorov-Smirnov es el mismo conteo de cada k
+        estados["kolmogorov_smirnov"] = {"n": n, "conteo": conteo}
+        extendidas = tuple(prueba for prueba in extendidas if prueba != "kolmogorov_smirnov")
+    estados.update(_estados_extendidos(k, extendidas))
+    return estados
+
+def _estados_flotantes(flotantes, num_intervalos, tamano_grupo, extendidas=()):
+    estados = None
+    for inicio in range(0, max(len(flotantes), 1), TAMANO_BLOQUE):
+        bloque = flotantes[inicio:inicio + TAMANO_BLOQUE]
+        n = len(bloque)
+        media = float(bloque.mean()) if n else 0.0
+        desvios = bloque - media
+        parcial = {
+            "medias": {"n": n, "suma": float(np.sum(bloque))},
+            "varianza": {"n": n, "media": media, "m2": float(np.sum(desvios * desvios))},
+            "uniformidad": {"n": n, "frecuencias": np.histogram(bloque, bins=num_intervalos, range=(0, 1))[0]},
+            "independencia": {"n": n, "tamano_grupo": tamano_grupo, "conteo": conteo_patrones_poker(bloque, tamano_grupo)}
+        }
+        parcial.update(_estados_extendidos(bloque, extendidas))
+        estados = parcial if estados is None else combinar_estados(estados, parcial)
+    return estados
+
+def estadisticos_suficientes(numeros, num_intervalos=10, tamano_grupo=5, pruebas=PRUEBAS):
+    """
+    Calcula los estados de las cuatro pruebas en una sola pasada.
+
+    Si los números son cuantizados (array uint16) o floats que son exactamente k / 10^4 (la salida del
+    generador), todo sale de un conteo de los k con sumas enteras exactas. Si no, se recorre el array
+    por bloques y cada bloque actualiza los cuatro estados mientras está en caché.
+
+    Parámetros:
+    numeros (list | np.ndarray): Números entre 0 y 1, o cuantizados (uint16).
+    num_intervalos (int): Intervalos de la prueba chi-cuadrada.
+    tamano_grupo (int): Dígitos de la prueba de poker.
+    pruebas (tuple): Pruebas a calcular (ver TODAS_LAS_PRUEBAS). Los estados de las cuatro básicas
+      se calculan siempre (son los que dan las estadísticas básicas); las extendidas, solo si se piden.
+
+    Retorna:
+    dict: prueba -> estado (ver nuevo_estado_medias, nuevo_estado_varianza, etc.)
+    """
+    extendidas = tuple(prueba for prueba in validar_pruebas(pruebas) if prueba in PRUEBAS_EXTENDIDAS)
+    k = _cuantizados_exactos(numeros)
+    if k is not None:
+        return _estados_cuantizados(k, num_intervalos, tamano_grupo, extendidas)
+    return _estados_flotantes(np.asarray(numeros, dtype=np.float64), num_intervalos, tamano_grupo, extendidas)
+
+def combinar_estados(estados, otros):
+    """
+    Combina los estados de dos partes distintas de la secuencia. Las pruebas de corridas, huecos y serial
+    dependen del orden: `otros` tiene que ser la parte que sigue a `estados`.
+    """
+    return {prueba: COMBINAR[prueba](estados[prueba], otros[prueba]) for prueba in TODAS_LAS_PRUEBAS if prueba in estados}
+
+def decidir_pruebas(estados, alpha=0.05, verbose=False, pruebas=PRUEBAS):
+    """
+    Toma las decisiones de las pruebas pedidas a partir de los estados.
+
+    Retorna:
+    dict: prueba -> bool
+    """
+    return {prueba: FINALIZAR[prueba](estados[prueba], alpha, verbose) for prueba in pruebas}
+
+def detalle_pruebas(estados, alpha=0.05, pruebas=PRUEBAS):
+    """
+    Decisión, estadístico y p-valor de cada prueba, para los informes legibles por máquina.
+    Los p-valores necesitan scipy (ver valores_criticos.py); las decisiones no.
+
+    Retorna:
+    dict: prueba -> {"aprobada", "estadistico", "grados_libertad", "p_valor"}
+    """
+    decisiones = decidir_pruebas(estados, alpha, pruebas=pruebas)
+    return {prueba: dict(aprobada=bool(decisiones[prueba]), **ESTADISTICO[prueba](estados[prueba])) for prueba in pruebas}
+
+def pruebas_fusionadas(numeros, alpha=0.05, num_intervalos=10, tamano_grupo=5, pruebas=PRUEBAS):
+    """
+    Ejecuta las pruebas pedidas (por defecto las cuatro básicas) con una sola pasada sobre los datos.
+
+    Retorna:
+    dict: prueba -> bool (True si se acepta la hipótesis nula)
+    """
+    estados = estadisticos_suficientes(numeros, num_intervalos, tamano_grupo, pruebas)
+    return decidir_pruebas(estados, alpha, pruebas=pruebas)
@@ -0,0 +1,111 @@
+# Valores críticos de las distribuciones usadas por las pruebas estadísticas
+# Descripción: Los casos más comunes (alpha = 0.05 y pocos grados de libertad) salen de una tabla
+# precalculada, así el núcleo de la simulación se puede importar sin scipy. El resto de los casos y
+# los p-valores se calculan con scipy, que se importa recién la primera vez que hace falta.
+
+import math
+from functools import lru_cache
+
+# Cuantiles de la normal estándar
+_TABLA_NORMAL = {
+    0.95: 1.6448536269514722,
+    0.975: 1.959963984540054,
+    0.995: 2.5758293035489004,
+}
+
+# Cuantiles de chi-cuadrado para 1 a 40 grados de libertad (posición i -> df = i + 1)
+_TABLA_CHI2 = {
+    0.025: (
+        0.0009820691171752555, 0.05063561596857975, 0.21579528262389785, 0.4844185570879299,
+        0.8312116134866625, 1.2373442457912027, 1.689869180677355, 2.1797307472526497,
+        2.7003894999803584, 3.2469727802368413, 3.8157482522360993, 4.4037885069817015,
+        5.00875051181033, 5.628726103039731, 6.262137795043253, 6.907664353497003,
+        7.564186449577567, 8.230746194756668, 8.906516481987971, 9.590777392264867,
+        10.282897782522863, 10.98232073447368, 11.688551922452438, 12.401150217444435,
+        13.11972002493778, 13.843904982007603, 14.573382730821713, 15.30786055260119,
+        16.04707169536489, 16.79077226556663, 17.5387385814755, 18.290764907283048,
+        19.04666150317511, 19.806252939214588, 20.56937663074499, 21.335881560799056,
+        22.105627161169515, 22.87848232873346, 23.65432455759302, 24.433039170807888,
+    ),
+    0.95: (
+        3.841458820694124, 5.991464547107979, 7.814727903251179, 9.487729036781154,
+        11.070497693516351, 12.591587243743977, 14.067140449340169, 15.50731305586545,
+        16.918977604620448, 18.307038053275146, 19.67513757268249, 21.02606981748307,
+        22.362032494826934, 23.684791304840576, 24.995790139728616, 26.29622760486423,
+        27.58711163827534, 28.869299430392623, 30.14352720564616, 31.410432844230918,
+        32.670573340917315, 33.92443847144381, 35.17246162690806, 36.41502850180731,
+        37.65248413348277, 38.885138659830055, 40.113272069413625, 41.33713815142739,
+        42.55696780429269, 43.77297182574219, 44.98534328036513, 46.19425952027847,
+        47.39988391908093, 48.602367367294164, 49.80184956820181, 50.99846016571065,
+        52.192319730102895, 53.383540622969356, 54.572227758941736, 55.75847927888702,
+    ),
+    0.975: (
+        5.023886187314888, 7.377758908227871, 9.348403604496148, 11.143286781877796,
+        12.832501994030027, 14.44937533544792, 16.012764274629326, 17.534546139484647,
+        19.02276779864163, 20.483177350807388, 21.9200492610212, 23.33666415864534,
+        24.735604884931547, 26.11894804503737, 27.488392863442975, 28.845350723404753,
+        30.19100912163982, 31.526378440386626, 32.85232686172969, 34.16960690283833,
+        35.478875905727264, 36.78071208403556, 38.0756272503558, 39.36407702660391,
+        40.6464691202752, 41.92317009635392, 43.19451096615604, 44.460791836317746,
+        45.72228580417452, 46.97924224367115, 48.23188959445197, 49.48043774297169,
+        50.72508006628123, 51.96599519512188, 53.20334854205644, 54.437293631813226,
+        55.6679732642611, 56.895520535055965, 58.12005973468633, 59.34170714317118,
+    ),
+}
+
+def _clave(q):
+    # 1 - alpha/2 puede no dar exactamente 0.975 (por ejemplo con alpha = 1 - 0.95)
+    return round(q, 12)
+
+def _stats():
+    from scipy import stats
+    return stats
+
+@lru_cache(maxsize=None)
+def normal_ppf(q):
+    """
+    Cuantil q de la normal estándar.
+    """
+    valor = _TABLA_NORMAL.get(_clave(q))
+    if valor is None:
+        valor = float(_stats().norm.ppf(q))
+    return valor
+
+@lru_cache(maxsize=None)
+def chi2_ppf(q, df):
+    """
+    Cuantil q de la distribución chi-cuadrado con df grados de libertad.
+    """
+    tabla = _TABLA_CHI2.get(_clave(q))
+    if tabla is not None and 1 <= df <= len(tabla):
+        return tabla[df - 1]
+    return float(_stats().chi2.ppf(q, df))
+
+@lru_cache(maxsize=None)
+def t_ppf(q, df):
+    """
+    Cuantil q de la distribución t de Student con df grados de libertad.
+    """
+    return float(_stats().t.ppf(q, df))
+
+def chi2_cdf(x, df):
+    """
+    Función de distribución acumulada de chi-cuadrado (para los p-valores).
+    """
+    return float(_stats().chi2.cdf(x, df))
+
+@lru_cache(maxsize=None)
+def ks_ppf(q, n):
+    """
+    Cuantil q del estadístico D de Kolmogorov-Smirnov para n observaciones.
+    Para n > 35 se usa la aproximación asintótica sqrt(-ln((1 - q) / 2) / 2) / sqrt(n), que no necesita scipy.
+    """
+    if n > 35:
+        return math.sqrt(-math.log((1 - q) / 2) / 2) / math.sqrt(n)
+    return float(_stats().kstwo.ppf(q, n))
+
+def ks_sf(d, n):
+    """
+    P(D >= d) del estadístico de Kolmogorov-Smirnov con n observaciones (para los p-valores).
+    """
+    return float(_stats().kstwo.sf(d, n))
@@ -0,0 +1,45 @@
+# Archivo: registro_politicas.py
+# Descripción: Registro de las políticas de producción que puede ejecutar campania.py.
+
+import itertools
+
+# nombre -> {"simular": función vectorizada, "parametros": espacio de parámetros, "descripcion": str,
+#           "precios": precios propios de la política o None}
+POLITICAS = {}
+
+def registrar_politica(nombre, espacio_parametros, descripcion="", precios=None):
+    """
+    Decorador para registrar la función de simulación vectorizada de una política.
+
+    La función registrada recibe (demandas, es_finde, combinaciones, tamano_lote=None):
+      - demandas (np.ndarray int64 (R, D)): matriz de demanda compartida.
+      - es_finde (np.ndarray bool (D,)): máscara de días de fin de semana.
+      - combinaciones (list[dict]): valores de parámetros a evaluar (P combinaciones).
+      - tamano_lote (int): si se pasa, los conteos van por lotes de días consecutivos (ver
+        simulador.recurrencia_sobrantes); lo usa la corrida larga de corrida_larga.py.
+    y devuelve la tupla (vendidas, desperdiciadas, perdidas) de np.ndarray (R, P) (o (R, P, L) por lotes)
+    con las unidades de cada réplica y combinación (ver simulador.CONTEOS). El resultado neto se calcula
+    después con los precios.
+
+    Args:
+        nombre (str): Nombre con el que se elige la política desde la línea de comandos.
+        espacio_parametros (dict): parámetro -> lista de valores. La grilla es el producto cartesiano.
+        descripcion (str): Texto corto para la ayuda de la línea de comandos.
+        precios (dict): Valorización propia de la política (claves de simulador.PRECIOS). None usa PRECIOS.
+    """
+    def decorador(funcion):
+        POLITICAS[nombre] = {
+            "simular": funcion,
+            "parametros": espacio_parametros,
+            "descripcion": descripcion,
+            "precios": precios
+        }
+        return funcion
+    return decorador
+
+def combinaciones_parametros(espacio_parametros):
+    """
+    Devuelve la lista de combinaciones (dicts) del producto cartesiano del espacio de parámetros.
+    """
+    nombres = list(espacio_parametros)
+    return [dict(zip(nombres, valores)) for valores in itertools.product(*espacio_parametros.values())]
@@ -5,59 +5,148 @@ import numpy as np
 import math
 from datetime import datetime, date, timedelta
 import random
+from pruebas_estadisticas.valores_criticos import t_ppf
 # --- 0. DEFINICION DE CONSTANTES ---
 #venta perdida
 COSTO_VP = 10
 #sobrante
 COSTO_SB = 7
 BENEFICIO = 10
-
+# Demanda de cada tipo de día: floor(r * amplitud) + minimo, con r el número aleatorio del día
+AMPLITUD_ENTRESEMANA, MINIMO_ENTRESEMANA = 77, 4
+AMPLITUD_FIN_DE_SEMANA, MINIMO_FIN_DE_SEMANA = 90, 18
+# Fecha en la que arrancan todas las simulaciones (un domingo)
+FECHA_INICIO = date(2025, 7, 6)
 
 
 # --- 1. IMPORTAR TUS MÓDULOS (Sin cambios) ---
-from nros_aleatorios.generador_congruencial_mixto import generador_nros_aleatorios
-from pruebas_estadisticas.prueba_de_medias import prueba_de_medias
-from pruebas_estadisticas.prueba_de_varianza import prueba_de_varianza
-from pruebas_estadisticas.prueba_de_uniformidad_chi_cuadrada import prueba_chi_cuadrada
-from pruebas_estadisticas.prueba_de_independencia_poker import prueba_poker
+from nros_aleatorios.generador_congruencial_np import flotantes_desde_cuantizados
+from nros_aleatorios.motores import MOTOR_POR_DEFECTO, nueva_semilla, generar_cuantizados, validar_motor
+from pruebas_estadisticas.pruebas_fusionadas import pruebas_fusionadas, PRUEBAS
+from instrumentacion import cronometro, contar, sumar_tiempo
 
 # --- 2. FUNCIÓN DE PRUEBAS COMPLETAS  ---
-def ejecutar_pruebas_completas(numeros, alpha=0.05):
-    pasa_medias = prueba_de_medias(numeros, alpha, verbose=False)
-    pasa_varianza = prueba_de_varianza(numeros, alpha, verbose=False)
-    pasa_uniformidad = prueba_chi_cuadrada(numeros, num_intervalos=10, alpha=alpha, verbose=False)
-    pasa_independencia = prueba_poker(numeros, tamano_grupo=5, alpha=alpha, verbose=False)
-    return pasa_medias and pasa_varianza and pasa_uniformidad and pasa_independencia
+def resultados_pruebas(numeros, alpha=0.05, pruebas=PRUEBAS):
+    """
+    Ejecuta las pruebas y devuelve el resultado de cada una: {nombre: bool}.
+    `numeros` puede ser una lista de floats o un array uint16 de números cuantizados.
+    Por defecto son las cuatro básicas; `pruebas` puede incluir también las extendidas
+    (ver TODAS_LAS_PRUEBAS). Los estadísticos se calculan en una sola pasada (ver pruebas_fusionadas.py).
+    """
+    with cronometro("pruebas/fusionadas"):
+        return pruebas_fusionadas(numeros, alpha, num_intervalos=10, tamano_grupo=5, pruebas=pruebas)
+
+def ejecutar_pruebas_completas(numeros, alpha=0.05, pruebas=PRUEBAS):
+    return all(resultados_pruebas(numeros, alpha, pruebas).values())
 
 # --- 3. GENERADOR MAESTRO AUTOMATIZADO  ---
-def generar_numeros_aprobados(cantidad, alpha=0.05,verbose=False):
-    #intentos = 0
+def alpha_por_prueba(alpha, cantidad_pruebas=len(PRUEBAS), ajuste=None):
+    """
+    Nivel de significancia que se usa en cada prueba.
+
+    Sin ajuste cada prueba usa alpha, así que un conjunto bueno se rechaza con probabilidad
+    1 - (1 - alpha)^k (≈ 18.5% con 4 pruebas y alpha = 0.05). Con ajuste="sidak" cada prueba usa
+    1 - (1 - alpha)^(1/k) y la probabilidad de rechazar un conjunto bueno vuelve a ser alpha.
+    """
+    if ajuste is None:
+        return alpha
+    if ajuste == "sidak":
+        return 1 - (1 - alpha) ** (1 / cantidad_pruebas)
+    raise ValueError(f"Ajuste de alpha desconocido: {ajuste}")
+
+def nuevas_estadisticas_aceptacion():
+    """Acumulador de intentos y rechazos para generar_numeros_aprobados."""
+    return {"intentos": 0, "aprobados": 0, "rechazos": {nombre: 0 for nombre in PRUEBAS}}
+
+def resumen_aceptacion(estadisticas, alpha=0.05, ajuste=None):
+    """
+    Resume las estadísticas de aceptación: intentos por conjunto aprobado, tasa de aceptación
+    y tasa de rechazo de cada prueba, comparadas con lo esperado si las pruebas fueran independientes.
+    Una prueba cuya tasa de rechazo supera claramente a su alpha está mal calibrada para ese n
+    (por ejemplo poker con n = 30).
+    """
+    intentos = estadisticas["intentos"]
+    aprobados = estadisticas["aprobados"]
+    alpha_prueba = alpha_por_prueba(alpha, len(estadisticas["rechazos"]), ajuste)
+    tasa_rechazo = {nombre: cantidad / intentos if intentos else 0.0
+                    for nombre, cantidad in estadisticas["rechazos"].items()}
+    # Tolerancia de 3 errores estándar de una binomial(intentos, alpha_prueba)
+    limite = alpha_prueba + 3 * math.sqrt(alpha_prueba * (1 - alpha_prueba) / intentos) if intentos else 1.0
+    return {
+        "intentos": intentos,
+        "aprobados": aprobados,
+        "intentos_por_aprobado": intentos / aprobados if aprobados else float("inf"),
+        "tasa_aceptacion": aprobados / intentos if intentos else 0.0,
+        "tasa_aceptacion_esperada": (1 - alpha_prueba) ** len(estadisticas["rechazos"]),
+        "alpha_por_prueba": alpha_prueba,
+        "tasa_rechazo": tasa_rechazo,
+        "pruebas_descalibradas": [nombre for nombre, tasa in tasa_rechazo.items() if tasa > limite]
+    }
+
+def generar_numeros_aprobados(cantidad, alpha=0.05,verbose=False, rng=None, estadisticas=None, ajuste_alpha=None,
+                              cuantizados=False, motor=MOTOR_POR_DEFECTO):
+    """
+    Genera conjuntos de `cantidad` números con semillas al azar hasta que uno pasa las cuatro pruebas.
+
+    Args:
+        cantidad (int): Cantidad de números del conjunto.
+        alpha (float): Nivel de significancia (ver alpha_por_prueba).
+        verbose (bool): Muestra el número de intento.
+        rng (random.Random): Generador para las semillas. Por defecto, el módulo random.
+        estadisticas (dict): Si se pasa (ver nuevas_estadisticas_aceptacion), acumula intentos y rechazos por prueba.
+        ajuste_alpha (str): None o "sidak" (ver alpha_por_prueba).
+        cuantizados (bool): Si es True devuelve los 4 dígitos como np.ndarray uint16 (k = número * 10^4).
+        motor (str): Generador del stream (ver nros_aleatorios/motores.py). Por defecto, el congruencial de referencia.
+
+    Returns:
+        list: Números aprobados (np.ndarray uint16 si cuantizados es True).
+    """
+    # rng permite usar un random.Random propio (por ejemplo, con semilla fija por proceso)
+    rng = rng or random
+    validar_motor(motor)
+    alpha_prueba = alpha_por_prueba(alpha, len(PRUEBAS), ajuste_alpha)
+    intentos = 0
     while True:
-        #intentos += 1
-        #if verbose:
-            #print(f"\rIntento #{intentos}: Generando y probando un nuevo conjunto de {cantidad} números...", end="")
-        semilla_dinamica = random.randint(10000, 99999)
-        a, c, m = 16807, 0, 2**31 - 1
-        numeros_candidatos = generador_nros_aleatorios(semilla_dinamica, a, c, m, cantidad)
-        if ejecutar_pruebas_completas(numeros_candidatos, alpha):
-            #if verbose:
-                #print(f"\n¡Éxito! Se encontró un conjunto aprobado en el intento #{intentos}.")
-            return numeros_candidatos
+        intentos += 1
+        if verbose:
+            print(f"\rIntento #{intentos}: Generando y probando un nuevo conjunto de {cantidad} números...", end="")
+        semilla_dinamica = nueva_semilla(motor, rng)
+        with cronometro("aprobados/generador"):
+            # Con el motor congruencial, mismos números que la versión de referencia (ver generador_congruencial_np.py)
+            numeros_candidatos = generar_cuantizados(motor, semilla_dinamica, cantidad)
+        resultados = resultados_pruebas(numeros_candidatos, alpha_prueba)
+        contar("aprobados/intentos")
+        if estadisticas is not None:
+            estadisticas["intentos"] += 1
+        for nombre, pasa in resultados.items():
+            if not pasa:
+                contar(f"rechazos/{nombre}")
+                if estadisticas is not None:
+                    estadisticas["rechazos"][nombre] += 1
+        if all(resultados.values()):
+            if verbose:
+                print(f"\n¡Éxito! Se encontró un conjunto aprobado en el intento #{intentos}.")
+            contar("aprobados/conjuntos")
+            if estadisticas is not None:
+                estadisticas["aprobados"] += 1
+            if cuantizados:
+                return numeros_candidatos
+            return flotantes_desde_cuantizados(numeros_candidatos).tolist()
 
 # --- 4. NUEVAS FUNCIONES DE GENERACIÓN DE DEMANDA ---
 
-def generar_demanda_entresemana(random_num):
+def generar_demanda_entresemana(random_num, amplitud=AMPLITUD_ENTRESEMANA, minimo=MINIMO_ENTRESEMANA):
     """
     Genera la demanda para un día de semana (Lunes a Jueves).
     """
-    demanda = math.floor(random_num*77)+4
+    demanda = math.floor(random_num*amplitud)+minimo
     return demanda
 
-def generar_demanda_fin_de_semana(random_num):
+def generar_demanda_fin_de_semana(random_num, amplitud=AMPLITUD_FIN_DE_SEMANA, minimo=MINIMO_FIN_DE_SEMANA):
     """
     Genera la demanda para un día de fin de semana (Viernes a Domingo).
     """
-    demanda = math.floor(random_num*90)+18
+    demanda = math.floor(random_num*amplitud)+minimo
     return demanda
 
 # --- 5. NUEVA FUNCIÓN 'gen_var_value' ---
@@ -87,18 +176,18 @@ def gen_var_value(num_aleatorio, fecha_actual):
 
 
 # --- 6. FUNCIÓN PRINCIPAL DE LA SIMULACIÓN (ACTUALIZADA) ---
-def genera_demanda_diaria(dias_a_simular):
+def genera_demanda_diaria(dias_a_simular, motor=MOTOR_POR_DEFECTO):
     """
     Punto de entrada principal. Pide fechas, calcula duración, genera números
-    y ejecuta la simulación día por día.
+    y ejecuta la simulación día por día. `motor` elige el generador (ver nros_aleatorios/motores.py).
     """
 
     # --- OBTENER FECHAS Y CALCULAR DURACIÓN ---
-    fecha_inicio = date(2025,7,6)
+    fecha_inicio = FECHA_INICIO
     # --- OBTENER NÚMEROS ALEATORIOS VALIDADOS ---
     nivel_confianza = 0.95
     alpha = 1 - nivel_confianza
-    numeros_aleatorios_validados = generar_numeros_aprobados(cantidad=dias_a_simular, alpha=alpha)
+    numeros_aleatorios_validados = generar_numeros_aprobados(cantidad=dias_a_simular, alpha=alpha, motor=motor)
     
     if not numeros_aleatorios_validados:
         print("No se pudo generar un conjunto de números aleatorios válidos. Abortando simulación.")
@@ -106,6 +195,7 @@ def genera_demanda_diaria(dias_a_simular):
 
     resultados_simulacion = []
     
+    inicio_cronograma = time.perf_counter()
     for i in range(dias_a_simular):
         # Obtenemos la fecha y el número aleatorio para esta iteración
         fecha_actual = fecha_inicio + timedelta(days=i)
@@ -124,11 +214,232 @@ def genera_demanda_diaria(dias_a_simular):
             "demanda": demanda_generada
         }
         resultados_simulacion.append(dia_info)
+    sumar_tiempo("demanda/cronograma", time.perf_counter() - inicio_cronograma)
     # Opcional: Mostrar un resumen final si lo deseas
     # print("\nResumen de resultados:")
     # for res in resultados_simulacion:
     #     print(res)
     return resultados_simulacion
 
+# --- 7. VERSIÓN VECTORIZADA: MATRIZ DE DEMANDA Y RECURRENCIA DE SOBRANTES ---
+def mascara_fin_de_semana(dias_a_simular, fecha_inicio=FECHA_INICIO):
+    """
+    Devuelve un array booleano (D,) con True en los días de fin de semana (V-S-D).
+    """
+    dias = np.arange(dias_a_simular)
+    return (fecha_inicio.weekday() + dias) % 7 >= 4
+
+MODOS_VALIDACION = ("por_replica", "reutilizar")
+
+# Demanda de cada número cuantizado k = 0..10000 (k / 10^4), con las fórmulas de generar_demanda_entresemana
+# y generar_demanda_fin_de_semana: la matriz de demanda se arma indexando estas tablas
+_VALORES_CUANTIZADOS = flotantes_desde_cuantizados(np.arange(10001))
+
+def tabla_demanda(amplitud, minimo):
+    """
+    Tabla de demanda floor(k / 10^4 * amplitud) + minimo para k = 0..10000.
+    Con arrays (S,) de amplitudes y mínimos devuelve una tabla por fila, (S, 10001).
+    """
+    amplitud = np.asarray(amplitud)[..., None]
+    minimo = np.asarray(minimo)[..., None]
+    return (np.floor(_VALORES_CUANTIZADOS * amplitud) + minimo).astype(np.int64)
+
+TABLA_DEMANDA_ENTRESEMANA = tabla_demanda(AMPLITUD_ENTRESEMANA, MINIMO_ENTRESEMANA)
+TABLA_DEMANDA_FIN_DE_SEMANA = tabla_demanda(AMPLITUD_FIN_DE_SEMANA, MINIMO_FIN_DE_SEMANA)
+
+def generar_matriz_uniformes(cant_replicas, dias_a_simular, alpha=0.05, rng=None, modo="por_replica",
+                             estadisticas=None, ajuste_alpha=None, cuantizados=False, motor=MOTOR_POR_DEFECTO):
+    """
+    Genera la matriz (R, D) de números aleatorios aprobados (float64, o uint16 si cuantizados es True).
+
+    Modos:
+      - "por_replica": cada fila es un conjunto de D números que pasó las pruebas (como genera_demanda_diaria).
+      - "reutilizar": se prueba una sola vez un stream de R * D números y se corta en R ventanas de D días.
+        Las pruebas se ejecutan una vez por bloque en lugar de una vez por réplica.
+    """
+    if modo == "por_replica":
+        filas = [generar_numeros_aprobados(dias_a_simular, alpha, rng=rng, estadisticas=estadisticas,
+                                           ajuste_alpha=ajuste_alpha, cuantizados=cuantizados, motor=motor)
+                 for _ in range(cant_replicas)]
+    elif modo == "reutilizar":
+        filas = generar_numeros_aprobados(cant_replicas * dias_a_simular, alpha, rng=rng, estadisticas=estadisticas,
+                                          ajuste_alpha=ajuste_alpha, cuantizados=cuantizados, motor=motor)
+    else:
+        raise ValueError(f"Modo de validación desconocido: {modo}. Opciones: {', '.join(MODOS_VALIDACION)}")
+    return np.array(filas, dtype=np.uint16 if cuantizados else np.float64).reshape(cant_replicas, dias_a_simular)
+
+def generar_matriz_demanda(cant_replicas, dias_a_simular, alpha=0.05, rng=None, modo="por_replica",
+                           estadisticas=None, ajuste_alpha=None, motor=MOTOR_POR_DEFECTO):
+    """
+    Genera la demanda de `cant_replicas` réplicas de `dias_a_simular` días en una sola matriz,
+    para que todas las políticas se evalúen sobre las mismas demandas.
+    Por defecto cada fila usa su propio conjunto de números aprobados, igual que genera_demanda_diaria.
+
+    Args:
+        cant_replicas (int): Cantidad de réplicas (filas).
+        dias_a_simular (int): Cantidad de días por réplica (columnas).
+        alpha (float): Nivel de significancia de las pruebas de los números aleatorios.
+        rng (random.Random): Generador para las semillas. Por defecto, el módulo random.
+        modo (str): "por_replica" o "reutilizar" (ver generar_matriz_uniformes).
+        estadisticas (dict): Acumulador de intentos y rechazos (ver nuevas_estadisticas_aceptacion).
+        ajuste_alpha (str): None o "sidak" (ver alpha_por_prueba).
+        motor (str): Generador del stream uniforme (ver nros_aleatorios/motores.py).
+
+    Returns:
+        tuple: (demandas (np.ndarray int64 (R, D)), es_finde (np.ndarray bool (D,)))
+    """
+    es_finde = mascara_fin_de_semana(dias_a_simular)
+    with cronometro("demanda/numeros_aprobados"):
+        cuantizados = generar_matriz_uniformes(cant_replicas, dias_a_simular, alpha, rng, modo, estadisticas,
+                                               ajuste_alpha, cuantizados=True, motor=motor)
+    with cronometro("demanda/matriz"):
+        demandas = np.where(es_finde, TABLA_DEMANDA_FIN_DE_SEMANA[cuantizados], TABLA_DEMANDA_ENTRESEMANA[cuantizados])
+    return demandas, es_finde
+
+def recurrencia_sobrantes(demandas, produccion, tamano_lote=None):
+    """
+    Aplica la recurrencia de sobrantes (vida útil de 2 días) a todas las réplicas a la vez.
+    Cada día se venden primero los sobrantes de ayer; lo que no se vende se desperdicia.
+    Después se vende la producción del día y lo que queda pasa a ser el sobrante de mañana.
+
+    Args:
+        demandas (np.ndarray): Demanda con los días en el último eje, por ejemplo (R, D) o (R, 1, D).
+        produccion (np.ndarray): Producción con los días en el último eje; debe ser compatible
+                                 (broadcasting) con demandas, por ejemplo (D,), (P, D) o (R, P, D).
+        tamano_lote (int): Si se pasa, los totales se devuelven por lotes de tamano_lote días consecutivos,
+                           con un eje más al final (L = D / tamano_lote lotes). D debe ser múltiplo.
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades totales por réplica/combinación (y lote).
+    """
+    forma = np.broadcast_shapes(np.shape(demandas)[:-1], np.shape(produccion)[:-1])
+    produccion = np.asarray(produccion)
+    tipo = np.result_type(demandas, produccion, np.int64)
+    # Se recorren los días en el primer eje para que cada rebanada sea contigua
+    demandas_por_dia = np.ascontiguousarray(np.moveaxis(demandas, -1, 0))
+    produccion_por_dia = np.ascontiguousarray(np.moveaxis(produccion, -1, 0))
+    if tamano_lote is not None:
+        return _recurrencia_por_lotes(demandas_por_dia, produccion_por_dia, forma, tipo, tamano_lote)
+
+    # Con s = sobrantes de ayer, p = producción y d = demanda, en el día se vende min(d, s + p) y
+    # sobra para mañana min(p, max(s + p - d, 0)). Los desperdicios y las ventas perdidas salen de los
+    # totales: perdidas = sum(d) - vendidas y desperdiciadas = sum(p) - vendidas - sobrantes del último día.
+    # Así el bucle hace 6 operaciones por día, todas sobre arrays ya reservados.
+    sobrantes = np.zeros(forma, dtype=tipo)
+    vendidas = np.zeros(forma, dtype=tipo)
+    disponible = np.empty(forma, dtype=tipo)
+    vendidas_de_hoy = np.empty(forma, dtype=tipo)
+    for demanda, produccion_de_hoy in zip(demandas_por_dia, produccion_por_dia):
+        np.add(sobrantes, produccion_de_hoy, out=disponible)
+        np.minimum(disponible, demanda, out=vendidas_de_hoy)
+        vendidas += vendidas_de_hoy
+        # Estado para mañana
+        disponible -= demanda
+        np.maximum(disponible, 0, out=disponible)
+        np.minimum(disponible, produccion_de_hoy, out=sobrantes)
+    perdidas = np.sum(demandas, axis=-1) - vendidas
+    desperdiciadas = np.sum(produccion, axis=-1) - vendidas - sobrantes
+    return vendidas, desperdiciadas, perdidas
+
+def cantidad_de_lotes(cant_dias, tamano_lote):
+    """Cantidad de lotes de tamano_lote días en cant_dias días (que debe ser múltiplo)."""
+    if tamano_lote <= 0 or cant_dias % tamano_lote:
+        raise ValueError(f"La cantidad de días ({cant_dias}) debe ser múltiplo del tamaño de lote ({tamano_lote})")
+    return cant_dias // tamano_lote
+
+def sumar_por_lotes(valores, tamano_lote):
+    """Suma el último eje (días) por lotes de tamano_lote días consecutivos: (..., D) -> (..., L)."""
+    cant_lotes = cantidad_de_lotes(valores.shape[-1], tamano_lote)
+    return valores.reshape(valores.shape[:-1] + (cant_lotes, tamano_lote)).sum(axis=-1)
+
+def _recurrencia_por_lotes(demandas_por_dia, produccion_por_dia, forma, tipo, tamano_lote):
+    """
+    recurrencia_sobrantes con los totales por lotes de días. Recibe los días en el primer eje.
+    Los desperdicios de cada lote son sobrantes al empezar + producción - vendidas - sobrantes al terminar,
+    así que sumando todos los lotes se obtienen los mismos totales que sin lotes.
+    """
+    cant_dias = max(len(demandas_por_dia), len(produccion_por_dia))
+    cant_lotes = cantidad_de_lotes(cant_dias, tamano_lote)
+    vendidas = np.zeros((cant_lotes,) + forma, dtype=tipo)
+    # sobrantes[l] = sobrantes al empezar el lote l (el último, los que quedan al final)
+    sobrantes = np.zeros((cant_lotes + 1,) + forma, dtype=tipo)
+    disponible = np.empty(forma, dtype=tipo)
+    vendidas_de_hoy = np.empty(forma, dtype=tipo)
+    sobrantes_de_hoy = np.zeros(forma, dtype=tipo)
+    for dia, (demanda, produccion_de_hoy) in enumerate(zip(demandas_por_dia, produccion_por_dia)):
+        np.add(sobrantes_de_hoy, produccion_de_hoy, out=disponible)
+        np.minimum(disponible, demanda, out=vendidas_de_hoy)
+        vendidas[dia // tamano_lote] += vendidas_de_hoy
+        disponible -= demanda
+        np.maximum(disponible, 0, out=disponible)
+        np.minimum(disponible, produccion_de_hoy, out=sobrantes_de_hoy)
+        if (dia + 1) % tamano_lote == 0:
+            sobrantes[(dia + 1) // tamano_lote] = sobrantes_de_hoy
+    # Totales por lote con los lotes en el primer eje, alineados (broadcasting) con vendidas
+    def por_lote(por_dia):
+        totales = por_dia.reshape((cant_lotes, tamano_lote) + por_dia.shape[1:]).sum(axis=1)
+        return totales.reshape((cant_lotes,) + (1,) * (len(forma) - totales.ndim + 1) + totales.shape[1:])
+    demanda_lotes = por_lote(demandas_por_dia)
+    produccion_lotes = por_lote(produccion_por_dia)
+    perdidas = demanda_lotes - vendidas
+    desperdiciadas = sobrantes[:-1] + produccion_lotes - vendidas - sobrantes[1:]
+    return tuple(np.moveaxis(conteo, 0, -1) for conteo in (vendidas, desperdiciadas, perdidas))
+
+def balance_sin_arrastre(demandas, produccion, tamano_lote=None):
+    """
+    Igual que recurrencia_sobrantes pero sin arrastrar sobrantes: todo lo que no se vende
+    en el día se desperdicia.
+
+    Returns:
+        tuple: (vendidas, desperdiciadas, perdidas), unidades totales por réplica/combinación
+               (y por lote si se pasa tamano_lote, ver recurrencia_sobrantes).
+    """
+    if tamano_lote is not None:
+        dias = np.broadcast_arrays(demandas, produccion)
+        return (sumar_por_lotes(np.minimum(*dias), tamano_lote),
+                sumar_por_lotes(np.maximum(dias[1] - dias[0], 0), tamano_lote),
+                sumar_por_lotes(np.maximum(dias[0] - dias[1], 0), tamano_lote))
+    vendidas = np.minimum(produccion, demandas).sum(axis=-1)
+    desperdiciadas = np.maximum(produccion - demandas, 0).sum(axis=-1)
+    perdidas = np.maximum(demandas - produccion, 0).sum(axis=-1)
+    return vendidas, desperdiciadas, perdidas
+
+def resultado_neto(vendidas, desperdiciadas, perdidas, beneficio=BENEFICIO, costo_sb=COSTO_SB, costo_vp=COSTO_VP):
+    """
+    Resultado neto (ganancia - costos) a partir de las unidades vendidas, desperdiciadas y perdidas.
+    """
+    return vendidas * beneficio - desperdiciadas * costo_sb - perdidas * costo_vp
+
+# Conteos de unidades que devuelven las políticas registradas, en este orden. El resultado neto es lineal
+# en ellos, así que con los conteos guardados se puede valorizar cualquier escenario de precios y costos.
+CONTEOS = ("vendidas", "desperdiciadas", "perdidas")
+
+# Precios de referencia, con los nombres de los argumentos de resultado_neto
+PRECIOS = {"beneficio": BENEFICIO, "costo_sb": COSTO_SB, "costo_vp": COSTO_VP}
+
+def intervalos_de_confianza(beneficios, alpha=0.05):
+    """
+    Calcula el intervalo de confianza t de la media para cada columna de `beneficios`.
+
+    Args:
+        beneficios (np.ndarray): Resultados netos con forma (R, P), una columna por combinación.
+        alpha (float): Nivel de significancia.
+
+    Returns:
+        dict: Arrays (P,) con 'beneficio_prom', 'stddev', 'delta', 'lower' y 'upper'.
+    """
+    cant_replicas = beneficios.shape[0]
+    beneficio_prom = beneficios.mean(axis=0)
+    stddev = beneficios.std(axis=0, ddof=1)
+    t_critical = t_ppf(1 - alpha / 2, cant_replicas - 1)
+    delta = t_critical * (stddev / math.sqrt(cant_replicas))
+    return {
+        "beneficio_prom": beneficio_prom,
+        "stddev": stddev,
+        "delta": delta,
+        "lower": beneficio_prom - delta,
+        "upper": beneficio_prom + delta
+    }
+
 if __name__ == "__main__":
     genera_demanda_diaria(50)